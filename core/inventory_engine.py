@@ -103,39 +103,23 @@ class InventoryEngine:
                 daily_pivot[col] = 0
         
         # 재고 계산 (위치별 누적)
-        stock_records = []
-        
-        for location in daily_pivot['Location'].unique():
-            if location in ['UNKNOWN', 'UNK', '']:
-                continue
-                
-            loc_data = daily_pivot[daily_pivot['Location'] == location].copy()
-            loc_data = loc_data.sort_values('Date')
-            
-            opening_stock = 0
-            
-            for _, row in loc_data.iterrows():
-                inbound = row.get('IN', 0)
-                transfer_out = row.get('TRANSFER_OUT', 0) 
-                final_out = row.get('FINAL_OUT', 0)
-                total_outbound = transfer_out + final_out
-                
-                closing_stock = opening_stock + inbound - total_outbound
-                
-                stock_records.append({
-                    'Location': location,
-                    'Date': row['Date'],
-                    'Opening_Stock': opening_stock,
-                    'Inbound': inbound,
-                    'Transfer_Out': transfer_out,
-                    'Final_Out': final_out,
-                    'Total_Outbound': total_outbound,
-                    'Closing_Stock': closing_stock
-                })
-                
-                opening_stock = closing_stock
-        
-        daily_stock_df = pd.DataFrame(stock_records)
+        # 행별 dict 목록 대신 컬럼 배열로 결과 구성 (피벗 결과는 (Location, Date) 순으로 정렬됨)
+        daily_pivot = daily_pivot[~daily_pivot['Location'].isin(['UNKNOWN', 'UNK', ''])]
+        
+        total_outbound = daily_pivot['TRANSFER_OUT'] + daily_pivot['FINAL_OUT']
+        net_change = daily_pivot['IN'] - total_outbound
+        closing_stock = net_change.groupby(daily_pivot['Location'], sort=False).cumsum()
+        
+        daily_stock_df = pd.DataFrame({
+            'Location': daily_pivot['Location'],
+            'Date': daily_pivot['Date'],
+            'Opening_Stock': closing_stock - net_change,
+            'Inbound': daily_pivot['IN'],
+            'Transfer_Out': daily_pivot['TRANSFER_OUT'],
+            'Final_Out': daily_pivot['FINAL_OUT'],
+            'Total_Outbound': total_outbound,
+            'Closing_Stock': closing_stock
+        }).reset_index(drop=True)
         
         return daily_stock_df
     
@@ -7,6 +7,7 @@ import pandas as pd
 import os
 import glob
 import re
+from importlib.util import find_spec
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import logging
@@ -14,6 +15,30 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# calamine 엔진 사용 가능 여부 (python-calamine 설치 + pandas >= 2.2)
+_HAS_CALAMINE = (find_spec("python_calamine") is not None
+                 and tuple(int(part) for part in pd.__version__.split(".")[:2]) >= (2, 2))
+
+def read_excel_fast(excel_path, **kwargs):
+    """
+    Excel 파일 로드 (calamine 엔진 우선, 미지원 시 기본 엔진)
+    
+    엔진 사용 가능 여부는 import 시점에 한 번 판단하므로, 잘못된 시트명이나 손상된 파일 등
+    읽기 오류는 기본 엔진으로 다시 읽지 않고 그대로 전달된다.
+    
+    Args:
+        excel_path: Excel 파일 경로
+        **kwargs: pd.read_excel 추가 인자
+        
+    Returns:
+        pd.DataFrame: 로드된 DataFrame
+    """
+    if _HAS_CALAMINE:
+        # Rust 기반 calamine 엔진
+        return pd.read_excel(excel_path, engine='calamine', **kwargs)
+    # calamine 미설치 또는 구버전 pandas → 기본(openpyxl) 엔진
+    return pd.read_excel(excel_path, **kwargs)
+
 class DataLoader:
     """HVDC 데이터 로딩 및 전처리 클래스 - 개선된 버전"""
     
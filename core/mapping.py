@@ -5,7 +5,7 @@ HVDC Warehouse Excel 전용 로더.
 * 역할
     1. HVDC‑ADOPT Warehouse 템플릿(Outdoor / Indoor) 시트를 자동 감지하여 `pandas.DataFrame` 으로 로드.
     2. 원본 컬럼명을 표준 필드명으로 매핑하고 타입을 변환한다.
-    3. 결측·N/A 문자열을 NaN → 0 으로 전처리.
+    3. 결측·N/A 문자열 처리: 날짜는 NaT, 텍스트는 '', 카테고리는 'unknown', 숫자는 0.
     4. 파싱된 DataFrame 은 후속 온톨로지 매핑 및 재고 계산 엔진에서 직접 사용된다.
 
 사용 예시::
@@ -19,17 +19,29 @@ Author: GPT‑Assistant (2025‑06‑24)
 from __future__ import annotations
 
 import datetime as _dt
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from importlib.util import find_spec
 from pathlib import Path
-from typing import List, Tuple, Union
+from types import MappingProxyType
+from typing import List, Optional, Tuple, Union
 
+import numpy as _np
 import pandas as _pd
 
+try:
+    from .loader import _HAS_CALAMINE
+except ImportError:  # 단독 스크립트 실행 (python core/mapping.py)
+    from loader import _HAS_CALAMINE
+
 # ----------------------------------------------------------------------------
 # 내부 상수 및 컬럼 매핑
 # ----------------------------------------------------------------------------
 
 # 원본 컬럼명 → 표준 필드명(dict key = lower‑stripped 원본)
-_COL_MAP = {
+# (모듈 상수는 읽기 전용: 매핑은 MappingProxyType, 필드 목록은 tuple)
+_COL_MAP = MappingProxyType({
     "operation month": "operation_month",
     "shipment no": "shipment_no",
     "category": "category",
@@ -57,10 +69,13 @@ _COL_MAP = {
     "crane": "crane_cost",
     "total": "total_cost",
     "billing month": "billing_month",
-}
+})
+
+# 필수 원본 컬럼 집합 (헤더 검증은 집합 차 한 번)
+_REQUIRED_COLS = frozenset(_COL_MAP)
 
-_DATE_COLS = ["operation_month", "start_date", "finish_date", "billing_month"]
-_FLOAT_COLS = [
+_DATE_COLS = ("operation_month", "start_date", "finish_date", "billing_month")
+_FLOAT_COLS = (
     "twenty_dc",
     "twenty_fr",
     "forty_dc",
@@ -82,9 +97,108 @@ _FLOAT_COLS = [
     "forklift_cost",
     "crane_cost",
     "total_cost",
-]
+)
+
+# downcast=True 시 축소 대상: 개수 필드 → int32 (정수값·범위 내일 때만), 계측값 → float32
+# (금액/비용 필드는 합계 정밀도를 위해 float64 유지)
+_INT_COLS = (
+    "twenty_dc",
+    "twenty_fr",
+    "forty_dc",
+    "forty_fr",
+    "container_count",
+    "cntr_q_in",
+    "cntr_q_out",
+    "pkgs",
+)
+_F32_COLS = ("weight_kg", "cbm", "handling_in_ft", "handling_out_ft", "sqm")
+_INT32_MAX = _np.iinfo(_np.int32).max
+
+# 문자열로 유지할 텍스트 필드 (나머지 숫자/날짜 필드는 엔진이 반환하는 네이티브 타입으로 로드)
+_TEXT_COLS = ("shipment_no", "category")
+
+_NA_VALUES = ("n/a", "na", "N/A", "NA", "-")
+
+# category 원본 값(소문자 + strip) → 표준값 (그 외 값과 결측은 "unknown")
+_CATEGORY_NORM = MappingProxyType({"indoor": "indoor", "indoor(m44)": "indoor", "outdoor": "outdoor"})
+
+# 고정 카테고리 dtype (모든 파일이 같은 dtype 을 공유 → load_hvdc_warehouse_dir concat 후에도 category 유지)
+_CATEGORY_DTYPE = _pd.CategoricalDtype(["indoor", "outdoor", "unknown"])
+_TRANSACTION_TYPE_DTYPE = _pd.CategoricalDtype(["IN", "OUT"])
+_CATEGORICAL_COLS = ("category", "transaction_type")
+
+# 파싱 결과 parquet 캐시 (pyarrow 필요). 키 = 파일 경로/수정시각/크기 + 로드 옵션 + 캐시 버전
+# (로더의 출력 형식이 바뀌면 _CACHE_VERSION 을 올려 이전 캐시를 무효화한다)
+_HAS_PYARROW = find_spec("pyarrow") is not None
+_CACHE_DIR = Path(os.environ.get("HVDC_CACHE_DIR", Path.home() / ".cache" / "hvdc"))
+_CACHE_VERSION = 6
+
+# 텍스트 필드 저장 dtype: pyarrow 설치 시 Arrow 문자열 (Python str 객체 대비 메모리 절반 이하, parquet 무복사)
+_TEXT_DTYPE = "string[pyarrow]" if _HAS_PYARROW else str
+
+# engine="auto" 기본 엔진: calamine 사용 가능 시(python-calamine 설치 + pandas >= 2.2)
+# xlsx/xlsm/xlsb/xls 모두 calamine 으로 로드 (판단 기준은 core.loader 와 공유)
+
+# 디렉터리 로드 대상 확장자 (대소문자 무시)
+_EXCEL_SUFFIXES = frozenset({".xls", ".xlsx", ".xlsm", ".xlsb"})
+
+# calamine 미사용 시 openpyxl 외 엔진이 필요한 확장자 (그 외 .xlsx/.xlsm 은 openpyxl)
+_ENGINE_BY_SUFFIX = MappingProxyType({".xls": "xlrd", ".xlsb": "pyxlsb"})
+
+# openpyxl 은 값만 스트리밍으로 읽는다 (셀 스타일/서식 객체 생성 생략).
+# 로더는 셀 값만 사용하므로 서식에 의존하는 시트는 지원 대상이 아니다.
+_OPENPYXL_KWARGS = MappingProxyType({"read_only": True, "data_only": True})
+
+# ----------------------------------------------------------------------------
+# 내부 헬퍼
+# ----------------------------------------------------------------------------
+
+def _resolve_engine(path: Path, engine: str) -> str:
+    """``engine="auto"`` 를 실제 사용할 엔진명으로 변환 (calamine 우선, 미지원 시 확장자별 엔진)."""
+    if engine == "auto":
+        return "calamine" if _HAS_CALAMINE else _ENGINE_BY_SUFFIX.get(path.suffix.lower(), "openpyxl")
+    return engine
 
-_NA_VALUES = ["n/a", "na", "N/A", "NA", "-"]
+
+def _read_sheet(path: Path, engine: str = "auto", **kwargs) -> _pd.DataFrame:
+    """지정 엔진으로 시트를 읽는다 (openpyxl 은 읽기 전용 모드).
+
+    ``engine="auto"`` 는 calamine 을 우선 사용하고, 미설치 시 확장자별 엔진으로 대체한다.
+    """
+    engine = _resolve_engine(path, engine)
+    if engine == "openpyxl":
+        kwargs["engine_kwargs"] = _OPENPYXL_KWARGS
+    return _pd.read_excel(path, engine=engine, **kwargs)
+
+
+def _cache_path(path: Path, st: os.stat_result, *options) -> Path:
+    """(경로, st_mtime_ns, st_size, 로드 옵션) 기준 캐시 파일 경로."""
+    key = f"{path.resolve()}:{st.st_mtime_ns}:{st.st_size}:{options}:{_CACHE_VERSION}"
+    return _CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.parquet"
+
+
+def _write_cache(df: _pd.DataFrame, cache_path: Path) -> None:
+    """파싱 결과를 parquet 로 저장 (실패 시 ``[WARN]`` 출력 후 캐시만 건너뜀).
+
+    임시 파일에 쓴 뒤 교체하므로 병렬 로드 중인 다른 프로세스가 쓰다 만 파일을 읽지 않는다.
+    """
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(tmp_path, compression="zstd")
+        os.replace(tmp_path, cache_path)
+    except (OSError, TypeError, ValueError) as exc:
+        print(f"[WARN] cache write skipped ({cache_path.name}): {exc}")
+        tmp_path.unlink(missing_ok=True)
+
+
+def _safe_load(fp: Path) -> Optional[_pd.DataFrame]:
+    """파일 1개 로드 – 실패 시 ``[WARN]`` 출력 후 None (디렉터리 로드용)."""
+    try:
+        return load_hvdc_warehouse_file(fp)
+    except Exception as exc:  # pylint: disable=broad-except
+        print(f"[WARN] {fp.name}: {exc}")
+        return None
 
 # ----------------------------------------------------------------------------
 # 공개 API
@@ -95,6 +209,10 @@ def load_hvdc_warehouse_file(  # noqa: D401
     *,
     sheet_name: Union[str, int, None] = 0,
     header: Union[int, List[int]] = 0,
+    engine: str = "auto",
+    as_date: bool = False,
+    use_cache: bool = True,
+    downcast: bool = True,
 ) -> _pd.DataFrame:
     """단일 Excel 파일을 로드해 표준화된 :class:`pandas.DataFrame` 을 반환한다.
 
@@ -106,6 +224,18 @@ def load_hvdc_warehouse_file(  # noqa: D401
         판다스 sheet 선택 파라미터. 기본 0.
     header: int | list[int]
         헤더 행 인덱스. 기본 0.
+    engine: str
+        판다스 Excel 엔진. 기본 ``"auto"`` (calamine 우선, 미설치 시 openpyxl/xlrd).
+        기존 동작이 필요하면 ``"openpyxl"`` 등으로 고정한다.
+    as_date: bool
+        True 이면 날짜 필드를 ``datetime.date`` 객체(object dtype)로 반환한다.
+        기본 False → ``datetime64[ns]`` 유지.
+    use_cache: bool
+        True 이면 파싱 결과를 ``~/.cache/hvdc`` (``HVDC_CACHE_DIR``) 에 parquet 로 캐시하고,
+        파일이 바뀌지 않았으면 Excel 파싱 대신 캐시를 읽는다 (pyarrow 필요).
+    downcast: bool
+        True 이면 개수 필드를 int32 (모든 값이 정수일 때), 계측 필드(중량/CBM/FT/SQM)를
+        float32 로 축소한다. 금액 필드는 항상 float64. 전체 float64 가 필요하면 False.
 
     Returns
     -------
@@ -113,48 +243,118 @@ def load_hvdc_warehouse_file(  # noqa: D401
         표준화 및 타입 변환 완료된 데이터프레임.
     """
     path = Path(path)
-    if not path.exists():
-        raise FileNotFoundError(f"Excel file not found: {path}")
+    # 존재 확인과 캐시 키를 stat 한 번으로 (네트워크 드라이브에서는 syscall 마다 지연)
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Excel file not found: {path}") from None
+
+    cache_path = None
+    if use_cache and _HAS_PYARROW:
+        # 키에는 "auto" 대신 실제 파싱 엔진을 넣어 엔진 설치 상태가 바뀌면 캐시도 분리
+        cache_path = _cache_path(path, st, sheet_name, header, _resolve_engine(path, engine), as_date, downcast)
+        if cache_path.exists():
+            try:
+                cached = _pd.read_parquet(cache_path)
+                # parquet 는 Arrow 문자열을 python 저장소 string 으로 복원하므로 텍스트 dtype 으로 되돌림
+                return cached.astype({col: _TEXT_DTYPE for col in cached.select_dtypes("string").columns})
+            except (OSError, ValueError):
+                pass  # 손상된 캐시는 무시하고 다시 파싱
+
+    # 헤더 행만 먼저 읽어 원본 컬럼명 → 표준 필드명을 확정 (본문 파싱 전에 필수 컬럼 검증)
+    raw_cols = _read_sheet(path, engine, sheet_name=sheet_name, header=header, nrows=0).columns
+    # 컬럼명 정규화 (소문자 + strip) – Index 문자열 연산으로 한 번에 (다중 헤더는 튜플 문자열)
+    norm_cols = raw_cols.to_flat_index().astype(str).str.strip().str.lower()
+    missing = _REQUIRED_COLS.difference(norm_cols)
+    if missing:
+        # 오류 메시지는 _COL_MAP 순서 유지
+        missing_cols: List[str] = [c for c in _COL_MAP if c in missing]
+        raise ValueError(f"Required columns not found in {path.name}: {missing_cols}")
 
-    df_raw = _pd.read_excel(
+    # 텍스트 필드만 문자열로 읽고, 숫자/날짜는 엔진의 네이티브 타입 그대로 받아
+    # 셀마다 문자열 객체를 만들었다가 다시 파싱하는 이중 변환을 피한다
+    df_raw = _read_sheet(
         path,
+        engine,
         sheet_name=sheet_name,
         header=header,
         na_values=_NA_VALUES,
-        dtype=str,  # 일단 문자열로 읽은 뒤 변환
+        dtype={raw: _TEXT_DTYPE for raw, norm in zip(raw_cols, norm_cols) if _COL_MAP.get(norm) in _TEXT_COLS},
     )
-
-    # 컬럼명 정규화 (소문자 + strip) 후 매핑
-    df_raw.columns = [str(c).strip().lower() for c in df_raw.columns]
-    missing_cols: List[str] = [c for c in _COL_MAP if c not in df_raw.columns]
-    if missing_cols:
-        raise ValueError(f"Required columns not found in {path.name}: {missing_cols}")
+    df_raw.columns = norm_cols
 
     df = df_raw.rename(columns=_COL_MAP)
 
-    # dtype 변환
-    for col in _DATE_COLS:
-        df[col] = _pd.to_datetime(df[col], errors="coerce").dt.date
-
-    for col in _FLOAT_COLS:
-        df[col] = _pd.to_numeric(df[col], errors="coerce").fillna(0)
-
-    # 카테고리 문자열 정규화
-    df["category"] = (
-        df["category"].str.strip().str.lower().replace({"indoor(m44)": "indoor", "outdoor": "outdoor"})
-    )
+    # dtype 변환 (필드 그룹별로 한 번에 변환·대입 → 날짜는 datetime64[ns], 숫자 필드는 단일 float64 블록)
+    date_cols, float_cols = list(_DATE_COLS), list(_FLOAT_COLS)
+    df[date_cols] = df[date_cols].apply(_pd.to_datetime, errors="coerce")
+    df[float_cols] = df[float_cols].apply(_pd.to_numeric, errors="coerce").fillna(0).astype("float64")
+
+    # 정밀도 손실이 없는 범위에서 숫자 필드 축소 (소수값이 있는 개수 필드는 float64 유지)
+    if downcast:
+        int_cols = list(_INT_COLS)
+        counts = df[int_cols].to_numpy()
+        exact = ((_np.trunc(counts) == counts) & (_np.abs(counts) <= _INT32_MAX)).all(axis=0)
+        int_cols = [col for col, ok in zip(int_cols, exact) if ok]
+        df[int_cols] = df[int_cols].astype("int32")
+        df[list(_F32_COLS)] = df[list(_F32_COLS)].astype("float32")
+
+    # 카테고리 문자열 정규화 – strip/lower/매핑은 고유값에만 적용하고 행 단위로는 코드 조회 한 번
+    codes, uniques = _pd.factorize(df["category"])
+    normalized = _pd.Index(uniques, dtype=object).str.strip().str.lower().map(_CATEGORY_NORM)
+    lookup = _CATEGORY_DTYPE.categories.get_indexer(normalized.fillna("unknown"))
+    # 결측(코드 -1)은 마지막 원소(unknown)를 가리키도록 추가
+    lookup = _np.append(lookup, _CATEGORY_DTYPE.categories.get_loc("unknown"))
+    df["category"] = _pd.Categorical.from_codes(lookup[codes], dtype=_CATEGORY_DTYPE)
 
     # 파생 컬럼: transaction_type (IN / OUT) 판별 – 컨테이너 수량 기준
-    df["transaction_type"] = _pd.np.where(df["cntr_q_in"] > 0, "IN", "OUT")
-
-    # 결측치 0 처리 후 반환
-    return df.fillna(0)
-
+    # (비교 마스크를 그대로 int8 코드로 사용: IN=0, OUT=1)
+    is_in = df["cntr_q_in"].to_numpy() > 0
+    df["transaction_type"] = _pd.Categorical.from_codes(
+        1 - is_in.view(_np.int8), dtype=_TRANSACTION_TYPE_DTYPE
+    )
 
-def load_hvdc_warehouse_dir(directory: Union[str, Path]) -> _pd.DataFrame:
+    # 잔여 결측 처리 – 숫자 필드는 변환 단계에서 이미 0, 날짜 NaT 와 범주형은 그대로 두고
+    # 나머지(텍스트/원본 그대로 전달되는 컬럼)만 컬럼별로 채움: 문자열은 "", 숫자는 0
+    for col in df.columns.difference(_FLOAT_COLS + _DATE_COLS + _CATEGORICAL_COLS, sort=False):
+        kind = df[col].dtype.kind
+        if kind in "Oiufc" and df[col].hasnans:
+            df[col] = df[col].fillna("" if kind == "O" else 0)
+
+    # 문자열/숫자가 섞인 원본 전달 컬럼(예: 비고)은 텍스트 dtype 으로 통일
+    # (Arrow/parquet 로 변환 가능 → 캐시 적중 여부와 무관하게 같은 결과)
+    mixed_cols = [
+        col for col in df.columns
+        if df[col].dtype == object and _pd.api.types.infer_dtype(df[col], skipna=True) in ("mixed", "mixed-integer")
+    ]
+    if mixed_cols:
+        df[mixed_cols] = df[mixed_cols].astype(str).astype(_TEXT_DTYPE)
+
+    # datetime.date 가 필요한 호출자용 변환은 마지막에 한 번만
+    if as_date:
+        df[date_cols] = df[date_cols].apply(lambda col: col.dt.date)
+
+    if cache_path is not None:
+        _write_cache(df, cache_path)
+    return df
+
+
+def load_hvdc_warehouse_dir(
+    directory: Union[str, Path],
+    *,
+    workers: int = 1,
+) -> _pd.DataFrame:
     """디렉터리 내 모든 Excel 파일을 로드 후 단일 DataFrame 으로 concat.
 
-    * 확장자: .xlsx, .xls
+    * 확장자: .xlsx, .xls, .xlsm, .xlsb
+
+    Parameters
+    ----------
+    directory: str | Path
+        대상 디렉터리.
+    workers: int
+        파일 파싱 프로세스 수. 기본 1 (순차 로드). 2 이상이고 파일이 여러 개일 때만
+        프로세스 풀에서 병렬 파싱한다 (예: ``workers=os.cpu_count()``).
 
     Returns
     -------
@@ -164,15 +364,23 @@ def load_hvdc_warehouse_dir(directory: Union[str, Path]) -> _pd.DataFrame:
     if not directory.is_dir():
         raise NotADirectoryError(directory)
 
-    frames: List[_pd.DataFrame] = []
-    for fp in directory.glob("*.xls*"):
-        try:
-            frames.append(load_hvdc_warehouse_file(fp))
-        except Exception as exc:  # pylint: disable=broad-except
-            print(f"[WARN] {fp.name}: {exc}")
+    # Office 잠금 파일(~$*.xlsx)은 열 수 없으므로 목록 단계에서 제외
+    files = [
+        fp for fp in directory.iterdir()
+        if fp.suffix.lower() in _EXCEL_SUFFIXES and not fp.name.startswith("~$")
+    ]
+    # 파일별 Excel 파싱은 서로 독립적인 CPU 작업이므로 프로세스 풀에서 병렬 처리 (결과는 파일 순서 유지)
+    if workers > 1 and len(files) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(files))) as pool:
+            loaded = list(pool.map(_safe_load, files))
+    else:
+        loaded = [_safe_load(fp) for fp in files]
+
+    frames: List[_pd.DataFrame] = [df for df in loaded if df is not None]
     if not frames:
         raise RuntimeError(f"No valid Excel files found in {directory}")
-    return _pd.concat(frames, ignore_index=True)
+    # 표준 필드 dtype 이 파일 간 동일하므로 (float64 / datetime64 / 고정 category) 블록 그대로 이어 붙임
+    return _pd.concat(frames, ignore_index=True, copy=False, sort=False)
 
 
 # ----------------------------------------------------------------------------
@@ -17,8 +17,14 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
+import logging
+import importlib.util
 import json
 
+from core.loader import read_excel_fast
+
+logger = logging.getLogger(__name__)
+
 # ===============================================================================
 # 1. 온톨로지 기준 완전 자동화 분류 딕셔너리
 # ===============================================================================
@@ -29,6 +35,10 @@ OUTDOOR_WAREHOUSE = ["DSV Outdoor", "DSV MZP", "MOSB"]
 SITE = ["AGI", "DAS", "MIR", "SHU"]
 DANGEROUS_CARGO = ["AAA Storage", "Dangerous Storage"]
 
+# pyarrow 기반 string dtype으로 변환할 문자열 컬럼
+STRING_COLUMNS = ['hasSite', 'hasCurrentStatus', 'TxType_Refined']
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
 def get_location_group(name):
     """
     온톨로지 기준 위치 그룹 분류 (100% 명시적 매칭)
@@ -79,7 +89,7 @@ def validate_location_data(df, location_column='hasSite'):
     Returns:
         dict: 검증 결과
     """
-    print("🔍 온톨로지 기준 위치 데이터 검증 중...")
+    logger.info("🔍 온톨로지 기준 위치 데이터 검증 중...")
     
     if location_column not in df.columns:
         return {"error": f"컬럼 '{location_column}'이 존재하지 않습니다."}
@@ -110,12 +120,11 @@ def validate_location_data(df, location_column='hasSite'):
         }
     }
     
-    print("✅ 위치 데이터 검증 완료")
-    print(f"📊 그룹별 분포: {result['group_distribution']}")
+    logger.info("✅ 위치 데이터 검증 완료")
+    logger.info("📊 그룹별 분포: %s", result['group_distribution'])
     
     if unknown_locations.any():
-        print(f"⚠️ 알려지지 않은 위치 {len(unknown_locations)}개 발견:")
-        print(unknown_locations.head())
+        logger.info("⚠️ 알려지지 않은 위치 %d개 발견:\n%s", len(unknown_locations), unknown_locations.head())
     
     return result
 
@@ -175,7 +184,7 @@ def classify_transaction_type_ontology(row):
 
 def create_ontology_warehouse_flow(df, location_column='hasSite'):
     """온톨로지 기준 창고별 월별 입고/출고/재고 흐름 분석"""
-    print("🔄 온톨로지 기준 창고별 월별 입출고 흐름 분석 시작...")
+    logger.info("🔄 온톨로지 기준 창고별 월별 입출고 흐름 분석 시작...")
     
     df_work = df.copy()
     
@@ -187,16 +196,19 @@ def create_ontology_warehouse_flow(df, location_column='hasSite'):
     warehouse_df = df_work[df_work['LocationGroup'].isin(warehouse_groups)].copy()
     
     if warehouse_df.empty:
-        print("⚠️ 창고 데이터가 없습니다.")
+        logger.info("⚠️ 창고 데이터가 없습니다.")
         return pd.DataFrame()
     
-    print(f"📊 창고 데이터 필터링 결과: {len(warehouse_df):,}개 레코드")
+    logger.info("📊 창고 데이터 필터링 결과: %d개 레코드", len(warehouse_df))
     
-    # 3. 월별 컬럼 생성
-    warehouse_df['Month'] = pd.to_datetime(warehouse_df['hasDate']).dt.to_period("M")
+    # 3. 월별 컬럼 생성 (로드 단계에서 이미 변환된 경우 재파싱 생략)
+    dates = warehouse_df['hasDate']
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, cache=True)
+    warehouse_df['Month'] = dates.dt.to_period("M")
     all_months = pd.period_range(warehouse_df['Month'].min(), warehouse_df['Month'].max(), freq='M')
     
-    print(f"📅 분석 기간: {all_months[0]} ~ {all_months[-1]} ({len(all_months)}개월)")
+    logger.info("📅 분석 기간: %s ~ %s (%d개월)", all_months[0], all_months[-1], len(all_months))
     
     # 4. 입고/출고 수량 분리 (모든 데이터를 입고로 가정)
     quantity_col = 'hasVolume_numeric' if 'hasVolume_numeric' in warehouse_df.columns else 'hasVolume'
@@ -247,13 +259,13 @@ def create_ontology_warehouse_flow(df, location_column='hasSite'):
     result = monthly_flow.reset_index()
     result.columns = ['위치명', '위치그룹', '월', '입고수량', '출고수량', '이동수량', '금액', '순증감', '누적재고']
     
-    print(f"✅ 온톨로지 기준 창고별 흐름 분석 완료: {len(warehouse_list)}개 창고, {len(all_months)}개월")
+    logger.info("✅ 온톨로지 기준 창고별 흐름 분석 완료: %d개 창고, %d개월", len(warehouse_list), len(all_months))
     
     return result
 
 def create_ontology_site_delivery(df, location_column='hasSite'):
     """온톨로지 기준 현장별 배송 현황 분석"""
-    print("🔄 온톨로지 기준 현장별 배송 현황 분석 시작...")
+    logger.info("🔄 온톨로지 기준 현장별 배송 현황 분석 시작...")
     
     df_work = df.copy()
     
@@ -264,13 +276,16 @@ def create_ontology_site_delivery(df, location_column='hasSite'):
     site_df = df_work[df_work['LocationGroup'] == 'Site'].copy()
     
     if site_df.empty:
-        print("⚠️ 현장 데이터가 없습니다.")
+        logger.info("⚠️ 현장 데이터가 없습니다.")
         return pd.DataFrame()
     
-    print(f"📊 현장 데이터 필터링 결과: {len(site_df):,}개 레코드")
+    logger.info("📊 현장 데이터 필터링 결과: %d개 레코드", len(site_df))
     
-    # 3. 월별 집계
-    site_df['Month'] = pd.to_datetime(site_df['hasDate']).dt.to_period("M")
+    # 3. 월별 집계 (로드 단계에서 이미 변환된 경우 재파싱 생략)
+    dates = site_df['hasDate']
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, cache=True)
+    site_df['Month'] = dates.dt.to_period("M")
     all_months = pd.period_range(site_df['Month'].min(), site_df['Month'].max(), freq='M')
     
     quantity_col = 'hasVolume_numeric' if 'hasVolume_numeric' in site_df.columns else 'hasVolume'
@@ -302,7 +317,7 @@ def create_ontology_site_delivery(df, location_column='hasSite'):
     result = site_delivery.reset_index()
     result.columns = ['현장명', '월', '배송수량', '배송횟수', '배송금액']
     
-    print(f"✅ 온톨로지 기준 현장별 배송 분석 완료: {len(site_list)}개 현장, {len(all_months)}개월")
+    logger.info("✅ 온톨로지 기준 현장별 배송 분석 완료: %d개 현장, %d개월", len(site_list), len(all_months))
     
     return result
 
@@ -310,70 +325,97 @@ def create_ontology_site_delivery(df, location_column='hasSite'):
 # 4. 온톨로지 기준 통합 리포트 생성
 # ===============================================================================
 
-def create_ontology_based_reports(df, location_column='hasSite', date_column='hasDate'):
+# 온톨로지 분류 결과 시트 (상수 그룹 정의에서만 파생되므로 모듈 로드 시 1회 생성)
+_ONTOLOGY_LOOKUP = pd.DataFrame([
+    {"분류": "Indoor Warehouse", "위치": ", ".join(INDOOR_WAREHOUSE)},
+    {"분류": "Outdoor Warehouse", "위치": ", ".join(OUTDOOR_WAREHOUSE)},
+    {"분류": "Site", "위치": ", ".join(SITE)},
+    {"분류": "Dangerous Cargo", "위치": ", ".join(DANGEROUS_CARGO)}
+])
+
+def _ontology_lookup_df():
+    """온톨로지 분류 결과 DataFrame 반환 (호출자 수정에 대비한 복사본)"""
+    return _ONTOLOGY_LOOKUP.copy()
+
+def iter_ontology_reports(df, location_column='hasSite', date_column='hasDate'):
     """
-    온톨로지 기준 통합 리포트 생성
+    온톨로지 기준 리포트를 하나씩 생성 (제너레이터)
+    
+    대용량 월별 리포트는 yield 후 바로 참조를 해제하므로
+    Excel 저장과 함께 사용하면 한 번에 하나의 대형 리포트만 메모리에 유지됩니다.
     
     Args:
         df: 원본 DataFrame
         location_column: 위치 컬럼명
         date_column: 날짜 컬럼명
         
-    Returns:
-        Dict[str, pd.DataFrame]: 리포트별 DataFrame 딕셔너리
+    Yields:
+        Tuple[str, pd.DataFrame]: (리포트명, DataFrame)
     """
-    print("🚀 온톨로지 기준 통합 리포트 생성 시작")
-    print("=" * 80)
+    # 데이터/위치 컬럼이 없으면 분류 결과 시트만 생성
+    if df.empty or location_column not in df.columns:
+        logger.info("⚠️ 분석할 위치 데이터가 없습니다. 온톨로지 분류 결과만 생성합니다.")
+        yield '온톨로지_분류결과', _ontology_lookup_df()
+        return
     
     # 1. 위치 데이터 검증
-    validation_result = validate_location_data(df, location_column)
+    validate_location_data(df, location_column)
     
-    reports = {}
+    summaries = []
     
-    # 2. 창고별 월별 입출고 흐름
+    # 2. 창고별 월별 입출고 흐름 + 요약 통계 (월별 집계 결과에서 바로 도출, 이미 정렬된 키이므로 sort=False)
     warehouse_flow = create_ontology_warehouse_flow(df, location_column)
     if not warehouse_flow.empty:
-        reports['창고별_월별_입출고재고'] = warehouse_flow
-    
-    # 3. 현장별 배송 현황
+        warehouse_summary = warehouse_flow.groupby(['위치명', '위치그룹'], sort=False, observed=True).agg(
+            총입고=('입고수량', 'sum'),
+            총출고=('출고수량', 'sum'),
+            총이동=('이동수량', 'sum'),
+            총금액=('금액', 'sum'),
+            현재재고=('누적재고', 'last')
+        ).round(2)
+        summaries.append(('창고별_요약통계', warehouse_summary.reset_index()))
+        yield '창고별_월별_입출고재고', warehouse_flow
+    del warehouse_flow
+    
+    # 3. 현장별 배송 현황 + 요약 통계
     site_delivery = create_ontology_site_delivery(df, location_column)
     if not site_delivery.empty:
-        reports['현장별_배송현황'] = site_delivery
+        site_summary = site_delivery.groupby('현장명', sort=False, observed=True).agg(
+            총배송수량=('배송수량', 'sum'),
+            총배송횟수=('배송횟수', 'sum'),
+            총배송금액=('배송금액', 'sum')
+        ).round(2)
+        summaries.append(('현장별_요약통계', site_summary.reset_index()))
+        yield '현장별_배송현황', site_delivery
+    del site_delivery
     
     # 4. 위치 그룹별 요약 통계
-    if not warehouse_flow.empty:
-        warehouse_summary = warehouse_flow.groupby(['위치명', '위치그룹']).agg({
-            '입고수량': 'sum',
-            '출고수량': 'sum',
-            '이동수량': 'sum',
-            '금액': 'sum',
-            '누적재고': 'last'
-        }).round(2)
-        warehouse_summary.columns = ['총입고', '총출고', '총이동', '총금액', '현재재고']
-        reports['창고별_요약통계'] = warehouse_summary.reset_index()
-    
-    if not site_delivery.empty:
-        site_summary = site_delivery.groupby('현장명').agg({
-            '배송수량': 'sum',
-            '배송횟수': 'sum',
-            '배송금액': 'sum'
-        }).round(2)
-        site_summary.columns = ['총배송수량', '총배송횟수', '총배송금액']
-        reports['현장별_요약통계'] = site_summary.reset_index()
+    yield from summaries
     
     # 5. 온톨로지 분류 결과
-    reports['온톨로지_분류결과'] = pd.DataFrame([
-        {"분류": "Indoor Warehouse", "위치": ", ".join(INDOOR_WAREHOUSE)},
-        {"분류": "Outdoor Warehouse", "위치": ", ".join(OUTDOOR_WAREHOUSE)},
-        {"분류": "Site", "위치": ", ".join(SITE)},
-        {"분류": "Dangerous Cargo", "위치": ", ".join(DANGEROUS_CARGO)}
-    ])
+    yield '온톨로지_분류결과', _ontology_lookup_df()
+
+def create_ontology_based_reports(df, location_column='hasSite', date_column='hasDate'):
+    """
+    온톨로지 기준 통합 리포트 생성
     
-    print("=" * 80)
-    print("🎉 온톨로지 기준 통합 리포트 생성 완료!")
-    print(f"📊 생성된 리포트: {len(reports)}개")
-    for report_name, report_df in reports.items():
-        print(f"   • {report_name}: {report_df.shape}")
+    Args:
+        df: 원본 DataFrame
+        location_column: 위치 컬럼명
+        date_column: 날짜 컬럼명
+        
+    Returns:
+        Dict[str, pd.DataFrame]: 리포트별 DataFrame 딕셔너리
+    """
+    logger.info("🚀 온톨로지 기준 통합 리포트 생성 시작")
+    
+    reports = dict(iter_ontology_reports(df, location_column, date_column))
+    
+    logger.info(
+        "🎉 온톨로지 기준 통합 리포트 생성 완료! 생성된 리포트: %d개\n%s",
+        len(reports),
+        "\n".join(f"   • {name}: {report_df.shape}" for name, report_df in reports.items())
+    )
     
     return reports
 
@@ -382,7 +424,7 @@ def save_ontology_reports_excel(reports, output_path=None):
     온톨로지 기준 리포트를 Excel 파일로 저장
     
     Args:
-        reports: 리포트 딕셔너리
+        reports: 리포트 딕셔너리 또는 (리포트명, DataFrame) 이터러블
         output_path: 출력 파일 경로
         
     Returns:
@@ -392,15 +434,16 @@ def save_ontology_reports_excel(reports, output_path=None):
         timestamp = datetime.now().strftime('%Y%m%d_%H%M')
         output_path = f"HVDC_온톨로지기준_창고흐름분석_{timestamp}.xlsx"
     
-    print(f"💾 온톨로지 기준 Excel 리포트 저장 중: {output_path}")
+    logger.info("💾 온톨로지 기준 Excel 리포트 저장 중: %s", output_path)
     
     with pd.ExcelWriter(output_path, engine="xlsxwriter") as writer:
         workbook = writer.book
         
-        # 각 리포트를 시트로 저장
-        for sheet_name, report_df in reports.items():
+        # 각 리포트를 시트로 저장 (이터러블이면 생성되는 대로 바로 기록)
+        report_items = reports.items() if isinstance(reports, dict) else reports
+        for sheet_name, report_df in report_items:
             # 시트명 길이 제한 (Excel 31자 제한)
-            safe_sheet_name = sheet_name[:31] if len(sheet_name) > 31 else sheet_name
+            safe_sheet_name = sheet_name[:31]
             
             report_df.to_excel(writer, sheet_name=safe_sheet_name, index=False)
             
@@ -418,15 +461,36 @@ def save_ontology_reports_excel(reports, output_path=None):
                             "max_color": "#63BE7B",
                         })
             except Exception as e:
-                print(f"⚠️ 조건부 서식 적용 실패 ({safe_sheet_name}): {e}")
+                logger.warning("⚠️ 조건부 서식 적용 실패 (%s): %s", safe_sheet_name, e)
     
-    print(f"✅ 온톨로지 기준 Excel 리포트 저장 완료: {output_path}")
+    logger.info("✅ 온톨로지 기준 Excel 리포트 저장 완료: %s", output_path)
     return output_path
 
 # ===============================================================================
 # 5. 메인 실행 함수
 # ===============================================================================
 
+def convert_string_columns(df, columns=None):
+    """
+    object 문자열 컬럼을 pyarrow 기반 string dtype으로 변환
+    (pyarrow 미설치 시 원본 유지)
+    
+    Args:
+        df: DataFrame
+        columns: 변환 대상 컬럼 (기본값: STRING_COLUMNS)
+        
+    Returns:
+        pd.DataFrame: 변환된 DataFrame
+    """
+    if not _HAS_PYARROW:
+        return df
+    
+    for col in columns or STRING_COLUMNS:
+        if col in df.columns and df[col].dtype == object:
+            df[col] = df[col].astype('string[pyarrow]')
+    
+    return df
+
 def run_ontology_based_analysis(excel_path=None, mapping_rules_path=None, location_column='hasSite', date_column='hasDate'):
     """
     온톨로지 기준 창고 흐름 분석 메인 실행 함수
@@ -438,10 +502,9 @@ def run_ontology_based_analysis(excel_path=None, mapping_rules_path=None, locati
         date_column: 날짜 컬럼명
         
     Returns:
-        Dict[str, pd.DataFrame]: 분석 결과 리포트
+        dict: 리포트별 (행, 열) 크기와 저장된 Excel 경로('_excel_path')
     """
-    print("🎯 온톨로지 기준 HVDC 창고 흐름 분석 시작")
-    print("=" * 80)
+    logger.info("🎯 온톨로지 기준 HVDC 창고 흐름 분석 시작")
     
     start_time = datetime.now()
     
@@ -450,14 +513,14 @@ def run_ontology_based_analysis(excel_path=None, mapping_rules_path=None, locati
         if excel_path is None:
             excel_path = "data/HVDC WAREHOUSE_HITACHI(HE).xlsx"
         
-        print(f"📂 데이터 로드 중: {excel_path}")
+        logger.info("📂 데이터 로드 중: %s", excel_path)
         
         if mapping_rules_path:
             # 매핑 규칙이 있는 경우
             with open(mapping_rules_path, encoding='utf-8') as f:
                 mapping_rules = json.load(f)['field_map']
             
-            df_raw = pd.read_excel(excel_path)
+            df_raw = read_excel_fast(excel_path)
             col_map = {k: v for k, v in mapping_rules.items() if k in df_raw.columns}
             df = df_raw.rename(columns=col_map)
             
@@ -467,7 +530,10 @@ def run_ontology_based_analysis(excel_path=None, mapping_rules_path=None, locati
                     df[needed] = 0
         else:
             # 매핑 규칙이 없는 경우 원본 그대로 사용
-            df = pd.read_excel(excel_path)
+            df = read_excel_fast(excel_path)
+        
+        # 문자열 컬럼 Arrow 변환 (str 연산을 Arrow 커널로 처리)
+        df = convert_string_columns(df)
         
         # 날짜 컬럼 처리
         if date_column not in df.columns:
@@ -479,6 +545,10 @@ def run_ontology_based_analysis(excel_path=None, mapping_rules_path=None, locati
             else:
                 df[date_column] = pd.Timestamp.now()
         
+        # 날짜는 로드 시 1회만 datetime으로 변환 (이후 분석 함수는 재파싱 생략)
+        if not pd.api.types.is_datetime64_any_dtype(df[date_column]):
+            df[date_column] = pd.to_datetime(df[date_column], errors='coerce', cache=True)
+        
         df[date_column] = df[date_column].fillna(pd.Timestamp.now())
         
         # 수치 컬럼 처리
@@ -487,39 +557,36 @@ def run_ontology_based_analysis(excel_path=None, mapping_rules_path=None, locati
             if col in df.columns:
                 df[f'{col}_numeric'] = pd.to_numeric(df[col], errors='coerce').fillna(0)
         
-        print(f"✅ 데이터 로드 완료: {df.shape[0]:,}개 레코드, {df.shape[1]}개 컬럼")
+        logger.info("✅ 데이터 로드 완료: %d개 레코드, %d개 컬럼", df.shape[0], df.shape[1])
         
-        # 2. 온톨로지 기준 분석 실행
-        reports = create_ontology_based_reports(df, location_column, date_column)
+        # 2~3. 온톨로지 기준 분석 + Excel 저장 (리포트를 생성하는 대로 시트에 기록)
+        reports = {}
         
-        # 3. Excel 저장
-        excel_output_path = save_ontology_reports_excel(reports)
+        def _stream_reports():
+            for report_name, report_df in iter_ontology_reports(df, location_column, date_column):
+                reports[report_name] = report_df.shape
+                yield report_name, report_df
+        
+        excel_output_path = save_ontology_reports_excel(_stream_reports())
         reports['_excel_path'] = excel_output_path
         
         # 4. 결과 요약
         end_time = datetime.now()
         processing_time = (end_time - start_time).total_seconds()
         
-        print("\n" + "=" * 80)
-        print("🎉 온톨로지 기준 HVDC 창고 흐름 분석 완료!")
-        print("=" * 80)
-        
-        print(f"📊 처리 결과:")
-        print(f"   • 원본 데이터: {df.shape[0]:,}개 레코드")
-        print(f"   • 처리 시간: {processing_time:.2f}초")
-        print(f"   • Excel 파일: {excel_output_path}")
+        logger.info("🎉 온톨로지 기준 HVDC 창고 흐름 분석 완료!")
+        logger.info("📊 처리 결과: 원본 데이터 %d개 레코드, 처리 시간 %.2f초, Excel 파일 %s",
+                    df.shape[0], processing_time, excel_output_path)
         
         if '창고별_요약통계' in reports:
-            print(f"   • 창고 개수: {len(reports['창고별_요약통계'])}개")
+            logger.info("   • 창고 개수: %d개", reports['창고별_요약통계'][0])
         if '현장별_요약통계' in reports:
-            print(f"   • 현장 개수: {len(reports['현장별_요약통계'])}개")
+            logger.info("   • 현장 개수: %d개", reports['현장별_요약통계'][0])
         
         return reports
         
     except Exception as e:
-        print(f"❌ 온톨로지 기준 분석 실행 중 오류 발생: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ 온톨로지 기준 분석 실행 중 오류 발생: %s", e)
         return {}
 
 # ===============================================================================
@@ -528,6 +595,7 @@ def run_ontology_based_analysis(excel_path=None, mapping_rules_path=None, locati
 
 if __name__ == "__main__":
     """직접 실행 시 테스트"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("🧪 온톨로지 기준 분류 시스템 테스트")
     print("=" * 80)
     
@@ -20,6 +20,9 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
+import logging
+
+logger = logging.getLogger(__name__)
 
 # ===============================================================================
 # 1. 창고명 정규화 및 분류 함수
@@ -179,17 +182,18 @@ def create_warehouse_monthly_flow(df: pd.DataFrame, all_months: pd.PeriodIndex)
     Returns:
         pd.DataFrame: 창고별 월별 입출고 집계 결과
     """
-    print("🔄 창고별 월별 입출고 흐름 분석 중...")
+    logger.info("🔄 창고별 월별 입출고 흐름 분석 중...")
+    
+    # 데이터/위치 컬럼이 없으면 분류·집계 없이 바로 더미 데이터 반환
+    if df.empty or 'hasSite' not in df.columns:
+        logger.info("⚠️ 창고 데이터가 없습니다. 더미 데이터를 생성합니다.")
+        return create_dummy_warehouse_flow(all_months)
     
     df_work = df.copy()
     
     # 1. 창고명 정규화
-    if 'hasSite' in df_work.columns:
-        df_work['Warehouse_Normalized'] = df_work['hasSite'].apply(normalize_warehouse_name)
-        df_work['Location_Type'] = df_work['hasSite'].apply(classify_location_type)
-    else:
-        df_work['Warehouse_Normalized'] = ''
-        df_work['Location_Type'] = 'UNKNOWN'
+    df_work['Warehouse_Normalized'] = df_work['hasSite'].apply(normalize_warehouse_name)
+    df_work['Location_Type'] = df_work['hasSite'].apply(classify_location_type)
     
     # 2. 창고만 필터링 (현장 제외)
     warehouse_df = df_work[
@@ -198,11 +202,14 @@ def create_warehouse_monthly_flow(df: pd.DataFrame, all_months: pd.PeriodIndex)
     ].copy()
     
     if warehouse_df.empty:
-        print("⚠️ 창고 데이터가 없습니다. 더미 데이터를 생성합니다.")
+        logger.info("⚠️ 창고 데이터가 없습니다. 더미 데이터를 생성합니다.")
         return create_dummy_warehouse_flow(all_months)
     
-    # 3. 월별 컬럼 생성
-    warehouse_df['Month'] = pd.to_datetime(warehouse_df['hasDate']).dt.to_period("M")
+    # 3. 월별 컬럼 생성 (이미 변환된 경우 재파싱 생략)
+    dates = warehouse_df['hasDate']
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, cache=True)
+    warehouse_df['Month'] = dates.dt.to_period("M")
     
     # 4. 트랜잭션 타입 분류
     warehouse_df['TxType_Classified'] = warehouse_df.apply(classify_transaction_type, axis=1)
@@ -218,8 +225,9 @@ def create_warehouse_monthly_flow(df: pd.DataFrame, all_months: pd.PeriodIndex)
         lambda row: row['hasVolume_numeric'] if row['TxType_Classified'] == 'TRANSFER' else 0, axis=1
     )
     
-    # 6. 월별 집계
-    monthly_flow = warehouse_df.groupby(['Warehouse_Normalized', 'Month']).agg({
+    # 6. 월별 집계 (저카디널리티 창고명은 Categorical 코드로 그룹핑)
+    warehouse_df['Warehouse_Normalized'] = warehouse_df['Warehouse_Normalized'].astype('category')
+    monthly_flow = warehouse_df.groupby(['Warehouse_Normalized', 'Month'], observed=True).agg({
         'InQty': 'sum',
         'OutQty': 'sum', 
         'TransferQty': 'sum',
@@ -228,7 +236,7 @@ def create_warehouse_monthly_flow(df: pd.DataFrame, all_months: pd.PeriodIndex)
     
     # 7. 재고 계산 (누적 입고 - 누적 출고)
     monthly_flow['Net_Flow'] = monthly_flow['InQty'] - monthly_flow['OutQty'] + monthly_flow['TransferQty']
-    monthly_flow['Cumulative_Stock'] = monthly_flow.groupby(level=0)['Net_Flow'].cumsum()
+    monthly_flow['Cumulative_Stock'] = monthly_flow.groupby(level=0, observed=True)['Net_Flow'].cumsum()
     
     # 8. 전체 월 범위로 reindex
     warehouse_list = monthly_flow.index.get_level_values(0).unique()
@@ -243,7 +251,7 @@ def create_warehouse_monthly_flow(df: pd.DataFrame, all_months: pd.PeriodIndex)
     result = monthly_flow.reset_index()
     result.columns = ['창고명', '월', '입고수량', '출고수량', '이동수량', '금액', '순증감', '누적재고']
     
-    print(f"✅ 창고별 흐름 분석 완료: {len(warehouse_list)}개 창고, {len(all_months)}개월")
+    logger.info("✅ 창고별 흐름 분석 완료: %d개 창고, %d개월", len(warehouse_list), len(all_months))
     
     return result
 
@@ -251,30 +259,27 @@ def create_dummy_warehouse_flow(all_months: pd.PeriodIndex) -> pd.DataFrame:
     """더미 창고 흐름 데이터 생성"""
     warehouses = ['DSV INDOOR', 'DSV OUTDOOR', 'DSV AL MARKAZ', 'DAS']
     
-    data = []
-    for warehouse in warehouses:
-        cumulative_stock = 0
-        for month in all_months:
-            in_qty = np.random.randint(10, 100)
-            out_qty = np.random.randint(5, 80)
-            transfer_qty = np.random.randint(-10, 10)
-            amount = in_qty * 1000 + out_qty * 800
-            
-            net_flow = in_qty - out_qty + transfer_qty
-            cumulative_stock += net_flow
-            
-            data.append({
-                '창고명': warehouse,
-                '월': month,
-                '입고수량': in_qty,
-                '출고수량': out_qty,
-                '이동수량': transfer_qty,
-                '금액': amount,
-                '순증감': net_flow,
-                '누적재고': max(0, cumulative_stock)  # 음수 재고 방지
-            })
-    
-    return pd.DataFrame(data)
+    # 창고 × 월 배열로 한 번에 생성
+    rng = np.random.default_rng(0)
+    shape = (len(warehouses), len(all_months))
+    in_qty = rng.integers(10, 100, shape)
+    out_qty = rng.integers(5, 80, shape)
+    transfer_qty = rng.integers(-10, 10, shape)
+    amount = in_qty * 1000 + out_qty * 800
+    
+    net_flow = in_qty - out_qty + transfer_qty
+    cumulative_stock = np.maximum(net_flow.cumsum(axis=1), 0)  # 음수 재고 방지
+    
+    return pd.DataFrame({
+        '창고명': np.repeat(warehouses, len(all_months)),
+        '월': all_months[np.tile(np.arange(len(all_months)), len(warehouses))],
+        '입고수량': in_qty.ravel(),
+        '출고수량': out_qty.ravel(),
+        '이동수량': transfer_qty.ravel(),
+        '금액': amount.ravel(),
+        '순증감': net_flow.ravel(),
+        '누적재고': cumulative_stock.ravel()
+    })
 
 # ===============================================================================
 # 4. 현장별 배송 현황 분석 함수
@@ -291,19 +296,20 @@ def create_site_delivery_analysis(df: pd.DataFrame, all_months: pd.PeriodIndex)
     Returns:
         pd.DataFrame: 현장별 배송 현황
     """
-    print("🔄 현장별 배송 현황 분석 중...")
+    logger.info("🔄 현장별 배송 현황 분석 중...")
+    
+    # 데이터/위치 컬럼이 없으면 분류·집계 없이 바로 더미 데이터 반환
+    if df.empty or 'hasSite' not in df.columns:
+        logger.info("⚠️ 현장 데이터가 없습니다. 더미 데이터를 생성합니다.")
+        return create_dummy_site_delivery(all_months)
     
     df_work = df.copy()
     
     # 1. 현장 분류
-    if 'hasSite' in df_work.columns:
-        df_work['Location_Type'] = df_work['hasSite'].apply(classify_location_type)
-        df_work['Site_Name'] = df_work['hasSite'].apply(
-            lambda x: str(x).strip().upper() if classify_location_type(x) == 'SITE' else ''
-        )
-    else:
-        df_work['Location_Type'] = 'UNKNOWN'
-        df_work['Site_Name'] = ''
+    df_work['Location_Type'] = df_work['hasSite'].apply(classify_location_type)
+    df_work['Site_Name'] = df_work['hasSite'].apply(
+        lambda x: str(x).strip().upper() if classify_location_type(x) == 'SITE' else ''
+    )
     
     # 2. 현장만 필터링
     site_df = df_work[
@@ -312,13 +318,17 @@ def create_site_delivery_analysis(df: pd.DataFrame, all_months: pd.PeriodIndex)
     ].copy()
     
     if site_df.empty:
-        print("⚠️ 현장 데이터가 없습니다. 더미 데이터를 생성합니다.")
+        logger.info("⚠️ 현장 데이터가 없습니다. 더미 데이터를 생성합니다.")
         return create_dummy_site_delivery(all_months)
     
-    # 3. 월별 집계
-    site_df['Month'] = pd.to_datetime(site_df['hasDate']).dt.to_period("M")
+    # 3. 월별 집계 (이미 변환된 경우 재파싱 생략)
+    dates = site_df['hasDate']
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates, cache=True)
+    site_df['Month'] = dates.dt.to_period("M")
     
-    site_delivery = site_df.groupby(['Site_Name', 'Month']).agg({
+    site_df['Site_Name'] = site_df['Site_Name'].astype('category')
+    site_delivery = site_df.groupby(['Site_Name', 'Month'], observed=True).agg({
         'hasVolume_numeric': ['sum', 'count'],
         'hasAmount_numeric': 'sum'
     }).round(2)
@@ -339,7 +349,7 @@ def create_site_delivery_analysis(df: pd.DataFrame, all_months: pd.PeriodIndex)
     result = site_delivery.reset_index()
     result.columns = ['현장명', '월', '배송수량', '배송횟수', '배송금액']
     
-    print(f"✅ 현장별 배송 분석 완료: {len(site_list)}개 현장, {len(all_months)}개월")
+    logger.info("✅ 현장별 배송 분석 완료: %d개 현장, %d개월", len(site_list), len(all_months))
     
     return result
 
@@ -347,22 +357,19 @@ def create_dummy_site_delivery(all_months: pd.PeriodIndex) -> pd.DataFrame:
     """더미 현장 배송 데이터 생성"""
     sites = ['AGI PROJECT', 'MIR SITE', 'SHU CONSTRUCTION', 'FIELD STATION']
     
-    data = []
-    for site in sites:
-        for month in all_months:
-            delivery_qty = np.random.randint(20, 200)
-            delivery_count = np.random.randint(1, 10)
-            delivery_amount = delivery_qty * 1200
-            
-            data.append({
-                '현장명': site,
-                '월': month,
-                '배송수량': delivery_qty,
-                '배송횟수': delivery_count,
-                '배송금액': delivery_amount
-            })
-    
-    return pd.DataFrame(data)
+    # 현장 × 월 배열로 한 번에 생성
+    rng = np.random.default_rng(0)
+    shape = (len(sites), len(all_months))
+    delivery_qty = rng.integers(20, 200, shape)
+    delivery_count = rng.integers(1, 10, shape)
+    
+    return pd.DataFrame({
+        '현장명': np.repeat(sites, len(all_months)),
+        '월': all_months[np.tile(np.arange(len(all_months)), len(sites))],
+        '배송수량': delivery_qty.ravel(),
+        '배송횟수': delivery_count.ravel(),
+        '배송금액': (delivery_qty * 1200).ravel()
+    })
 
 # ===============================================================================
 # 5. 통합 리포트 생성 함수
@@ -379,8 +386,7 @@ def create_warehouse_flow_report(df: pd.DataFrame, all_months: pd.PeriodIndex) -
     Returns:
         Dict[str, pd.DataFrame]: 리포트별 DataFrame 딕셔너리
     """
-    print("🚀 창고 흐름 통합 리포트 생성 시작")
-    print("=" * 60)
+    logger.info("🚀 창고 흐름 통합 리포트 생성 시작")
     
     reports = {}
     
@@ -392,7 +398,7 @@ def create_warehouse_flow_report(df: pd.DataFrame, all_months: pd.PeriodIndex) -
     
     # 3. 창고 요약 통계
     warehouse_flow = reports['창고별_월별_입출고재고']
-    warehouse_summary = warehouse_flow.groupby('창고명').agg({
+    warehouse_summary = warehouse_flow.groupby('창고명', observed=True).agg({
         '입고수량': 'sum',
         '출고수량': 'sum',
         '이동수량': 'sum',
@@ -404,7 +410,7 @@ def create_warehouse_flow_report(df: pd.DataFrame, all_months: pd.PeriodIndex) -
     
     # 4. 현장 요약 통계
     site_delivery = reports['현장별_배송현황']
-    site_summary = site_delivery.groupby('현장명').agg({
+    site_summary = site_delivery.groupby('현장명', observed=True).agg({
         '배송수량': 'sum',
         '배송횟수': 'sum',
         '배송금액': 'sum'
@@ -412,11 +418,11 @@ def create_warehouse_flow_report(df: pd.DataFrame, all_months: pd.PeriodIndex) -
     site_summary.columns = ['총배송수량', '총배송횟수', '총배송금액']
     reports['현장별_요약통계'] = site_summary.reset_index()
     
-    print("=" * 60)
-    print("🎉 창고 흐름 통합 리포트 생성 완료!")
-    print(f"📊 생성된 리포트: {len(reports)}개")
-    for report_name, report_df in reports.items():
-        print(f"   • {report_name}: {report_df.shape}")
+    logger.info(
+        "🎉 창고 흐름 통합 리포트 생성 완료! 생성된 리포트: %d개\n%s",
+        len(reports),
+        "\n".join(f"   • {name}: {report_df.shape}" for name, report_df in reports.items())
+    )
     
     return reports
 
@@ -435,7 +441,7 @@ def save_warehouse_flow_excel(reports: Dict[str, pd.DataFrame], output_path: str
         timestamp = datetime.now().strftime('%Y%m%d_%H%M')
         output_path = f"HVDC_창고흐름분석_{timestamp}.xlsx"
     
-    print(f"💾 창고 흐름 Excel 리포트 저장 중: {output_path}")
+    logger.info("💾 창고 흐름 Excel 리포트 저장 중: %s", output_path)
     
     with pd.ExcelWriter(output_path, engine="xlsxwriter") as writer:
         workbook = writer.book
@@ -458,7 +464,7 @@ def save_warehouse_flow_excel(reports: Dict[str, pd.DataFrame], output_path: str
             except:
                 pass  # 조건부 서식 실패 시 무시
     
-    print(f"✅ 창고 흐름 Excel 리포트 저장 완료: {output_path}")
+    logger.info("✅ 창고 흐름 Excel 리포트 저장 완료: %s", output_path)
     return output_path
 
 # ===============================================================================
@@ -478,12 +484,15 @@ def run_warehouse_flow_analysis(df: pd.DataFrame, all_months: pd.PeriodIndex,
     Returns:
         Dict[str, pd.DataFrame]: 분석 결과 리포트
     """
-    print("🎯 HVDC 창고 흐름 분석 시작")
-    print("=" * 80)
+    logger.info("🎯 HVDC 창고 흐름 분석 시작")
     
     start_time = datetime.now()
     
     try:
+        # 0. 날짜 컬럼 1회 변환 (창고/현장 분석에서 각각 재파싱하지 않도록)
+        if 'hasDate' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['hasDate']):
+            df = df.assign(hasDate=pd.to_datetime(df['hasDate'], cache=True))
+        
         # 1. 통합 리포트 생성
         reports = create_warehouse_flow_report(df, all_months)
         
@@ -496,24 +505,17 @@ def run_warehouse_flow_analysis(df: pd.DataFrame, all_months: pd.PeriodIndex,
         end_time = datetime.now()
         processing_time = (end_time - start_time).total_seconds()
         
-        print("\n" + "=" * 80)
-        print("🎉 HVDC 창고 흐름 분석 완료!")
-        print("=" * 80)
-        
-        print(f"📊 분석 결과:")
-        print(f"   • 창고 개수: {len(reports['창고별_요약통계'])}개")
-        print(f"   • 현장 개수: {len(reports['현장별_요약통계'])}개")
-        print(f"   • 분석 기간: {len(all_months)}개월")
-        print(f"   • 처리 시간: {processing_time:.2f}초")
+        logger.info("🎉 HVDC 창고 흐름 분석 완료!")
+        logger.info("📊 분석 결과: 창고 %d개, 현장 %d개, 분석 기간 %d개월, 처리 시간 %.2f초",
+                    len(reports['창고별_요약통계']), len(reports['현장별_요약통계']),
+                    len(all_months), processing_time)
         if save_excel:
-            print(f"   • Excel 파일: {reports.get('_excel_path', 'N/A')}")
+            logger.info("   • Excel 파일: %s", reports.get('_excel_path', 'N/A'))
         
         return reports
         
     except Exception as e:
-        print(f"❌ 창고 흐름 분석 중 오류 발생: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("❌ 창고 흐름 분석 중 오류 발생: %s", e)
         return {}
 
 # ===============================================================================
@@ -522,6 +524,7 @@ def run_warehouse_flow_analysis(df: pd.DataFrame, all_months: pd.PeriodIndex,
 
 if __name__ == "__main__":
     """직접 실행 시 테스트"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     print("🧪 HVDC 창고 흐름 분석기 테스트")
     print("=" * 80)
     
@@ -14,15 +14,216 @@ HVDC Warehouse Automation Suite - 빠른 모듈 통합
 import os
 import sys
 import json
+import py_compile
 import shutil
+import string
 import subprocess
+from importlib.abc import MetaPathFinder
+from importlib.machinery import PathFinder
+from importlib.util import find_spec
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+
+# finalize_integration 산출물 템플릿 (모듈 로드 시 한 번만 생성)
+_ENV_SCRIPT_TMPL = string.Template('''
+# HVDC 환경 설정 (bashrc 또는 환경 설정에 추가)
+export HVDC_PATH="${hvdc_path}"
+export HVDC_INTEGRATION_PATH="${integration_path}"
+export PYTHONPATH="$$PYTHONPATH:${integration_path}"
+''')
+
+_QUICK_START_TMPL = string.Template('''#!/usr/bin/env python3
+"""
+HVDC 빠른 시작 스크립트
+===================
+
+기존 시스템에서 바로 사용할 수 있는 원라이너
+"""
+
+import sys
+from pathlib import Path
+
+# HVDC 통합 경로 자동 추가
+integration_path = Path(__file__).parent
+if str(integration_path) not in sys.path:
+    sys.path.insert(0, str(integration_path))
+
+# HVDC 모듈 임포트
+import hvdc_quick
+
+def demo():
+    """데모 실행"""
+    print("🚀 HVDC 빠른 통합 데모")
+    print("=" * 40)
+    
+    # 시스템 상태 확인
+    status = hvdc_quick.get_status()
+    print(f"시스템 준비: {'✅' if status['processor_ready'] else '❌'}")
+    print(f"버전: {status['version']}")
+    
+    # 샘플 테스트
+    test_result = hvdc_quick.quick_test()
+    print(f"테스트 결과: {'✅' if test_result.get('sample_data_test') else '❌'}")
+    
+    print("\\n📋 사용법:")
+    print("1. import hvdc_quick")
+    print("2. data = hvdc_quick.load_data('file.xlsx')")
+    print("3. report = hvdc_quick.generate_report(data, 'report.xlsx')")
+    
+    return status['processor_ready']
+
+if __name__ == "__main__":
+    demo()
+''')
+
+_README_TMPL = string.Template('''# HVDC 빠른 모듈 통합 완료! 🎉
+
+## 📋 설정 완료 내용
+
+✅ 통합 모듈 생성: `hvdc_quick`
+✅ 테스트 스크립트: `test_integration.py`
+✅ 사용 예시: `examples/` 폴더
+✅ 빠른 시작: `quick_start.py`
+
+## 🚀 즉시 사용법 (30초)
+
+### 방법 1: 직접 임포트
+```python
+import sys
+sys.path.insert(0, "${integration_path}")
+
+import hvdc_quick
+
+# 데이터 처리
+result = hvdc_quick.process_warehouse_data("warehouse.xlsx")
+print(f"처리 완료: {result['rows']} 행")
+
+# 보고서 생성
+report = hvdc_quick.generate_report(result["data"], "report.xlsx")
+```
+
+### 방법 2: 원라이너
+```python
+exec(open("${quick_start_file}").read())
+```
+
+### 방법 3: 환경 설정 후 사용
+```bash
+# 환경 설정 (한 번만)
+source ${env_file}
+
+# Python에서 바로 사용
+python -c "import hvdc_quick; print(hvdc_quick.get_status())"
+```
+
+## 📊 기능 목록
+
+| 함수 | 기능 | 사용법 |
+|------|------|--------|
+| `quick_load()` | 데이터 로드 | `df = hvdc_quick.quick_load("file.xlsx")` |
+| `quick_report()` | 보고서 생성 | `path = hvdc_quick.quick_report(df, "report.xlsx")` |
+| `quick_inventory()` | 재고 계산 | `inv = hvdc_quick.quick_inventory(df)` |
+| `process_warehouse_data()` | 통합 처리 | `result = hvdc_quick.process_warehouse_data("file.xlsx")` |
+| `get_status()` | 상태 확인 | `status = hvdc_quick.get_status()` |
+
+## 🔧 문제 해결
+
+**Q: ImportError 발생**
+```bash
+# 해결책
+export PYTHONPATH="$$PYTHONPATH:${integration_path}"
+python quick_start.py
+```
+
+**Q: 모듈 초기화 실패**
+```bash
+# 해결책
+cd ${hvdc_path}
+pip install -r requirements.txt
+python ${quick_start_file}
+```
+
+**Q: 파일 경로 오류**
+```python
+# 해결책: 절대 경로 사용
+import os
+file_path = os.path.abspath("warehouse.xlsx")
+result = hvdc_quick.process_warehouse_data(file_path)
+```
+
+## 📱 실제 사용 시나리오
+
+### ERP 시스템 통합
+```python
+# your_erp_system.py에 추가
+import sys
+sys.path.insert(0, "${integration_path}")
+import hvdc_quick
+
+def daily_sync():
+    result = hvdc_quick.process_warehouse_data("daily_export.xlsx")
+    if result["success"]:
+        update_erp_database(result["data"])
+```
+
+### 웹 대시보드 연동
+```python
+# dashboard.py
+import hvdc_quick
+
+@app.route("/api/warehouse/data")
+def get_warehouse_data():
+    status = hvdc_quick.get_status()
+    return jsonify(status)
+```
+
+### 배치 작업 통합
+```python
+# batch_job.py
+import hvdc_quick
+
+def nightly_processing():
+    result = hvdc_quick.process_file("warehouse.xlsx", generate_report=True)
+    return result["success"]
+```
+
+## 📈 성능 정보
+
+- **처리 속도**: <1초 (5,000행 기준)
+- **메모리 사용**: ~50MB
+- **파일 크기**: 최대 100MB Excel 지원
+- **동시 실행**: 가능 (스레드 안전)
+
+## 🎯 다음 단계
+
+1. `examples/basic_usage.py` 실행해보기
+2. 기존 시스템에 통합 코드 추가
+3. 필요시 `examples/advanced_usage.py` 참고
+
+---
+**생성 시간**: ${created_at}
+**HVDC 버전**: 0.5.1-quick
+**통합 완료**: ✅
+''')
+
+class _HVDCFinder(MetaPathFinder):
+    """hvdc_quick 패키지만 통합 경로에서 찾는 import 훅 (sys.path 미변경)"""
+    
+    def __init__(self, root: Path):
+        self.root = str(root)
+    
+    def find_spec(self, fullname, path=None, target=None):
+        if fullname != "hvdc_quick" and not fullname.startswith("hvdc_quick."):
+            return None
+        return PathFinder.find_spec(fullname, path or [self.root], target)
 
 class HVDCQuickIntegration:
     """5분 완성 HVDC 통합 클래스"""
     
+    # 의존성 확인 결과 캐시 (반복 quick_setup 시 재확인 생략)
+    _dep_ok = False
+    
     def __init__(self, hvdc_path: str = "."):
         self.hvdc_path = Path(hvdc_path).resolve()
         self.integration_path = self.hvdc_path / "quick_integration"
@@ -33,8 +234,9 @@ class HVDCQuickIntegration:
         print("🚀 HVDC 빠른 통합 설정 시작...")
         
         try:
-            # 1. 통합 디렉토리 생성
-            self.integration_path.mkdir(exist_ok=True)
+            # 1. 통합 디렉토리 트리 생성 (통합 경로 / hvdc_quick / examples)
+            for directory in (self.integration_path / "hvdc_quick", self.integration_path / "examples"):
+                directory.mkdir(parents=True, exist_ok=True)
             print("✅ 통합 디렉토리 생성")
             
             # 2. 필수 모듈 확인
@@ -42,16 +244,18 @@ class HVDCQuickIntegration:
                 print("❌ 의존성 설치 중...")
                 self._install_dependencies()
             
-            # 3. 통합 모듈 생성
-            self._create_integration_module()
-            print("✅ 통합 모듈 생성")
+            # 3~5. 통합 모듈 / 테스트 스크립트 / 사용 예시 템플릿 준비 후 일괄 기록
+            module_files = self._create_integration_module()
+            test_files = self._create_test_script()
+            example_files = self._create_usage_examples()
+            self._write_files(module_files + test_files + example_files,
+                              executable={path for path, _ in test_files})
             
-            # 4. 빠른 테스트 스크립트 생성
-            self._create_test_script()
+            # 바이트코드 미리 컴파일 (첫 import 시 파싱/컴파일 생략)
+            for module_file, _ in module_files:
+                py_compile.compile(str(module_file), doraise=True)
+            print("✅ 통합 모듈 생성")
             print("✅ 테스트 스크립트 생성")
-            
-            # 5. 사용 예시 생성
-            self._create_usage_examples()
             print("✅ 사용 예시 생성")
             
             self.status["setup"] = True
@@ -63,25 +267,46 @@ class HVDCQuickIntegration:
             return False
     
     def _check_dependencies(self) -> bool:
-        """의존성 확인"""
-        required_modules = ['pandas', 'openpyxl', 'xlsxwriter']
+        """의존성 확인 (모듈을 임포트하지 않고 설치 여부만 조회)"""
+        if HVDCQuickIntegration._dep_ok:
+            return True
         
-        for module in required_modules:
-            try:
-                __import__(module)
-            except ImportError:
-                return False
-        return True
+        required_modules = ['pandas', 'openpyxl', 'xlsxwriter']
+        HVDCQuickIntegration._dep_ok = all(find_spec(module) is not None for module in required_modules)
+        return HVDCQuickIntegration._dep_ok
     
     def _install_dependencies(self) -> bool:
-        """의존성 자동 설치"""
-        cmd = [sys.executable, "-m", "pip", "install", 
+        """의존성 자동 설치 (휠 우선, 로컬 캐시 재사용)"""
+        if self._check_dependencies():
+            return True
+        
+        cache_dir = Path.home() / ".cache" / "hvdc_wheels"
+        cmd = [sys.executable, "-m", "pip", "install",
+               "--quiet", "--no-input", "--disable-pip-version-check",
+               "--prefer-binary", "--cache-dir", str(cache_dir),
                "pandas>=1.5.0", "openpyxl>=3.1.0", "xlsxwriter>=3.1.0"]
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # 출력은 버림 (대용량 pip 로그로 파이프가 막히는 것 방지)
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
         return result.returncode == 0
     
-    def _create_integration_module(self):
+    @staticmethod
+    def _write_files(files: List[Tuple[Path, str]], executable=()) -> None:
+        """
+        템플릿 번들 일괄 기록
+        
+        Args:
+            files: (경로, 내용) 목록
+            executable: 실행 권한(0o755)을 부여할 경로 집합
+        """
+        for path, content in files:
+            with open(path, 'wb') as f:
+                f.write(content.encode('utf-8'))
+                if path in executable:
+                    # 열린 fd 기준으로 권한 지정 (기존 파일 재기록 시에도 0o755 보장)
+                    os.fchmod(f.fileno(), 0o755)
+    
+    def _create_integration_module(self) -> List[Tuple[Path, str]]:
         """통합 모듈 생성"""
         
         # __init__.py
@@ -102,13 +327,16 @@ HVDC Quick Integration Module
 """
 
 from .core import HVDCProcessor
-from .utils import quick_load, quick_report, quick_inventory
+from .utils import quick_load, quick_report, quick_inventory, _get_processor
 
 __version__ = "0.5.1-quick"
 __all__ = ["HVDCProcessor", "quick_load", "quick_report", "quick_inventory"]
 
 # 빠른 사용을 위한 글로벌 함수들
-process_warehouse_data = HVDCProcessor().process
+def process_warehouse_data(file_path):
+    """데이터 처리 (공유 프로세서는 첫 호출 시 초기화)"""
+    return _get_processor().process(file_path)
+
 generate_report = quick_report
 calculate_inventory = quick_inventory
 load_data = quick_load
@@ -120,18 +348,35 @@ HVDC 핵심 처리 모듈
 """
 
 import pandas as pd
+import inspect
+import os
 import sys
+import threading
+from importlib.util import find_spec
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, List, Union
 
-# HVDC 시스템 경로 추가
+# HVDC 시스템 경로 추가 (재로드 시 중복 추가 방지)
 HVDC_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(HVDC_ROOT))
+if str(HVDC_ROOT) not in sys.path:
+    sys.path.insert(0, str(HVDC_ROOT))
+
+# HVDC_FAST_IO=1 설정 시 warehouse_loader의 Excel 엔진만 calamine으로 지정
+# (python-calamine 설치 + pandas >= 2.2 필요, 컬럼 매핑/타입 변환은 기본 경로와 동일)
+FAST_IO = os.environ.get("HVDC_FAST_IO") == "1"
+CALAMINE_ENGINE = (FAST_IO and find_spec("python_calamine") is not None
+                   and tuple(int(part) for part in pd.__version__.split(".")[:2]) >= (2, 2))
+
+# chdir은 프로세스 전역 상태이므로 root 인자를 받지 않는 main()에서만 잠금 하에 사용
+_CWD_LOCK = threading.Lock()
 
 class HVDCProcessor:
     """HVDC 핵심 처리기"""
     
+    # 초기화 성공 시 (loader, reporter, main) 캐시 → 이후 인스턴스는 import 생략
+    _INIT_CACHE = None
+    
     def __init__(self):
         self.last_result = None
         self.is_initialized = False
@@ -139,6 +384,11 @@ class HVDCProcessor:
     
     def _initialize(self):
         """초기화"""
+        if HVDCProcessor._INIT_CACHE is not None:
+            self.warehouse_loader, self.excel_reporter, self.main_process = HVDCProcessor._INIT_CACHE
+            self.is_initialized = True
+            return
+        
         try:
             # 핵심 모듈 임포트
             global warehouse_loader, excel_reporter, main_process
@@ -150,6 +400,7 @@ class HVDCProcessor:
             self.warehouse_loader = load_hvdc_warehouse_file
             self.excel_reporter = generate_full_dashboard
             self.main_process = main_process
+            HVDCProcessor._INIT_CACHE = (load_hvdc_warehouse_file, generate_full_dashboard, main_process)
             
             self.is_initialized = True
             print("✅ HVDC 모듈 초기화 완료")
@@ -158,14 +409,36 @@ class HVDCProcessor:
             print(f"❌ HVDC 모듈 초기화 실패: {e}")
             self.is_initialized = False
     
+    def _load(self, excel_file: Union[str, Path],
+              usecols: Optional[List[str]] = None,
+              dtype: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """데이터 로드 (warehouse_loader, FAST_IO 활성화 시 calamine 엔진 사용)"""
+        if CALAMINE_ENGINE:
+            df = self.warehouse_loader(excel_file, engine="calamine")
+        else:
+            df = self.warehouse_loader(excel_file)
+        # warehouse_loader는 표준화된 컬럼을 반환하므로 투영/형변환은 로드 직후 적용
+        if usecols is not None:
+            missing = [col for col in usecols if col not in df.columns]
+            if missing:
+                raise ValueError(f"로드된 데이터에 없는 컬럼: {missing} (warehouse_loader 표준 필드명 사용)")
+            df = df[list(usecols)]
+        if dtype is not None:
+            df = df.astype({col: t for col, t in dtype.items() if col in df.columns})
+        return df
+    
     def process(self, excel_file: Union[str, Path], 
-                output_file: Optional[str] = None) -> Dict[str, Any]:
+                output_file: Optional[str] = None,
+                usecols: Optional[List[str]] = None,
+                dtype: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         창고 데이터 처리
         
         Args:
             excel_file: Excel 파일 경로
             output_file: 출력 파일명 (옵션)
+            usecols: 로드할 컬럼 목록 (옵션, 기본값: 전체)
+            dtype: 컬럼별 dtype 지정 (옵션)
         
         Returns:
             처리 결과 딕셔너리
@@ -178,7 +451,7 @@ class HVDCProcessor:
             
             # 1. 데이터 로드
             print(f"📄 데이터 로딩: {excel_file}")
-            df = self.warehouse_loader(excel_file)
+            df = self._load(excel_file, usecols=usecols, dtype=dtype)
             
             # 2. 기본 검증
             if df.empty:
@@ -204,7 +477,10 @@ class HVDCProcessor:
                 "timestamp": end_time.isoformat()
             }
             
-            self.last_result = result
+            # 요약은 미리 계산하고 DataFrame은 보관하지 않음
+            # (data의 수명은 result를 받은 호출자가 관리)
+            self.last_result = {key: value for key, value in result.items() if key != "data"}
+            self.last_result["summary"] = self._summarize(df)
             print(f"✅ 처리 완료 ({processing_time:.2f}초, {len(df)}행)")
             
             return result
@@ -218,32 +494,46 @@ class HVDCProcessor:
             print(f"❌ 처리 실패: {e}")
             return error_result
     
+    def _summarize(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """DataFrame 요약 통계 계산"""
+        # 존재하는 컬럼만 컬럼당 한 번의 agg로 집계 (없는 컬럼은 None)
+        stats = {
+            col: df[col].agg(funcs)
+            for col, funcs in (("Amount", ["sum"]),
+                               ("Category", ["nunique"]),
+                               ("Billing month", ["min", "max"]))
+            if col in df.columns
+        }
+        
+        def _stat(col, func):
+            return stats[col][func] if col in stats else None
+        
+        return {
+            "total_rows": len(df),
+            "total_amount": _stat("Amount", "sum"),
+            "categories": _stat("Category", "nunique"),
+            "date_range": {
+                "start": _stat("Billing month", "min"),
+                "end": _stat("Billing month", "max")
+            }
+        }
+    
     def get_summary(self) -> Dict[str, Any]:
-        """처리 결과 요약"""
+        """처리 결과 요약 (process 시점에 계산된 통계 사용)"""
         if not self.last_result:
             return {"status": "no_data"}
         
         if not self.last_result["success"]:
             return {"status": "error", "error": self.last_result["error"]}
         
-        df = self.last_result["data"]
-        
-        summary = {
+        return {
             "status": "success",
-            "total_rows": len(df),
-            "total_amount": df.get("Amount", pd.Series()).sum(),
-            "categories": df.get("Category", pd.Series()).nunique(),
-            "date_range": {
-                "start": df.get("Billing month", pd.Series()).min(),
-                "end": df.get("Billing month", pd.Series()).max()
-            },
+            **self.last_result["summary"],
             "processing_info": {
                 "timestamp": self.last_result["timestamp"],
                 "processing_time": self.last_result["processing_time"]
             }
         }
-        
-        return summary
     
     def run_full_pipeline(self, data_dir: str = "data") -> Dict[str, Any]:
         """전체 파이프라인 실행"""
@@ -253,15 +543,18 @@ class HVDCProcessor:
         try:
             print("🚀 HVDC 전체 파이프라인 실행")
             
-            # 환경 변수 설정
-            original_cwd = os.getcwd()
-            os.chdir(HVDC_ROOT)
-            
-            # 전체 시스템 실행
-            success = self.main_process()
-            
-            # 원래 디렉토리로 복원
-            os.chdir(original_cwd)
+            # 전체 시스템 실행 (루트 경로를 인자로 전달해 전역 chdir 회피)
+            if "root" in inspect.signature(self.main_process).parameters:
+                success = self.main_process(root=HVDC_ROOT)
+            else:
+                with _CWD_LOCK:
+                    original_cwd = os.getcwd()
+                    os.chdir(HVDC_ROOT)
+                    try:
+                        success = self.main_process()
+                    finally:
+                        # 원래 디렉토리로 복원
+                        os.chdir(original_cwd)
             
             return {
                 "success": success,
@@ -278,45 +571,177 @@ class HVDCProcessor:
 HVDC 유틸리티 함수들
 """
 
+import numpy as np
 import pandas as pd
+from functools import cache
 from pathlib import Path
-from typing import Union, Dict, Any, Optional
+from typing import Union, Dict, Any, Optional, List
 from .core import HVDCProcessor
 
-# 전역 프로세서 인스턴스
-_processor = HVDCProcessor()
+try:
+    from numba import njit
+except ImportError:  # numba 미설치 시 InventoryEngine 경로 사용
+    njit = None
+
+# quick_inventory 재고 계산에 필요한 warehouse_loader 표준 필드명 (quick_load 투영용)
+STANDARD_COLUMNS = ["amount", "category", "billing_month", "cntr_q_in", "cntr_q_out"]
+
+@cache
+def _get_processor() -> HVDCProcessor:
+    """전역 프로세서 인스턴스 (첫 호출 시 초기화)"""
+    return HVDCProcessor()
+
+if njit is not None:
+    @njit(cache=True)
+    def _inv_kernel(incoming, outgoing, inventory, amount, timestamps, month_codes, n_months):
+        """
+        재고 집계 커널 (단일 패스, InventoryEngine.calculate_monthly_summary 와 같은 기준)
+        
+        Args:
+            incoming, outgoing, inventory, amount: float64 배열
+            timestamps: Billing month 정수(ns) 배열
+            month_codes: 첫 월 기준 월 오프셋 배열 (결측은 -1)
+            n_months: 첫 월 ~ 마지막 월 개월 수 (거래 없는 월 포함)
+        
+        Returns:
+            월별 [입고, 출고, 금액, 기말재고] 배열
+            (기말재고는 월 내 가장 늦은 날짜 행(같은 날짜는 뒤 행)의 Inventory, 거래 없는 월은 NaN)
+        """
+        monthly = np.zeros((n_months, 4))
+        monthly[:, 3] = np.nan
+        last_ts = np.empty(n_months, dtype=np.int64)
+        for i in range(incoming.shape[0]):
+            code = month_codes[i]
+            if code < 0:
+                continue
+            monthly[code, 0] += incoming[i]
+            monthly[code, 1] += outgoing[i]
+            monthly[code, 2] += amount[i]
+            # pd.Grouper 는 날짜로 안정 정렬한 뒤 마지막 값을 취하므로 가장 늦은 날짜(동률은 뒤 행) 기준
+            if np.isnan(monthly[code, 3]) or timestamps[i] >= last_ts[code]:
+                monthly[code, 3] = inventory[i]
+                last_ts[code] = timestamps[i]
+        return monthly
+
+def _float_array(df: pd.DataFrame, col: str, fallback: str) -> np.ndarray:
+    """숫자 컬럼을 연속 float64 배열로 추출 (결측/비숫자는 0)"""
+    values = df[col] if col in df.columns else df.get(fallback, pd.Series(0.0, index=df.index))
+    values = pd.to_numeric(values, errors="coerce").fillna(0)
+    return np.ascontiguousarray(values.to_numpy(dtype=np.float64))
+
+def _quick_inventory_numba(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Numba 커널 기반 재고 계산 (quick_inventory 고속 경로)
+    
+    InventoryEngine.calculate_monthly_summary()와 같은 결과를 낸다:
+    월 범위는 첫 월 ~ 마지막 월 전체(거래 없는 월 포함), 기말재고는 월 내 가장 늦은 날짜의 Inventory,
+    Inventory 컬럼이 없으면 행별 입고 - 출고.
+    """
+    months = pd.to_datetime(df["Billing month"])
+    month_ord = (months.dt.year * 12 + months.dt.month).to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = ~np.isnan(month_ord)
+    if not valid.any():
+        raise ValueError("유효한 Billing month 값이 없습니다")
+    first = month_ord[valid].min()
+    n_months = int(month_ord[valid].max() - first) + 1
+    month_codes = np.where(valid, month_ord - first, -1).astype(np.int64)
+    
+    incoming = _float_array(df, "Incoming", "cntr_q_in")
+    outgoing = _float_array(df, "Outgoing", "cntr_q_out")
+    inventory = _float_array(df, "Inventory", "Inventory") if "Inventory" in df.columns else incoming - outgoing
+    monthly = _inv_kernel(incoming, outgoing, inventory, _float_array(df, "Amount", "amount"),
+                          months.to_numpy(dtype="datetime64[ns]").view(np.int64), month_codes, n_months)
+    
+    # 월 라벨은 pd.Grouper(freq="M")와 같은 월말 날짜
+    month_index = pd.date_range(months[valid].min() + pd.offsets.MonthEnd(0), periods=n_months,
+                                freq=pd.offsets.MonthEnd()).normalize()
+    end_inventory = monthly[:, 3]
+    return {
+        "total_incoming": monthly[:, 0].sum(),
+        "total_outgoing": monthly[:, 1].sum(),
+        "end_inventory": end_inventory[-1],
+        "total_amount": monthly[:, 2].sum(),
+        "monthly_data": {
+            "Billing Month": month_index.to_numpy(),
+            "Incoming": monthly[:, 0],
+            "Outgoing": monthly[:, 1],
+            "End_Inventory": end_inventory,
+            "Total_Amount": monthly[:, 2],
+            "Net_Change": monthly[:, 0] - monthly[:, 1],
+            "Turnover_Rate": monthly[:, 1] / np.where(end_inventory == 0, 1, end_inventory),
+        }
+    }
 
-def quick_load(file_path: Union[str, Path]) -> pd.DataFrame:
+def quick_load(file_path: Union[str, Path],
+               columns: Optional[List[str]] = None,
+               dtypes: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
     """
     빠른 데이터 로드
     
+    재고 계산만 필요하면 columns=STANDARD_COLUMNS로 필요한 컬럼만 남겨
+    메모리 사용량을 줄일 수 있습니다.
+    
     Args:
         file_path: Excel 파일 경로
+        columns: 남길 표준 필드명 목록 (기본값: 전체 컬럼, 없는 이름이 있으면 로드 실패)
+        dtypes: 컬럼별 dtype 지정 (예: {"shipment_no": "category"})
     
     Returns:
         pandas.DataFrame
     """
-    result = _processor.process(file_path)
+    result = _get_processor().process(file_path, usecols=columns, dtype=dtypes)
     if result["success"]:
         return result["data"]
     else:
         raise Exception(f"데이터 로드 실패: {result['error']}")
 
-def quick_report(df: pd.DataFrame, output_path: str) -> str:
+def _column_values(series: pd.Series) -> list:
+    """Excel 셀 값 리스트로 변환 (결측값은 빈 셀)"""
+    return series.astype(object).where(series.notna(), None).tolist()
+
+def quick_report(df: pd.DataFrame, output_path: str, styled: bool = False) -> str:
     """
     빠른 보고서 생성
     
+    기본은 openpyxl write-only 모드로 행을 스트리밍 저장하며,
+    서식이 적용된 대시보드가 필요하면 styled=True를 사용합니다.
+    
     Args:
         df: 데이터프레임
         output_path: 출력 파일 경로
+        styled: True면 excel_reporter 대시보드 생성
     
     Returns:
         생성된 파일 경로
     """
     try:
-        from excel_reporter import generate_full_dashboard
-        report_path = generate_full_dashboard(df, output_path)
-        return str(report_path)
+        if styled:
+            from excel_reporter import generate_full_dashboard
+            report_path = generate_full_dashboard(df, output_path)
+            return str(report_path)
+        
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+        
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Data")
+        
+        # 헤더 서식 객체는 한 번만 생성
+        header_font = Font(bold=True)
+        header = []
+        for col in df.columns:
+            cell = WriteOnlyCell(ws, value=str(col))
+            cell.font = header_font
+            header.append(cell)
+        ws.append(header)
+        
+        # 컬럼 단위로 값을 꺼낸 뒤 행 튜플로 스트리밍
+        for row in zip(*(_column_values(df[c]) for c in df.columns)):
+            ws.append(row)
+        
+        wb.save(output_path)
+        return str(output_path)
     except Exception as e:
         raise Exception(f"보고서 생성 실패: {e}")
 
@@ -324,24 +749,38 @@ def quick_inventory(df: pd.DataFrame) -> Dict[str, Any]:
     """
     빠른 재고 계산
     
+    numba가 설치되어 있으면 컴파일된 단일 패스 커널을, 없으면
+    InventoryEngine.calculate_monthly_summary()를 사용합니다 (두 경로의 결과는 같음).
+    
     Args:
         df: 데이터프레임
     
     Returns:
-        재고 요약 정보
+        재고 요약 정보 (monthly_data는 {컬럼명: numpy 배열} 형태의 컬럼 단위 데이터,
+        pd.DataFrame(result["monthly_data"])로 복원 가능)
     """
     try:
+        if njit is not None and "Billing month" in df.columns:
+            return _quick_inventory_numba(df)
+        
         from core.inventory_engine import InventoryEngine
         
         engine = InventoryEngine(df)
         monthly_summary = engine.calculate_monthly_summary()
         
+        # 합계는 NumPy 배열 합으로, 기말재고는 위치 기반 .iat로 조회
+        total_in, total_out, total_amt = (
+            np.sum(monthly_summary[col].to_numpy(dtype=np.float64))
+            for col in ("Incoming", "Outgoing", "Total_Amount")
+        )
+        end_inv = monthly_summary["End_Inventory"].iat[-1]
+        
         return {
-            "total_incoming": monthly_summary["Incoming"].sum(),
-            "total_outgoing": monthly_summary["Outgoing"].sum(),
-            "end_inventory": monthly_summary["End_Inventory"].iloc[-1],
-            "total_amount": monthly_summary["Total_Amount"].sum(),
-            "monthly_data": monthly_summary.to_dict("records")
+            "total_incoming": total_in,
+            "total_outgoing": total_out,
+            "end_inventory": end_inv,
+            "total_amount": total_amt,
+            "monthly_data": {col: monthly_summary[col].to_numpy() for col in monthly_summary.columns}
         }
     except Exception as e:
         raise Exception(f"재고 계산 실패: {e}")
@@ -349,7 +788,7 @@ def quick_inventory(df: pd.DataFrame) -> Dict[str, Any]:
 def quick_test() -> Dict[str, Any]:
     """통합 테스트"""
     test_results = {
-        "processor_init": _processor.is_initialized,
+        "processor_init": _get_processor().is_initialized,
         "modules_available": True,
         "sample_data_test": False,
         "report_generation": False
@@ -380,7 +819,7 @@ def quick_test() -> Dict[str, Any]:
 # 편의 함수들
 def process_file(file_path: str, generate_report: bool = True) -> Dict[str, Any]:
     """파일 처리 + 보고서 생성 원스톱"""
-    result = _processor.process(file_path)
+    result = _get_processor().process(file_path)
     
     if result["success"] and generate_report:
         output_name = f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
@@ -395,24 +834,27 @@ def process_file(file_path: str, generate_report: bool = True) -> Dict[str, Any]
 def get_status() -> Dict[str, Any]:
     """현재 상태 확인"""
     return {
-        "processor_ready": _processor.is_initialized,
-        "last_processing": _processor.get_summary(),
+        "processor_ready": _get_processor().is_initialized,
+        "last_processing": _get_processor().get_summary(),
         "version": "0.5.1-quick"
     }
 '''
         
         # 파일들 저장
         module_dir = self.integration_path / "hvdc_quick"
-        module_dir.mkdir(exist_ok=True)
         
-        (module_dir / "__init__.py").write_text(init_content, encoding='utf-8')
-        (module_dir / "core.py").write_text(core_content, encoding='utf-8')
-        (module_dir / "utils.py").write_text(utils_content, encoding='utf-8')
+        # hvdc_quick import 훅 등록 (통합 경로당 한 번)
+        if not any(isinstance(finder, _HVDCFinder) and finder.root == str(self.integration_path)
+                   for finder in sys.meta_path):
+            sys.meta_path.append(_HVDCFinder(self.integration_path))
         
-        # sys.path에 추가하기 위한 설정
-        sys.path.insert(0, str(self.integration_path))
+        return [
+            (module_dir / "__init__.py", init_content),
+            (module_dir / "core.py", core_content),
+            (module_dir / "utils.py", utils_content),
+        ]
     
-    def _create_test_script(self):
+    def _create_test_script(self) -> List[Tuple[Path, str]]:
         """테스트 스크립트 생성"""
         test_content = '''#!/usr/bin/env python3
 """
@@ -486,11 +928,9 @@ if __name__ == "__main__":
     sys.exit(0 if success else 1)
 '''
         
-        test_file = self.integration_path / "test_integration.py"
-        test_file.write_text(test_content, encoding='utf-8')
-        test_file.chmod(0o755)
+        return [(self.integration_path / "test_integration.py", test_content)]
     
-    def _create_usage_examples(self):
+    def _create_usage_examples(self) -> List[Tuple[Path, str]]:
         """사용 예시 생성"""
         
         # 기본 사용법
@@ -707,33 +1147,37 @@ def nightly_batch_job():
     logger.info("✅ 야간 배치 작업 완료")
     return True
 
-# 웹 API 통합 예시
-from flask import Flask, jsonify, request
-
-app = Flask(__name__)
-warehouse_manager = WarehouseManager()
-
-@app.route("/api/warehouse/status")
-def get_status():
-    """시스템 상태 API"""
-    return jsonify(warehouse_manager.generate_dashboard_data())
-
-@app.route("/api/warehouse/process", methods=["POST"])
-def process_data():
-    """데이터 처리 API"""
-    file_path = request.json.get("file_path")
+# 웹 API 통합 예시 (Flask는 웹 서버 실행 시에만 import)
+def _make_app():
+    """Flask 앱 생성"""
+    from flask import Flask, jsonify, request
     
-    if not file_path:
-        return jsonify({"error": "file_path 필수"}), 400
+    app = Flask(__name__)
+    warehouse_manager = WarehouseManager()
     
-    result = warehouse_manager.process_daily_data(file_path)
-    return jsonify(result)
-
-@app.route("/api/warehouse/health")
-def health_check():
-    """헬스체크 API"""
-    is_healthy = warehouse_manager.health_check()
-    return jsonify({"healthy": is_healthy}), 200 if is_healthy else 503
+    @app.route("/api/warehouse/status")
+    def get_status():
+        """시스템 상태 API"""
+        return jsonify(warehouse_manager.generate_dashboard_data())
+    
+    @app.route("/api/warehouse/process", methods=["POST"])
+    def process_data():
+        """데이터 처리 API"""
+        file_path = request.json.get("file_path")
+        
+        if not file_path:
+            return jsonify({"error": "file_path 필수"}), 400
+        
+        result = warehouse_manager.process_daily_data(file_path)
+        return jsonify(result)
+    
+    @app.route("/api/warehouse/health")
+    def health_check():
+        """헬스체크 API"""
+        is_healthy = warehouse_manager.health_check()
+        return jsonify({"healthy": is_healthy}), 200 if is_healthy else 503
+    
+    return app
 
 if __name__ == "__main__":
     # 배치 작업 실행
@@ -741,14 +1185,15 @@ if __name__ == "__main__":
         nightly_batch_job()
     else:
         # 웹 서버 실행
-        app.run(host="0.0.0.0", port=5000)
+        _make_app().run(host="0.0.0.0", port=5000)
 '''
         
         examples_dir = self.integration_path / "examples"
-        examples_dir.mkdir(exist_ok=True)
         
-        (examples_dir / "basic_usage.py").write_text(basic_example, encoding='utf-8')
-        (examples_dir / "advanced_usage.py").write_text(advanced_example, encoding='utf-8')
+        return [
+            (examples_dir / "basic_usage.py", basic_example),
+            (examples_dir / "advanced_usage.py", advanced_example),
+        ]
     
     def run_test(self) -> bool:
         """2단계: 통합 테스트 (1분)"""
@@ -779,200 +1224,27 @@ if __name__ == "__main__":
         print("🎯 HVDC 통합 마무리...")
         
         try:
-            # 1. 환경 변수 설정 스크립트 생성
-            env_script = f'''
-# HVDC 환경 설정 (bashrc 또는 환경 설정에 추가)
-export HVDC_PATH="{self.hvdc_path}"
-export HVDC_INTEGRATION_PATH="{self.integration_path}"
-export PYTHONPATH="$PYTHONPATH:{self.integration_path}"
-'''
-            
             env_file = self.integration_path / "setup_env.sh"
-            env_file.write_text(env_script, encoding='utf-8')
-            env_file.chmod(0o755)
-            
-            # 2. 빠른 시작 스크립트 생성
-            quick_start = f'''#!/usr/bin/env python3
-"""
-HVDC 빠른 시작 스크립트
-===================
-
-기존 시스템에서 바로 사용할 수 있는 원라이너
-"""
-
-import sys
-from pathlib import Path
-
-# HVDC 통합 경로 자동 추가
-integration_path = Path(__file__).parent
-if str(integration_path) not in sys.path:
-    sys.path.insert(0, str(integration_path))
-
-# HVDC 모듈 임포트
-import hvdc_quick
-
-def demo():
-    """데모 실행"""
-    print("🚀 HVDC 빠른 통합 데모")
-    print("=" * 40)
-    
-    # 시스템 상태 확인
-    status = hvdc_quick.get_status()
-    print(f"시스템 준비: {{'✅' if status['processor_ready'] else '❌'}}")
-    print(f"버전: {{status['version']}}")
-    
-    # 샘플 테스트
-    test_result = hvdc_quick.quick_test()
-    print(f"테스트 결과: {{'✅' if test_result.get('sample_data_test') else '❌'}}")
-    
-    print("\\n📋 사용법:")
-    print("1. import hvdc_quick")
-    print("2. data = hvdc_quick.load_data('file.xlsx')")
-    print("3. report = hvdc_quick.generate_report(data, 'report.xlsx')")
-    
-    return status['processor_ready']
-
-if __name__ == "__main__":
-    demo()
-'''
-            
             quick_start_file = self.integration_path / "quick_start.py"
-            quick_start_file.write_text(quick_start, encoding='utf-8')
-            quick_start_file.chmod(0o755)
+            readme_file = self.integration_path / "README.md"
+            template_vars = {
+                "hvdc_path": self.hvdc_path,
+                "integration_path": self.integration_path,
+                "env_file": env_file,
+                "quick_start_file": quick_start_file,
+                "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            }
             
-            # 3. README 생성
-            readme_content = f'''# HVDC 빠른 모듈 통합 완료! 🎉
-
-## 📋 설정 완료 내용
-
-✅ 통합 모듈 생성: `hvdc_quick`
-✅ 테스트 스크립트: `test_integration.py`
-✅ 사용 예시: `examples/` 폴더
-✅ 빠른 시작: `quick_start.py`
-
-## 🚀 즉시 사용법 (30초)
-
-### 방법 1: 직접 임포트
-```python
-import sys
-sys.path.insert(0, "{self.integration_path}")
-
-import hvdc_quick
-
-# 데이터 처리
-result = hvdc_quick.process_warehouse_data("warehouse.xlsx")
-print(f"처리 완료: {{result['rows']}} 행")
-
-# 보고서 생성
-report = hvdc_quick.generate_report(result["data"], "report.xlsx")
-```
-
-### 방법 2: 원라이너
-```python
-exec(open("{quick_start_file}").read())
-```
-
-### 방법 3: 환경 설정 후 사용
-```bash
-# 환경 설정 (한 번만)
-source {env_file}
-
-# Python에서 바로 사용
-python -c "import hvdc_quick; print(hvdc_quick.get_status())"
-```
-
-## 📊 기능 목록
-
-| 함수 | 기능 | 사용법 |
-|------|------|--------|
-| `quick_load()` | 데이터 로드 | `df = hvdc_quick.quick_load("file.xlsx")` |
-| `quick_report()` | 보고서 생성 | `path = hvdc_quick.quick_report(df, "report.xlsx")` |
-| `quick_inventory()` | 재고 계산 | `inv = hvdc_quick.quick_inventory(df)` |
-| `process_warehouse_data()` | 통합 처리 | `result = hvdc_quick.process_warehouse_data("file.xlsx")` |
-| `get_status()` | 상태 확인 | `status = hvdc_quick.get_status()` |
-
-## 🔧 문제 해결
-
-**Q: ImportError 발생**
-```bash
-# 해결책
-export PYTHONPATH="$PYTHONPATH:{self.integration_path}"
-python quick_start.py
-```
-
-**Q: 모듈 초기화 실패**
-```bash
-# 해결책
-cd {self.hvdc_path}
-pip install -r requirements.txt
-python {quick_start_file}
-```
-
-**Q: 파일 경로 오류**
-```python
-# 해결책: 절대 경로 사용
-import os
-file_path = os.path.abspath("warehouse.xlsx")
-result = hvdc_quick.process_warehouse_data(file_path)
-```
-
-## 📱 실제 사용 시나리오
-
-### ERP 시스템 통합
-```python
-# your_erp_system.py에 추가
-import sys
-sys.path.insert(0, "{self.integration_path}")
-import hvdc_quick
-
-def daily_sync():
-    result = hvdc_quick.process_warehouse_data("daily_export.xlsx")
-    if result["success"]:
-        update_erp_database(result["data"])
-```
-
-### 웹 대시보드 연동
-```python
-# dashboard.py
-import hvdc_quick
-
-@app.route("/api/warehouse/data")
-def get_warehouse_data():
-    status = hvdc_quick.get_status()
-    return jsonify(status)
-```
-
-### 배치 작업 통합
-```python
-# batch_job.py
-import hvdc_quick
-
-def nightly_processing():
-    result = hvdc_quick.process_file("warehouse.xlsx", generate_report=True)
-    return result["success"]
-```
-
-## 📈 성능 정보
-
-- **처리 속도**: <1초 (5,000행 기준)
-- **메모리 사용**: ~50MB
-- **파일 크기**: 최대 100MB Excel 지원
-- **동시 실행**: 가능 (스레드 안전)
-
-## 🎯 다음 단계
-
-1. `examples/basic_usage.py` 실행해보기
-2. 기존 시스템에 통합 코드 추가
-3. 필요시 `examples/advanced_usage.py` 참고
-
----
-**생성 시간**: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
-**HVDC 버전**: 0.5.1-quick
-**통합 완료**: ✅
-'''
+            # 1. 환경 변수 설정 스크립트 / 2. 빠른 시작 스크립트 / 3. README 생성
+            env_script = _ENV_SCRIPT_TMPL.substitute(template_vars)
+            quick_start = _QUICK_START_TMPL.substitute(template_vars)
+            readme_content = _README_TMPL.substitute(template_vars)
             
-            readme_file = self.integration_path / "README.md"
-            readme_file.write_text(readme_content, encoding='utf-8')
+            self._write_files([
+                (env_file, env_script),
+                (quick_start_file, quick_start),
+                (readme_file, readme_content),
+            ], executable={env_file, quick_start_file})
             
             # 4. 상태 업데이트
             self.status["ready"] = True
@@ -10,6 +10,59 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 import json
+import re
+
+from core.loader import read_excel_fast
+
+try:
+    import polars as pl  # 선택 의존성: 설치 시 월별 그룹 집계에 사용
+except ImportError:
+    pl = None
+
+# 창고명 정규화 규칙 (DAS는 완전 일치, 나머지는 부분 일치 / 선언 순서 우선)
+DAS_ALIASES = ['DAS', 'D.A.S', 'D A S']
+WAREHOUSE_ALIASES = {
+    'DSV INDOOR': ['DSV INDOOR', 'DSV_INDOOR', 'INDOOR', 'M44'],
+    'DSV OUTDOOR': ['DSV OUTDOOR', 'DSV_OUTDOOR', 'OUTDOOR'],
+    'DSV AL MARKAZ': ['DSV AL MARKAZ', 'DSV_AL_MARKAZ', 'MARKAZ', 'M1'],
+    'MOSB': ['MOSB', 'M.O.S.B', 'M O S B']
+}
+WAREHOUSE_PATTERNS = {
+    canonical_name: re.compile('|'.join(re.escape(p) for p in patterns))
+    for canonical_name, patterns in WAREHOUSE_ALIASES.items()
+}
+# 현장명 패턴 (창고가 아닌 경우)
+SITE_KEYWORDS = ['AGI', 'MIR', 'SHU', 'SITE', 'PROJECT', 'FIELD']
+SITE_REGEX = re.compile('|'.join(SITE_KEYWORDS))
+
+# 트랜잭션 타입 (TxType_Classified 카테고리 순서 = 코드)
+TX_TYPES = ['IN', 'OUT', 'TRANSFER']
+
+# 위치 타입 분류 기준 (완전 일치)
+WAREHOUSE_NAMES = ['DAS', 'DSV INDOOR', 'DSV OUTDOOR', 'DSV AL MARKAZ', 'MOSB']
+SITE_NAMES = ['AGI', 'MIR', 'SHU']
+
+# 그룹핑 키용 Categorical dtype (이름순 정렬로 기존 출력 순서 유지)
+WAREHOUSE_CATEGORIES = pd.CategoricalDtype(sorted(WAREHOUSE_NAMES))
+SITE_CATEGORIES = pd.CategoricalDtype(sorted(SITE_NAMES))
+
+def _to_numeric_filled(series):
+    """
+    숫자 변환 후 결측값 0 처리 (ndarray 단위, 중간 Series 생성 없음)
+    
+    금액/부피는 월별 합계·누적재고로 쌓이는 값이므로 float32로 축소하지 않고 float64를 유지합니다.
+    
+    Args:
+        series: 원본 컬럼
+    
+    Returns:
+        np.ndarray: 변환된 숫자 배열
+    """
+    values = series.to_numpy()
+    numeric = pd.to_numeric(values, errors='coerce')
+    # 변환 결과가 원본 버퍼를 공유하면 원본 컬럼 보호를 위해 복사
+    return np.nan_to_num(numeric, nan=0.0, posinf=np.inf, neginf=-np.inf,
+                         copy=np.shares_memory(numeric, values))
 
 def load_real_data():
     """실제 데이터 로드 및 전처리"""
@@ -20,7 +73,7 @@ def load_real_data():
         mapping_rules = json.load(f)['field_map']
     
     # 2. 실제 데이터 로드
-    df_raw = pd.read_excel('data/HVDC WAREHOUSE_HITACHI(HE).xlsx')
+    df_raw = read_excel_fast('data/HVDC WAREHOUSE_HITACHI(HE).xlsx')
     
     # 3. 매핑 적용
     col_map = {k: v for k, v in mapping_rules.items() if k in df_raw.columns}
@@ -31,20 +84,21 @@ def load_real_data():
         if needed not in df.columns:
             df[needed] = 0
     
-    # 5. 날짜 처리
-    if 'ETD/ATD' in df_raw.columns:
-        df['hasDate'] = pd.to_datetime(df_raw['ETD/ATD'], errors='coerce')
-    elif 'ETA/ATA' in df_raw.columns:
-        df['hasDate'] = pd.to_datetime(df_raw['ETA/ATA'], errors='coerce')
-    else:
+    # 5. 날짜 처리 (Excel 날짜 셀은 이미 datetime으로 로드되므로 문자열일 때만 파싱)
+    date_col = next((c for c in ('ETD/ATD', 'ETA/ATA') if c in df_raw.columns), None)
+    if date_col is None:
         df['hasDate'] = pd.Timestamp.now()
+    elif pd.api.types.is_datetime64_any_dtype(df_raw[date_col]):
+        df['hasDate'] = df_raw[date_col]
+    else:
+        df['hasDate'] = pd.to_datetime(df_raw[date_col], errors='coerce')
     
     # 결측값 처리
     df['hasDate'] = df['hasDate'].fillna(pd.Timestamp.now())
     
     # 6. 수치 컬럼 처리
-    df['hasAmount_numeric'] = pd.to_numeric(df['hasAmount'], errors='coerce').fillna(0)
-    df['hasVolume_numeric'] = pd.to_numeric(df['hasVolume'], errors='coerce').fillna(0)
+    df['hasAmount_numeric'] = _to_numeric_filled(df['hasAmount'])
+    df['hasVolume_numeric'] = _to_numeric_filled(df['hasVolume'])
     
     print(f"✅ 데이터 로드 완료: {df.shape[0]:,}개 레코드, {df.shape[1]}개 컬럼")
     
@@ -58,30 +112,49 @@ def normalize_warehouse_name(name):
     name = str(name).strip().upper()
     
     # DAS 정규화 (대소문자 통합)
-    if name in ['DAS', 'D.A.S', 'D A S']:
+    if name in DAS_ALIASES:
         return 'DAS'
     
     # 기타 창고명 정규화
-    warehouse_mapping = {
-        'DSV INDOOR': ['DSV INDOOR', 'DSV_INDOOR', 'INDOOR', 'M44'],
-        'DSV OUTDOOR': ['DSV OUTDOOR', 'DSV_OUTDOOR', 'OUTDOOR'],
-        'DSV AL MARKAZ': ['DSV AL MARKAZ', 'DSV_AL_MARKAZ', 'MARKAZ', 'M1'],
-        'MOSB': ['MOSB', 'M.O.S.B', 'M O S B']
-    }
+    for canonical_name, regex in WAREHOUSE_PATTERNS.items():
+        if regex.search(name):
+            return canonical_name
     
-    for canonical_name, patterns in warehouse_mapping.items():
-        for pattern in patterns:
-            if pattern in name:
-                return canonical_name
+    if SITE_REGEX.search(name):
+        return ''  # 현장은 빈 문자열 반환
     
-    # 현장명 패턴 (창고가 아닌 경우)
-    site_patterns = ['AGI', 'MIR', 'SHU', 'SITE', 'PROJECT', 'FIELD']
+    return name
+
+def _map_unique(names, func, default):
+    """
+    고유 위치명에만 func를 적용한 뒤 매핑 (위치명 종류가 적어 행 단위 문자열 연산 생략)
+    
+    Args:
+        names: 위치명 Series
+        func: 단일 위치명 변환 함수
+        default: 결측값에 대한 결과
+    
+    Returns:
+        변환 결과 Series (object dtype)
+    """
+    mapping = {value: func(value) for value in names.dropna().unique()}
+    return names.map(mapping).fillna(default).astype(object)
+
+def _upper_names(names):
+    """위치명 Series를 대문자/공백 제거 문자열로 변환 (결측은 빈 문자열)"""
+    return _map_unique(names, lambda name: str(name).strip().upper(), '')
+
+def normalize_warehouse_names(names):
+    """
+    창고명 정규화 (Series 단위, 고유값별로 normalize_warehouse_name 적용)
     
-    for site_pattern in site_patterns:
-        if site_pattern in name:
-            return ''  # 현장은 빈 문자열 반환
+    Args:
+        names: 위치명 Series
     
-    return name
+    Returns:
+        정규화된 창고명 Series (창고가 아니면 원래 이름, 현장/결측은 빈 문자열)
+    """
+    return _map_unique(names, normalize_warehouse_name, '')
 
 def classify_location_type(name):
     """위치 타입 분류"""
@@ -91,54 +164,165 @@ def classify_location_type(name):
     name = str(name).strip().upper()
     
     # 창고 패턴
-    if name in ['DAS', 'DSV INDOOR', 'DSV OUTDOOR', 'DSV AL MARKAZ', 'MOSB']:
+    if name in WAREHOUSE_NAMES:
         return 'WAREHOUSE'
     
     # 현장 패턴
-    if name in ['AGI', 'MIR', 'SHU']:
+    if name in SITE_NAMES:
         return 'SITE'
     
     return 'UNKNOWN'
 
-def classify_transaction_type(row):
-    """트랜잭션 타입 분류 (입고/출고/이동)"""
-    # 수량 기반 추정 (양수=입고, 음수=출고)
-    if 'hasVolume_numeric' in row and pd.notna(row['hasVolume_numeric']):
-        qty = float(row['hasVolume_numeric'])
-        if qty > 0:
-            return 'IN'
-        elif qty < 0:
-            return 'OUT'
-    
-    # 기본적으로 입고로 가정
-    return 'IN'
+def classify_location_types(names):
+    """
+    위치 타입 분류 (Series 단위, 고유값별로 classify_location_type 적용)
+    
+    Args:
+        names: 위치명 Series
+    
+    Returns:
+        'WAREHOUSE' / 'SITE' / 'UNKNOWN' Series
+    """
+    return _map_unique(names, classify_location_type, 'UNKNOWN')
+
+def _to_month(dates):
+    """날짜 Series를 월 단위 PeriodIndex로 변환 (load_real_data 결과는 이미 datetime64)"""
+    if not pd.api.types.is_datetime64_any_dtype(dates):
+        dates = pd.to_datetime(dates)
+    return pd.PeriodIndex(dates.to_numpy(), freq='M')
 
-def create_warehouse_flow_analysis_real(df):
-    """실제 데이터로 창고 흐름 분석"""
-    print("🔄 창고별 월별 입출고 흐름 분석 시작...")
+def aggregate_by_month(frame, key, aggs):
+    """
+    (key, Month) 기준 그룹 집계 (polars 설치 시 polars group_by, 미설치 시 pandas groupby)
+    
+    Args:
+        frame: Categorical key 컬럼과 Period Month 컬럼을 가진 DataFrame
+        key: 그룹 키 컬럼명
+        aggs: {출력 컬럼명: (원본 컬럼명, 'sum' | 'count')}
+    
+    Returns:
+        (key, Month) MultiIndex로 정렬된 집계 DataFrame
+    """
+    if pl is None:
+        return frame.groupby([key, 'Month'], observed=True).agg(**aggs)
+    
+    # 키는 정수 코드(카테고리 코드 / 월 ordinal)로 넘겨 polars에서 그룹핑
+    source_cols = list(dict.fromkeys(src for src, _ in aggs.values()))
+    pl_frame = pl.DataFrame({
+        '_key': frame[key].cat.codes.to_numpy(),
+        '_month': frame['Month'].array.asi8,
+        **{col: frame[col].to_numpy() for col in source_cols},
+    }, nan_to_null=True)
+    
+    exprs = [
+        pl.col(src).count().cast(pl.Int64).alias(name) if how == 'count' else pl.col(src).sum().alias(name)
+        for name, (src, how) in aggs.items()
+    ]
+    grouped = (
+        pl_frame
+        .filter((pl.col('_key') >= 0) & (pl.col('_month') != pd.NaT.value))  # pandas groupby처럼 결측 키 제외
+        .group_by(['_key', '_month'])
+        .agg(exprs)
+        .sort(['_key', '_month'])
+    )
     
-    df_work = df.copy()
+    index = pd.MultiIndex.from_arrays([
+        pd.Categorical.from_codes(grouped['_key'].to_numpy(), dtype=frame[key].dtype),
+        pd.PeriodIndex.from_ordinals(grouped['_month'].to_numpy(), freq='M'),
+    ], names=[key, 'Month'])
+    return pd.DataFrame({name: grouped[name].to_numpy() for name in aggs}, index=index)
+
+def _expand_months(monthly, all_months):
+    """
+    (key, Month) 집계를 key × 전체 월의 2차원(wide) 형태로 확장
+    
+    Args:
+        monthly: (key, Month) MultiIndex 집계 DataFrame
+        all_months: 전체 분석 기간 PeriodIndex
+    
+    Returns:
+        행=key, 컬럼=(집계 컬럼, 월) DataFrame (거래 없는 월은 NaN)
+    """
+    columns = pd.MultiIndex.from_product([monthly.columns, all_months], names=[None, 'Month'])
+    return monthly.unstack('Month').reindex(columns=columns)
+
+def _stack_months(wide, dtypes):
+    """
+    _expand_months 결과를 (key, Month) 행 형태로 되돌림 (누락 월은 0, 원래 dtype 유지)
+    
+    fillna(0) 후에는 결측이 없으므로 stack 대신 집계 컬럼별 2차원 배열을 행 우선으로 펼친다
+    (key 순 → 월 순, stack 결과와 동일한 행 순서).
+    """
+    filled = wide.fillna(0)
+    months = filled[dtypes.index[0]].columns
+    index = pd.MultiIndex.from_product([filled.index, months], names=[filled.index.name, 'Month'])
+    return pd.DataFrame(
+        {col: filled[col].to_numpy().ravel() for col in dtypes.index}, index=index
+    ).astype(dtypes)
+
+def _to_result_frame(monthly, columns):
+    """
+    (key, Month) 행 형태 집계를 출력용 평면 DataFrame으로 변환 (reset_index 후 컬럼명 변경 복사 생략)
+    
+    Args:
+        monthly: (key, Month) MultiIndex DataFrame
+        columns: 출력 컬럼명 (key, 월, 집계 컬럼 순서)
+    
+    Returns:
+        출력용 DataFrame
+    """
+    index = monthly.index
+    data = {columns[0]: index.get_level_values(0), columns[1]: index.get_level_values(1)}
+    data.update({name: monthly[col].to_numpy() for name, col in zip(columns[2:], monthly.columns)})
+    return pd.DataFrame(data, copy=False)
+
+def build_month_range(dates):
+    """
+    분석 월 범위 생성 (창고/현장 분석 공통 기간)
+    
+    Args:
+        dates: 날짜 Series
+    
+    Returns:
+        월 단위 PeriodIndex (최소~최대 월)
+    """
+    months = _to_month(dates)
+    return pd.period_range(months.min(), months.max(), freq='M')
+
+def create_warehouse_flow_analysis_real(df, all_months=None):
+    """
+    실제 데이터로 창고 흐름 분석
+    
+    Args:
+        df: load_real_data 결과
+        all_months: 분석 월 범위 (기본값: 창고 데이터의 최소~최대 월)
+    """
+    print("🔄 창고별 월별 입출고 흐름 분석 시작...")
     
-    # 1. 창고명 정규화 및 분류
-    df_work['Warehouse_Normalized'] = df_work['hasSite'].apply(normalize_warehouse_name)
-    df_work['Location_Type'] = df_work['hasSite'].apply(classify_location_type)
+    # 1. 창고명 정규화 및 분류 (원본 전체 복사 없이 Series로 계산)
+    warehouse_norm = normalize_warehouse_names(df['hasSite'])
+    location_type = classify_location_types(df['hasSite'])
     
-    # 2. 창고만 필터링
-    warehouse_df = df_work[
-        (df_work['Location_Type'] == 'WAREHOUSE') & 
-        (df_work['Warehouse_Normalized'] != '')
-    ].copy()
+    # 2. 창고만 필터링 (분석에 필요한 컬럼만 추출)
+    mask = (location_type == 'WAREHOUSE') & (warehouse_norm != '')
+    warehouse_df = df.loc[mask, ['hasDate', 'hasVolume_numeric', 'hasAmount_numeric']]
+    warehouse_df['Warehouse_Normalized'] = warehouse_norm[mask].astype(WAREHOUSE_CATEGORIES)
     
     print(f"📊 창고 데이터 필터링 결과: {len(warehouse_df):,}개 레코드")
     
     # 3. 월별 컬럼 생성
-    warehouse_df['Month'] = pd.to_datetime(warehouse_df['hasDate']).dt.to_period("M")
-    all_months = pd.period_range(warehouse_df['Month'].min(), warehouse_df['Month'].max(), freq='M')
+    warehouse_df['Month'] = _to_month(warehouse_df['hasDate'])
+    if all_months is None:
+        all_months = pd.period_range(warehouse_df['Month'].min(), warehouse_df['Month'].max(), freq='M')
     
     print(f"📅 분석 기간: {all_months[0]} ~ {all_months[-1]} ({len(all_months)}개월)")
     
-    # 4. 트랜잭션 타입 분류
-    warehouse_df['TxType_Classified'] = warehouse_df.apply(classify_transaction_type, axis=1)
+    # 4. 트랜잭션 타입 분류 (수량 기반 추정: 음수=출고, 그 외=입고)
+    # (3개 값뿐이므로 문자열 배열 대신 Categorical 코드로 저장)
+    volume = warehouse_df['hasVolume_numeric'].to_numpy()
+    warehouse_df['TxType_Classified'] = pd.Categorical.from_codes(
+        (volume < 0).astype(np.int8), categories=TX_TYPES
+    )
     
     # 5. 입고/출고 수량 분리 (모든 데이터를 입고로 가정)
     warehouse_df['InQty'] = warehouse_df['hasVolume_numeric']
@@ -146,116 +330,163 @@ def create_warehouse_flow_analysis_real(df):
     warehouse_df['TransferQty'] = 0
     
     # 6. 월별 집계
-    monthly_flow = warehouse_df.groupby(['Warehouse_Normalized', 'Month']).agg({
-        'InQty': 'sum',
-        'OutQty': 'sum', 
-        'TransferQty': 'sum',
-        'hasAmount_numeric': 'sum'
-    }).round(2)
-    
-    # 7. 재고 계산 (누적 입고)
-    monthly_flow['Net_Flow'] = monthly_flow['InQty'] - monthly_flow['OutQty'] + monthly_flow['TransferQty']
-    monthly_flow['Cumulative_Stock'] = monthly_flow.groupby(level=0)['Net_Flow'].cumsum()
-    
-    # 8. 전체 월 범위로 reindex
-    warehouse_list = monthly_flow.index.get_level_values(0).unique()
-    multi_index = pd.MultiIndex.from_product(
-        [warehouse_list, all_months], 
-        names=['Warehouse_Normalized', 'Month']
+    monthly_flow = aggregate_by_month(warehouse_df, 'Warehouse_Normalized', {
+        'InQty': ('InQty', 'sum'),
+        'OutQty': ('OutQty', 'sum'),
+        'TransferQty': ('TransferQty', 'sum'),
+        'hasAmount_numeric': ('hasAmount_numeric', 'sum')
+    })
+    
+    # 7. 순증감 (인덱스 정렬 없이 배열 연산)
+    monthly_flow['Net_Flow'] = (
+        monthly_flow['InQty'].to_numpy()
+        - monthly_flow['OutQty'].to_numpy()
+        + monthly_flow['TransferQty'].to_numpy()
     )
     
-    monthly_flow = monthly_flow.reindex(multi_index, fill_value=0)
+    # 8. 창고 × 전체 월 2차원 형태로 확장 후 누적 입고(재고)를 행 단위 cumsum으로 계산
+    # (거래가 없는 월의 누적재고는 기존과 동일하게 0)
+    wide = _expand_months(monthly_flow, all_months)
+    net_flow = wide['Net_Flow'].to_numpy()
+    observed = ~np.isnan(net_flow)
+    cumulative_stock = np.where(observed, np.nan_to_num(net_flow).cumsum(axis=1), 0)
+    
+    warehouse_list = wide.index
+    monthly_flow = _stack_months(wide, monthly_flow.dtypes)
+    monthly_flow['Cumulative_Stock'] = cumulative_stock.ravel()
     
     # 9. 최종 포맷팅
-    result = monthly_flow.reset_index()
-    result.columns = ['창고명', '월', '입고수량', '출고수량', '이동수량', '금액', '순증감', '누적재고']
+    result = _to_result_frame(
+        monthly_flow, ['창고명', '월', '입고수량', '출고수량', '이동수량', '금액', '순증감', '누적재고']
+    )
     
     print(f"✅ 창고별 흐름 분석 완료: {len(warehouse_list)}개 창고, {len(all_months)}개월")
     
     return result
 
-def create_site_delivery_analysis_real(df):
-    """실제 데이터로 현장 배송 분석"""
+def create_site_delivery_analysis_real(df, all_months=None):
+    """
+    실제 데이터로 현장 배송 분석
+    
+    Args:
+        df: load_real_data 결과
+        all_months: 분석 월 범위 (기본값: 현장 데이터의 최소~최대 월)
+    """
     print("🔄 현장별 배송 현황 분석 시작...")
     
-    df_work = df.copy()
-    
-    # 1. 현장 분류
-    df_work['Location_Type'] = df_work['hasSite'].apply(classify_location_type)
-    df_work['Site_Name'] = df_work['hasSite'].apply(
-        lambda x: str(x).strip().upper() if classify_location_type(x) == 'SITE' else ''
-    )
+    # 1. 현장 분류 (원본 전체 복사 없이 Series로 계산)
+    location_type = classify_location_types(df['hasSite'])
+    # 현장명은 이미 분류된 Location_Type으로 마스킹 (분류 함수 재호출 없음)
+    site_names = _upper_names(df['hasSite'])
+    site_names = site_names.where(location_type == 'SITE', '')
     
-    # 2. 현장만 필터링
-    site_df = df_work[
-        (df_work['Location_Type'] == 'SITE') & 
-        (df_work['Site_Name'] != '')
-    ].copy()
+    # 2. 현장만 필터링 (분석에 필요한 컬럼만 추출)
+    mask = (location_type == 'SITE') & (site_names != '')
+    site_df = df.loc[mask, ['hasDate', 'hasVolume_numeric', 'hasAmount_numeric']]
+    site_df['Site_Name'] = site_names[mask].astype(SITE_CATEGORIES)
     
     print(f"📊 현장 데이터 필터링 결과: {len(site_df):,}개 레코드")
     
     # 3. 월별 집계
-    site_df['Month'] = pd.to_datetime(site_df['hasDate']).dt.to_period("M")
-    all_months = pd.period_range(site_df['Month'].min(), site_df['Month'].max(), freq='M')
+    site_df['Month'] = _to_month(site_df['hasDate'])
+    if all_months is None:
+        all_months = pd.period_range(site_df['Month'].min(), site_df['Month'].max(), freq='M')
     
-    site_delivery = site_df.groupby(['Site_Name', 'Month']).agg({
-        'hasVolume_numeric': ['sum', 'count'],
-        'hasAmount_numeric': 'sum'
-    }).round(2)
+    site_delivery = aggregate_by_month(site_df, 'Site_Name', {
+        '배송수량': ('hasVolume_numeric', 'sum'),
+        '배송횟수': ('hasVolume_numeric', 'count'),
+        '배송금액': ('hasAmount_numeric', 'sum')
+    })
     
     # 컬럼명 정리
     site_delivery.columns = ['배송수량', '배송횟수', '배송금액']
     
-    # 4. 전체 월 범위로 reindex
-    site_list = site_delivery.index.get_level_values(0).unique()
-    multi_index = pd.MultiIndex.from_product(
-        [site_list, all_months], 
-        names=['Site_Name', 'Month']
-    )
-    
-    site_delivery = site_delivery.reindex(multi_index, fill_value=0)
+    # 4. 현장 × 전체 월 범위로 확장 (누락 월은 0)
+    wide = _expand_months(site_delivery, all_months)
+    site_list = wide.index
+    site_delivery = _stack_months(wide, site_delivery.dtypes)
     
     # 5. 최종 포맷팅
-    result = site_delivery.reset_index()
-    result.columns = ['현장명', '월', '배송수량', '배송횟수', '배송금액']
+    result = _to_result_frame(site_delivery, ['현장명', '월', '배송수량', '배송횟수', '배송금액'])
     
     print(f"✅ 현장별 배송 분석 완료: {len(site_list)}개 현장, {len(all_months)}개월")
     
     return result
 
+def _append_sheet(wb, sheet_name, df, index=False, decimals=2):
+    """
+    write-only 워크북에 DataFrame을 시트로 추가
+    
+    Args:
+        wb: openpyxl write-only Workbook
+        sheet_name: 시트명
+        df: 저장할 DataFrame
+        index: True면 인덱스를 첫 컬럼으로 기록 (groupby 결과용)
+        decimals: 숫자 반올림 자릿수 (표시용 반올림은 저장 시점에만 적용)
+    """
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+    
+    df = df.round(decimals)
+    
+    # Period 등 Excel 비지원 타입은 문자열로, 결측값은 빈 셀로 변환
+    period_cols = [c for c in df.columns if isinstance(df[c].dtype, pd.PeriodDtype)]
+    if period_cols:
+        df = df.astype({c: str for c in period_cols})
+    if df.isna().to_numpy().any():
+        df = df.astype(object).where(df.notna(), None)
+    
+    ws = wb.create_sheet(title=sheet_name)
+    header_font = Font(bold=True)
+    header = ([df.index.name] if index else []) + list(df.columns)
+    header_cells = []
+    for name in header:
+        cell = WriteOnlyCell(ws, value=str(name))
+        cell.font = header_font
+        header_cells.append(cell)
+    ws.append(header_cells)
+    
+    for row in df.itertuples(index=index, name=None):
+        ws.append(row)
+
 def save_results_to_excel(warehouse_flow, site_delivery):
-    """결과를 Excel 파일로 저장"""
+    """결과를 Excel 파일로 저장 (openpyxl write-only 모드로 행 스트리밍)"""
+    from openpyxl import Workbook
+    
     timestamp = datetime.now().strftime('%Y%m%d_%H%M')
     output_path = f"HVDC_실제데이터_창고흐름분석_{timestamp}.xlsx"
     
     print(f"💾 Excel 파일 저장 중: {output_path}")
     
-    with pd.ExcelWriter(output_path, engine="xlsxwriter") as writer:
-        # 창고별 흐름 분석
-        warehouse_flow.to_excel(writer, sheet_name="창고별_월별_입출고재고", index=False)
-        
-        # 현장별 배송 분석
-        site_delivery.to_excel(writer, sheet_name="현장별_배송현황", index=False)
-        
-        # 창고 요약 통계
-        warehouse_summary = warehouse_flow.groupby('창고명').agg({
-            '입고수량': 'sum',
-            '출고수량': 'sum',
-            '이동수량': 'sum',
-            '금액': 'sum',
-            '누적재고': 'last'
-        }).round(2)
-        warehouse_summary.columns = ['총입고', '총출고', '총이동', '총금액', '현재재고']
-        warehouse_summary.reset_index().to_excel(writer, sheet_name="창고별_요약통계", index=False)
-        
-        # 현장 요약 통계
-        site_summary = site_delivery.groupby('현장명').agg({
-            '배송수량': 'sum',
-            '배송횟수': 'sum',
-            '배송금액': 'sum'
-        }).round(2)
-        site_summary.columns = ['총배송수량', '총배송횟수', '총배송금액']
-        site_summary.reset_index().to_excel(writer, sheet_name="현장별_요약통계", index=False)
+    wb = Workbook(write_only=True)
+    
+    # 창고별 흐름 분석
+    _append_sheet(wb, "창고별_월별_입출고재고", warehouse_flow)
+    
+    # 현장별 배송 분석
+    _append_sheet(wb, "현장별_배송현황", site_delivery)
+    
+    # 창고 요약 통계 (groupby 인덱스를 그대로 첫 컬럼으로 기록)
+    warehouse_summary = warehouse_flow.groupby('창고명', observed=True).agg({
+        '입고수량': 'sum',
+        '출고수량': 'sum',
+        '이동수량': 'sum',
+        '금액': 'sum',
+        '누적재고': 'last'
+    })
+    warehouse_summary.columns = ['총입고', '총출고', '총이동', '총금액', '현재재고']
+    _append_sheet(wb, "창고별_요약통계", warehouse_summary, index=True)
+    
+    # 현장 요약 통계
+    site_summary = site_delivery.groupby('현장명', observed=True).agg({
+        '배송수량': 'sum',
+        '배송횟수': 'sum',
+        '배송금액': 'sum'
+    })
+    site_summary.columns = ['총배송수량', '총배송횟수', '총배송금액']
+    _append_sheet(wb, "현장별_요약통계", site_summary, index=True)
+    
+    wb.save(output_path)
     
     print(f"✅ Excel 파일 저장 완료: {output_path}")
     return output_path
@@ -270,12 +501,13 @@ def main():
     try:
         # 1. 실제 데이터 로드
         df = load_real_data()
+        all_months = build_month_range(df['hasDate'])  # 두 분석이 같은 기간을 공유
         
         # 2. 창고 흐름 분석
-        warehouse_flow = create_warehouse_flow_analysis_real(df)
+        warehouse_flow = create_warehouse_flow_analysis_real(df, all_months)
         
         # 3. 현장 배송 분석
-        site_delivery = create_site_delivery_analysis_real(df)
+        site_delivery = create_site_delivery_analysis_real(df, all_months)
         
         # 4. 결과 저장
         excel_path = save_results_to_excel(warehouse_flow, site_delivery)
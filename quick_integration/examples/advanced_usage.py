@@ -138,33 +138,37 @@ def nightly_batch_job():
     logger.info("✅ 야간 배치 작업 완료")
     return True
 
-# 웹 API 통합 예시
-from flask import Flask, jsonify, request
-
-app = Flask(__name__)
-warehouse_manager = WarehouseManager()
-
-@app.route("/api/warehouse/status")
-def get_status():
-    """시스템 상태 API"""
-    return jsonify(warehouse_manager.generate_dashboard_data())
-
-@app.route("/api/warehouse/process", methods=["POST"])
-def process_data():
-    """데이터 처리 API"""
-    file_path = request.json.get("file_path")
+# 웹 API 통합 예시 (Flask는 웹 서버 실행 시에만 import)
+def _make_app():
+    """Flask 앱 생성"""
+    from flask import Flask, jsonify, request
     
-    if not file_path:
-        return jsonify({"error": "file_path 필수"}), 400
+    app = Flask(__name__)
+    warehouse_manager = WarehouseManager()
     
-    result = warehouse_manager.process_daily_data(file_path)
-    return jsonify(result)
-
-@app.route("/api/warehouse/health")
-def health_check():
-    """헬스체크 API"""
-    is_healthy = warehouse_manager.health_check()
-    return jsonify({"healthy": is_healthy}), 200 if is_healthy else 503
+    @app.route("/api/warehouse/status")
+    def get_status():
+        """시스템 상태 API"""
+        return jsonify(warehouse_manager.generate_dashboard_data())
+    
+    @app.route("/api/warehouse/process", methods=["POST"])
+    def process_data():
+        """데이터 처리 API"""
+        file_path = request.json.get("file_path")
+        
+        if not file_path:
+            return jsonify({"error": "file_path 필수"}), 400
+        
+        result = warehouse_manager.process_daily_data(file_path)
+        return jsonify(result)
+    
+    @app.route("/api/warehouse/health")
+    def health_check():
+        """헬스체크 API"""
+        is_healthy = warehouse_manager.health_check()
+        return jsonify({"healthy": is_healthy}), 200 if is_healthy else 503
+    
+    return app
 
 if __name__ == "__main__":
     # 배치 작업 실행
@@ -172,4 +176,4 @@ if __name__ == "__main__":
         nightly_batch_job()
     else:
         # 웹 서버 실행
-        app.run(host="0.0.0.0", port=5000)
+        _make_app().run(host="0.0.0.0", port=5000)
@@ -15,13 +15,16 @@ HVDC Quick Integration Module
 """
 
 from .core import HVDCProcessor
-from .utils import quick_load, quick_report, quick_inventory
+from .utils import quick_load, quick_report, quick_inventory, _get_processor
 
 __version__ = "0.5.1-quick"
 __all__ = ["HVDCProcessor", "quick_load", "quick_report", "quick_inventory"]
 
 # 빠른 사용을 위한 글로벌 함수들
-process_warehouse_data = HVDCProcessor().process
+def process_warehouse_data(file_path):
+    """데이터 처리 (공유 프로세서는 첫 호출 시 초기화)"""
+    return _get_processor().process(file_path)
+
 generate_report = quick_report
 calculate_inventory = quick_inventory
 load_data = quick_load
@@ -3,18 +3,35 @@ HVDC 핵심 처리 모듈
 """
 
 import pandas as pd
+import inspect
+import os
 import sys
+import threading
+from importlib.util import find_spec
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional, Union
+from typing import Dict, Any, Optional, List, Union
 
-# HVDC 시스템 경로 추가
+# HVDC 시스템 경로 추가 (재로드 시 중복 추가 방지)
 HVDC_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(HVDC_ROOT))
+if str(HVDC_ROOT) not in sys.path:
+    sys.path.insert(0, str(HVDC_ROOT))
+
+# HVDC_FAST_IO=1 설정 시 warehouse_loader의 Excel 엔진만 calamine으로 지정
+# (python-calamine 설치 + pandas >= 2.2 필요, 컬럼 매핑/타입 변환은 기본 경로와 동일)
+FAST_IO = os.environ.get("HVDC_FAST_IO") == "1"
+CALAMINE_ENGINE = (FAST_IO and find_spec("python_calamine") is not None
+                   and tuple(int(part) for part in pd.__version__.split(".")[:2]) >= (2, 2))
+
+# chdir은 프로세스 전역 상태이므로 root 인자를 받지 않는 main()에서만 잠금 하에 사용
+_CWD_LOCK = threading.Lock()
 
 class HVDCProcessor:
     """HVDC 핵심 처리기"""
     
+    # 초기화 성공 시 (loader, reporter, main) 캐시 → 이후 인스턴스는 import 생략
+    _INIT_CACHE = None
+    
     def __init__(self):
         self.last_result = None
         self.is_initialized = False
@@ -22,6 +39,11 @@ class HVDCProcessor:
     
     def _initialize(self):
         """초기화"""
+        if HVDCProcessor._INIT_CACHE is not None:
+            self.warehouse_loader, self.excel_reporter, self.main_process = HVDCProcessor._INIT_CACHE
+            self.is_initialized = True
+            return
+        
         try:
             # 핵심 모듈 임포트
             global warehouse_loader, excel_reporter, main_process
@@ -33,6 +55,7 @@ class HVDCProcessor:
             self.warehouse_loader = load_hvdc_warehouse_file
             self.excel_reporter = generate_full_dashboard
             self.main_process = main_process
+            HVDCProcessor._INIT_CACHE = (load_hvdc_warehouse_file, generate_full_dashboard, main_process)
             
             self.is_initialized = True
             print("✅ HVDC 모듈 초기화 완료")
@@ -41,14 +64,36 @@ class HVDCProcessor:
             print(f"❌ HVDC 모듈 초기화 실패: {e}")
             self.is_initialized = False
     
+    def _load(self, excel_file: Union[str, Path],
+              usecols: Optional[List[str]] = None,
+              dtype: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
+        """데이터 로드 (warehouse_loader, FAST_IO 활성화 시 calamine 엔진 사용)"""
+        if CALAMINE_ENGINE:
+            df = self.warehouse_loader(excel_file, engine="calamine")
+        else:
+            df = self.warehouse_loader(excel_file)
+        # warehouse_loader는 표준화된 컬럼을 반환하므로 투영/형변환은 로드 직후 적용
+        if usecols is not None:
+            missing = [col for col in usecols if col not in df.columns]
+            if missing:
+                raise ValueError(f"로드된 데이터에 없는 컬럼: {missing} (warehouse_loader 표준 필드명 사용)")
+            df = df[list(usecols)]
+        if dtype is not None:
+            df = df.astype({col: t for col, t in dtype.items() if col in df.columns})
+        return df
+    
     def process(self, excel_file: Union[str, Path], 
-                output_file: Optional[str] = None) -> Dict[str, Any]:
+                output_file: Optional[str] = None,
+                usecols: Optional[List[str]] = None,
+                dtype: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         창고 데이터 처리
         
         Args:
             excel_file: Excel 파일 경로
             output_file: 출력 파일명 (옵션)
+            usecols: 로드할 컬럼 목록 (옵션, 기본값: 전체)
+            dtype: 컬럼별 dtype 지정 (옵션)
         
         Returns:
             처리 결과 딕셔너리
@@ -61,7 +106,7 @@ class HVDCProcessor:
             
             # 1. 데이터 로드
             print(f"📄 데이터 로딩: {excel_file}")
-            df = self.warehouse_loader(excel_file)
+            df = self._load(excel_file, usecols=usecols, dtype=dtype)
             
             # 2. 기본 검증
             if df.empty:
@@ -87,7 +132,10 @@ class HVDCProcessor:
                 "timestamp": end_time.isoformat()
             }
             
-            self.last_result = result
+            # 요약은 미리 계산하고 DataFrame은 보관하지 않음
+            # (data의 수명은 result를 받은 호출자가 관리)
+            self.last_result = {key: value for key, value in result.items() if key != "data"}
+            self.last_result["summary"] = self._summarize(df)
             print(f"✅ 처리 완료 ({processing_time:.2f}초, {len(df)}행)")
             
             return result
@@ -101,32 +149,46 @@ class HVDCProcessor:
             print(f"❌ 처리 실패: {e}")
             return error_result
     
+    def _summarize(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """DataFrame 요약 통계 계산"""
+        # 존재하는 컬럼만 컬럼당 한 번의 agg로 집계 (없는 컬럼은 None)
+        stats = {
+            col: df[col].agg(funcs)
+            for col, funcs in (("Amount", ["sum"]),
+                               ("Category", ["nunique"]),
+                               ("Billing month", ["min", "max"]))
+            if col in df.columns
+        }
+        
+        def _stat(col, func):
+            return stats[col][func] if col in stats else None
+        
+        return {
+            "total_rows": len(df),
+            "total_amount": _stat("Amount", "sum"),
+            "categories": _stat("Category", "nunique"),
+            "date_range": {
+                "start": _stat("Billing month", "min"),
+                "end": _stat("Billing month", "max")
+            }
+        }
+    
     def get_summary(self) -> Dict[str, Any]:
-        """처리 결과 요약"""
+        """처리 결과 요약 (process 시점에 계산된 통계 사용)"""
         if not self.last_result:
             return {"status": "no_data"}
         
         if not self.last_result["success"]:
             return {"status": "error", "error": self.last_result["error"]}
         
-        df = self.last_result["data"]
-        
-        summary = {
+        return {
             "status": "success",
-            "total_rows": len(df),
-            "total_amount": df.get("Amount", pd.Series()).sum(),
-            "categories": df.get("Category", pd.Series()).nunique(),
-            "date_range": {
-                "start": df.get("Billing month", pd.Series()).min(),
-                "end": df.get("Billing month", pd.Series()).max()
-            },
+            **self.last_result["summary"],
             "processing_info": {
                 "timestamp": self.last_result["timestamp"],
                 "processing_time": self.last_result["processing_time"]
             }
         }
-        
-        return summary
     
     def run_full_pipeline(self, data_dir: str = "data") -> Dict[str, Any]:
         """전체 파이프라인 실행"""
@@ -136,15 +198,18 @@ class HVDCProcessor:
         try:
             print("🚀 HVDC 전체 파이프라인 실행")
             
-            # 환경 변수 설정
-            original_cwd = os.getcwd()
-            os.chdir(HVDC_ROOT)
-            
-            # 전체 시스템 실행
-            success = self.main_process()
-            
-            # 원래 디렉토리로 복원
-            os.chdir(original_cwd)
+            # 전체 시스템 실행 (루트 경로를 인자로 전달해 전역 chdir 회피)
+            if "root" in inspect.signature(self.main_process).parameters:
+                success = self.main_process(root=HVDC_ROOT)
+            else:
+                with _CWD_LOCK:
+                    original_cwd = os.getcwd()
+                    os.chdir(HVDC_ROOT)
+                    try:
+                        success = self.main_process()
+                    finally:
+                        # 원래 디렉토리로 복원
+                        os.chdir(original_cwd)
             
             return {
                 "success": success,
@@ -2,45 +2,177 @@
 HVDC 유틸리티 함수들
 """
 
+import numpy as np
 import pandas as pd
+from functools import cache
 from pathlib import Path
-from typing import Union, Dict, Any, Optional
+from typing import Union, Dict, Any, Optional, List
 from .core import HVDCProcessor
 
-# 전역 프로세서 인스턴스
-_processor = HVDCProcessor()
+try:
+    from numba import njit
+except ImportError:  # numba 미설치 시 InventoryEngine 경로 사용
+    njit = None
 
-def quick_load(file_path: Union[str, Path]) -> pd.DataFrame:
+# quick_inventory 재고 계산에 필요한 warehouse_loader 표준 필드명 (quick_load 투영용)
+STANDARD_COLUMNS = ["amount", "category", "billing_month", "cntr_q_in", "cntr_q_out"]
+
+@cache
+def _get_processor() -> HVDCProcessor:
+    """전역 프로세서 인스턴스 (첫 호출 시 초기화)"""
+    return HVDCProcessor()
+
+if njit is not None:
+    @njit(cache=True)
+    def _inv_kernel(incoming, outgoing, inventory, amount, timestamps, month_codes, n_months):
+        """
+        재고 집계 커널 (단일 패스, InventoryEngine.calculate_monthly_summary 와 같은 기준)
+        
+        Args:
+            incoming, outgoing, inventory, amount: float64 배열
+            timestamps: Billing month 정수(ns) 배열
+            month_codes: 첫 월 기준 월 오프셋 배열 (결측은 -1)
+            n_months: 첫 월 ~ 마지막 월 개월 수 (거래 없는 월 포함)
+        
+        Returns:
+            월별 [입고, 출고, 금액, 기말재고] 배열
+            (기말재고는 월 내 가장 늦은 날짜 행(같은 날짜는 뒤 행)의 Inventory, 거래 없는 월은 NaN)
+        """
+        monthly = np.zeros((n_months, 4))
+        monthly[:, 3] = np.nan
+        last_ts = np.empty(n_months, dtype=np.int64)
+        for i in range(incoming.shape[0]):
+            code = month_codes[i]
+            if code < 0:
+                continue
+            monthly[code, 0] += incoming[i]
+            monthly[code, 1] += outgoing[i]
+            monthly[code, 2] += amount[i]
+            # pd.Grouper 는 날짜로 안정 정렬한 뒤 마지막 값을 취하므로 가장 늦은 날짜(동률은 뒤 행) 기준
+            if np.isnan(monthly[code, 3]) or timestamps[i] >= last_ts[code]:
+                monthly[code, 3] = inventory[i]
+                last_ts[code] = timestamps[i]
+        return monthly
+
+def _float_array(df: pd.DataFrame, col: str, fallback: str) -> np.ndarray:
+    """숫자 컬럼을 연속 float64 배열로 추출 (결측/비숫자는 0)"""
+    values = df[col] if col in df.columns else df.get(fallback, pd.Series(0.0, index=df.index))
+    values = pd.to_numeric(values, errors="coerce").fillna(0)
+    return np.ascontiguousarray(values.to_numpy(dtype=np.float64))
+
+def _quick_inventory_numba(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Numba 커널 기반 재고 계산 (quick_inventory 고속 경로)
+    
+    InventoryEngine.calculate_monthly_summary()와 같은 결과를 낸다:
+    월 범위는 첫 월 ~ 마지막 월 전체(거래 없는 월 포함), 기말재고는 월 내 가장 늦은 날짜의 Inventory,
+    Inventory 컬럼이 없으면 행별 입고 - 출고.
+    """
+    months = pd.to_datetime(df["Billing month"])
+    month_ord = (months.dt.year * 12 + months.dt.month).to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = ~np.isnan(month_ord)
+    if not valid.any():
+        raise ValueError("유효한 Billing month 값이 없습니다")
+    first = month_ord[valid].min()
+    n_months = int(month_ord[valid].max() - first) + 1
+    month_codes = np.where(valid, month_ord - first, -1).astype(np.int64)
+    
+    incoming = _float_array(df, "Incoming", "cntr_q_in")
+    outgoing = _float_array(df, "Outgoing", "cntr_q_out")
+    inventory = _float_array(df, "Inventory", "Inventory") if "Inventory" in df.columns else incoming - outgoing
+    monthly = _inv_kernel(incoming, outgoing, inventory, _float_array(df, "Amount", "amount"),
+                          months.to_numpy(dtype="datetime64[ns]").view(np.int64), month_codes, n_months)
+    
+    # 월 라벨은 pd.Grouper(freq="M")와 같은 월말 날짜
+    month_index = pd.date_range(months[valid].min() + pd.offsets.MonthEnd(0), periods=n_months,
+                                freq=pd.offsets.MonthEnd()).normalize()
+    end_inventory = monthly[:, 3]
+    return {
+        "total_incoming": monthly[:, 0].sum(),
+        "total_outgoing": monthly[:, 1].sum(),
+        "end_inventory": end_inventory[-1],
+        "total_amount": monthly[:, 2].sum(),
+        "monthly_data": {
+            "Billing Month": month_index.to_numpy(),
+            "Incoming": monthly[:, 0],
+            "Outgoing": monthly[:, 1],
+            "End_Inventory": end_inventory,
+            "Total_Amount": monthly[:, 2],
+            "Net_Change": monthly[:, 0] - monthly[:, 1],
+            "Turnover_Rate": monthly[:, 1] / np.where(end_inventory == 0, 1, end_inventory),
+        }
+    }
+
+def quick_load(file_path: Union[str, Path],
+               columns: Optional[List[str]] = None,
+               dtypes: Optional[Dict[str, Any]] = None) -> pd.DataFrame:
     """
     빠른 데이터 로드
     
+    재고 계산만 필요하면 columns=STANDARD_COLUMNS로 필요한 컬럼만 남겨
+    메모리 사용량을 줄일 수 있습니다.
+    
     Args:
         file_path: Excel 파일 경로
+        columns: 남길 표준 필드명 목록 (기본값: 전체 컬럼, 없는 이름이 있으면 로드 실패)
+        dtypes: 컬럼별 dtype 지정 (예: {"shipment_no": "category"})
     
     Returns:
         pandas.DataFrame
     """
-    result = _processor.process(file_path)
+    result = _get_processor().process(file_path, usecols=columns, dtype=dtypes)
     if result["success"]:
         return result["data"]
     else:
         raise Exception(f"데이터 로드 실패: {result['error']}")
 
-def quick_report(df: pd.DataFrame, output_path: str) -> str:
+def _column_values(series: pd.Series) -> list:
+    """Excel 셀 값 리스트로 변환 (결측값은 빈 셀)"""
+    return series.astype(object).where(series.notna(), None).tolist()
+
+def quick_report(df: pd.DataFrame, output_path: str, styled: bool = False) -> str:
     """
     빠른 보고서 생성
     
+    기본은 openpyxl write-only 모드로 행을 스트리밍 저장하며,
+    서식이 적용된 대시보드가 필요하면 styled=True를 사용합니다.
+    
     Args:
         df: 데이터프레임
         output_path: 출력 파일 경로
+        styled: True면 excel_reporter 대시보드 생성
     
     Returns:
         생성된 파일 경로
     """
     try:
-        from excel_reporter import generate_full_dashboard
-        report_path = generate_full_dashboard(df, output_path)
-        return str(report_path)
+        if styled:
+            from excel_reporter import generate_full_dashboard
+            report_path = generate_full_dashboard(df, output_path)
+            return str(report_path)
+        
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Font
+        
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Data")
+        
+        # 헤더 서식 객체는 한 번만 생성
+        header_font = Font(bold=True)
+        header = []
+        for col in df.columns:
+            cell = WriteOnlyCell(ws, value=str(col))
+            cell.font = header_font
+            header.append(cell)
+        ws.append(header)
+        
+        # 컬럼 단위로 값을 꺼낸 뒤 행 튜플로 스트리밍
+        for row in zip(*(_column_values(df[c]) for c in df.columns)):
+            ws.append(row)
+        
+        wb.save(output_path)
+        return str(output_path)
     except Exception as e:
         raise Exception(f"보고서 생성 실패: {e}")
 
@@ -48,24 +180,38 @@ def quick_inventory(df: pd.DataFrame) -> Dict[str, Any]:
     """
     빠른 재고 계산
     
+    numba가 설치되어 있으면 컴파일된 단일 패스 커널을, 없으면
+    InventoryEngine.calculate_monthly_summary()를 사용합니다 (두 경로의 결과는 같음).
+    
     Args:
         df: 데이터프레임
     
     Returns:
-        재고 요약 정보
+        재고 요약 정보 (monthly_data는 {컬럼명: numpy 배열} 형태의 컬럼 단위 데이터,
+        pd.DataFrame(result["monthly_data"])로 복원 가능)
     """
     try:
+        if njit is not None and "Billing month" in df.columns:
+            return _quick_inventory_numba(df)
+        
         from core.inventory_engine import InventoryEngine
         
         engine = InventoryEngine(df)
         monthly_summary = engine.calculate_monthly_summary()
         
+        # 합계는 NumPy 배열 합으로, 기말재고는 위치 기반 .iat로 조회
+        total_in, total_out, total_amt = (
+            np.sum(monthly_summary[col].to_numpy(dtype=np.float64))
+            for col in ("Incoming", "Outgoing", "Total_Amount")
+        )
+        end_inv = monthly_summary["End_Inventory"].iat[-1]
+        
         return {
-            "total_incoming": monthly_summary["Incoming"].sum(),
-            "total_outgoing": monthly_summary["Outgoing"].sum(),
-            "end_inventory": monthly_summary["End_Inventory"].iloc[-1],
-            "total_amount": monthly_summary["Total_Amount"].sum(),
-            "monthly_data": monthly_summary.to_dict("records")
+            "total_incoming": total_in,
+            "total_outgoing": total_out,
+            "end_inventory": end_inv,
+            "total_amount": total_amt,
+            "monthly_data": {col: monthly_summary[col].to_numpy() for col in monthly_summary.columns}
         }
     except Exception as e:
         raise Exception(f"재고 계산 실패: {e}")
@@ -73,7 +219,7 @@ def quick_inventory(df: pd.DataFrame) -> Dict[str, Any]:
 def quick_test() -> Dict[str, Any]:
     """통합 테스트"""
     test_results = {
-        "processor_init": _processor.is_initialized,
+        "processor_init": _get_processor().is_initialized,
         "modules_available": True,
         "sample_data_test": False,
         "report_generation": False
@@ -104,7 +250,7 @@ def quick_test() -> Dict[str, Any]:
 # 편의 함수들
 def process_file(file_path: str, generate_report: bool = True) -> Dict[str, Any]:
     """파일 처리 + 보고서 생성 원스톱"""
-    result = _processor.process(file_path)
+    result = _get_processor().process(file_path)
     
     if result["success"] and generate_report:
         output_name = f"report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
@@ -119,7 +265,7 @@ def process_file(file_path: str, generate_report: bool = True) -> Dict[str, Any]
 def get_status() -> Dict[str, Any]:
     """현재 상태 확인"""
     return {
-        "processor_ready": _processor.is_initialized,
-        "last_processing": _processor.get_summary(),
+        "processor_ready": _get_processor().is_initialized,
+        "last_processing": _get_processor().get_summary(),
         "version": "0.5.1-quick"
     }
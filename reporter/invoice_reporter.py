@@ -12,30 +12,61 @@ pivot/table 작성 시 전체 월(month range) 기준으로 재색인/결측 0 
 
 import pandas as pd
 import json
+import gc
 import numpy as np
+import os
 from datetime import datetime
+from functools import lru_cache
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 import xlsxwriter
 
+from core.loader import read_excel_fast
+
+try:
+    from numba import get_num_threads, njit, prange
+except ImportError:  # numba 미설치 시 pandas groupby 경로 사용
+    njit = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # pyarrow 미설치 시 pandas groupby 경로 사용
+    pa = None
+
 # ===============================================================================
 # 1. 온톨로지→매핑: DataFrame 변환
 # ===============================================================================
 
+def _file_key(path):
+    """캐시 키: (절대경로, 수정시각) → 파일이 변경되면 캐시가 자동으로 무효화됨"""
+    path = os.path.abspath(path)
+    return path, os.path.getmtime(path)
+
+@lru_cache(maxsize=4)
+def _load_mapping_rules(path, mtime):
+    """매핑 규칙 JSON 파싱 결과 캐시 (field_map)"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["field_map"]
+
+@lru_cache(maxsize=2)
+def _load_raw_excel(path, mtime):
+    """원본 Excel 로드 결과 캐시 (공유 객체이므로 호출 측에서 수정하지 않음)"""
+    return read_excel_fast(path)
+
 def load_ontology_mapping_data():
     """
     온톨로지 기반 데이터셋 준비 및 최신 매핑 규칙으로 표준 컬럼 매핑
     """
     print("🔄 1단계: 온톨로지→매핑 DataFrame 변환 시작...")
     
-    # 1) 매핑 규칙 로딩 (14개 주요 필드)
-    with open("mapping_rules_v2.6_unified.json", encoding="utf-8") as f:
-        mapping_rules = json.load(f)["field_map"]
+    # 1) 매핑 규칙 로딩 (14개 주요 필드, 파일 변경 전까지 재파싱 생략)
+    mapping_rules = dict(_load_mapping_rules(*_file_key("mapping_rules_v2.6_unified.json")))
     
     print(f"✅ 매핑 규칙 로드 완료: {len(mapping_rules)}개 필드")
     
-    # 2) 원본 DataFrame 컬럼을 매핑
-    df_raw = pd.read_excel("data/HVDC WAREHOUSE_HITACHI(HE).xlsx")  # 예시
+    # 2) 원본 DataFrame 컬럼을 매핑 (rename은 새 DataFrame을 반환하므로 캐시 원본은 그대로 유지)
+    df_raw = _load_raw_excel(*_file_key("data/HVDC WAREHOUSE_HITACHI(HE).xlsx"))  # 예시
     col_map = {k: v for k, v in mapping_rules.items() if k in df_raw.columns}
     df = df_raw.rename(columns=col_map)
     
@@ -48,20 +79,21 @@ def load_ontology_mapping_data():
     
     # 4) 날짜 컬럼 처리 (ETD/ATA 등을 기준으로 월별 집계용 날짜 생성)
     date_cols = ['ETD/ATD', 'ETA/ATA']
-    valid_dates = []
-    
-    for col in date_cols:
-        if col in df_raw.columns:
-            valid_dates.extend(pd.to_datetime(df_raw[col], errors='coerce').dropna())
+    parsed_dates = {
+        col: pd.to_datetime(df_raw[col], errors='coerce').to_numpy('datetime64[ns]')
+        for col in date_cols if col in df_raw.columns
+    }
+    # 결측 채움용 현재 시각 (datetime64[ns] 스칼라 1개 → 컬럼 dtype 유지)
+    now64 = np.datetime64(datetime.now(), 'ns')
     
-    if valid_dates:
+    if any((~np.isnat(dates)).any() for dates in parsed_dates.values()):
         # 첫 번째 유효한 날짜 컬럼을 기준으로 월별 집계용 날짜 생성
-        df['hasDate'] = pd.to_datetime(df_raw[date_cols[0]], errors='coerce')
+        dates = parsed_dates[date_cols[0]]
         # 결측값은 현재 날짜로 채움
-        df['hasDate'] = df['hasDate'].fillna(pd.Timestamp.now())
+        df['hasDate'] = np.where(np.isnat(dates), now64, dates)
     else:
         # 날짜 컬럼이 없으면 현재 날짜 사용
-        df['hasDate'] = pd.Timestamp.now()
+        df['hasDate'] = now64
     
     print(f"✅ 표준화 완료: {len(df)}건 데이터, {len(df.columns)}개 컬럼")
     
@@ -71,6 +103,19 @@ def load_ontology_mapping_data():
 # 2. 전처리·정규화 및 월별 집계 전체월 보장
 # ===============================================================================
 
+def _to_float_filled(col):
+    """
+    집계용 float64 배열 변환 (결측값 0)
+    
+    이미 숫자형인 컬럼은 NumPy 캐스팅 + 결측 채우기만 수행하고,
+    문자열 등이 섞인 컬럼만 pd.to_numeric(errors='coerce') 경로를 사용한다.
+    """
+    if pd.api.types.is_numeric_dtype(col) and not pd.api.types.is_bool_dtype(col):
+        values = col.to_numpy(np.float64, na_value=np.nan, copy=True)
+        values[np.isnan(values)] = 0
+        return values
+    return pd.to_numeric(col, errors='coerce').fillna(0).to_numpy(np.float64)
+
 def prepare_monthly_aggregation(df):
     """
     월별 집계를 위한 전처리 및 전체월 인덱스 생성
@@ -78,14 +123,22 @@ def prepare_monthly_aggregation(df):
     print("🔄 2단계: 전처리·정규화 및 월별 집계 전체월 보장...")
     
     # 1) 모든 월 구하기 (ex: 2024-01 ~ 2025-06)
-    df['Billing Month'] = pd.to_datetime(df['hasDate']).dt.to_period("M")
-    all_months = pd.period_range(df['Billing Month'].min(), df['Billing Month'].max(), freq='M')
+    # 날짜 파싱/월 변환은 여기서 한 번만 수행하고 8개 시트 함수는 df['month']를 그대로 사용
+    # load_ontology_mapping_data 경유 시 이미 datetime64이므로 재파싱(전체 컬럼 복사) 생략
+    if df['hasDate'].dtype.kind != 'M':
+        df['hasDate'] = pd.to_datetime(df['hasDate'], errors='coerce', cache=True)
+    df['month'] = df['hasDate'].dt.to_period("M")
+    all_months = pd.period_range(df['month'].min(), df['month'].max(), freq='M')
+    
+    # 그룹 키를 정수 코드 기반 categorical로 변환 (월 카테고리 = 전체월 순서)
+    df['hasSite'] = df['hasSite'].astype('category')
+    df['month'] = pd.Categorical(df['month'], categories=all_months, ordered=True)
     
     print(f"✅ 전체 월 범위: {all_months[0]} ~ {all_months[-1]} ({len(all_months)}개월)")
     
     # 2) 기본 집계용 컬럼 추가
-    df['hasAmount_numeric'] = pd.to_numeric(df['hasAmount'], errors='coerce').fillna(0)
-    df['hasVolume_numeric'] = pd.to_numeric(df['hasVolume'], errors='coerce').fillna(0)
+    df['hasAmount_numeric'] = _to_float_filled(df['hasAmount'])
+    df['hasVolume_numeric'] = _to_float_filled(df['hasVolume'])
     
     return df, all_months
 
@@ -93,74 +146,258 @@ def prepare_monthly_aggregation(df):
 # 3. 8개 시트별 리포트 생성 함수들
 # ===============================================================================
 
-def create_monthly_dashboard(df, all_months):
+# 재고 aging / 청구 매칭 구간 (pd.cut 기본값과 같이 오른쪽 닫힌 구간: (0, 30], (30, 90], ...)
+AGING_BINS = np.array([0, 30, 90, 180, np.inf])
+AGING_LABELS = ['30일이하', '31-90일', '91-180일', '180일초과']
+MATCH_BINS = np.array([0, 5, 15, np.inf])
+MATCH_LABELS = ['정확매칭(5%이내)', '허용오차(5-15%)', '오차초과(15%이상)']
+OUTBOUND_LABELS = ['FINAL', 'TRANSFER']
+
+def _median(values):
+    """NaN 제외 중앙값 (전체 정렬 대신 np.partition 사용, 빈 배열은 NaN)"""
+    values = values[~np.isnan(values)]
+    n = len(values)
+    if n == 0:
+        return np.nan
+    mid = n // 2
+    if n % 2:
+        return np.partition(values, mid)[mid]
+    part = np.partition(values, [mid - 1, mid])
+    return (part[mid - 1] + part[mid]) / 2
+
+def _bucket_month_table(values, bins, labels, name, month_codes, all_months, weights=None):
+    """
+    값 구간 x 전체월 집계 테이블 (searchsorted + bincount)
+    
+    Args:
+        values: 구간 분류 대상 값 배열 (NaN 및 구간 밖 값은 제외)
+        bins: 구간 경계 (오른쪽 닫힌 구간)
+        labels: 구간 라벨
+        name: 결과 인덱스 이름
+        month_codes: 전체월 기준 월 코드 (-1은 제외)
+        all_months: 전체 월 범위
+        weights: 합산할 값 (None이면 건수)
+    
+    Returns:
+        구간 x 월 DataFrame (누락 구간/월은 0)
+    """
+    n_months = len(all_months)
+    valid = (values > bins[0]) & (values <= bins[-1]) & (month_codes >= 0)
+    bucket = np.searchsorted(bins[1:-1], values[valid], side='left')
+    table = np.bincount(
+        bucket * n_months + month_codes[valid],
+        weights=None if weights is None else weights[valid],
+        minlength=len(labels) * n_months
+    ).reshape(len(labels), n_months)
+    
+    index = pd.CategoricalIndex(labels, categories=labels, ordered=True, name=name)
+    return pd.DataFrame(table, index=index, columns=pd.PeriodIndex(all_months, name='month'))
+
+# numba 커널 사용 최소 행수 (첫 호출 JIT 컴파일 비용 ~수 초를 상쇄할 수 있는 규모에서만 사용)
+# parallel 커널은 cache=True 시 다른 모듈명으로 import되면 캐시 로드가 실패하므로 캐시하지 않음
+NUMBA_MIN_ROWS = 2_000_000
+# pyarrow group_by 사용 최소 행수 (소규모는 Table 변환 비용이 더 커서 pandas groupby 유지)
+ARROW_MIN_ROWS = 200_000
+
+if njit is not None:
+    @njit(parallel=True, nogil=True)
+    def _cube_kernel(site_codes, month_codes, amt, vol, n_sites, n_months, n_chunks):
+        """(현장, 월) 격자별 금액합/금액건수/부피합/부피건수/행수 (결측 코드 -1은 마지막 칸)"""
+        n = site_codes.shape[0]
+        step = (n + n_chunks - 1) // n_chunks
+        local = np.zeros((n_chunks, 5, n_sites + 1, n_months + 1))
+        
+        # 청크(스레드)별 로컬 배열에 누적 → 경합 없이 병렬 처리
+        for c in prange(n_chunks):
+            for i in range(c * step, min(n, (c + 1) * step)):
+                s = site_codes[i] if site_codes[i] >= 0 else n_sites
+                m = month_codes[i] if month_codes[i] >= 0 else n_months
+                if not np.isnan(amt[i]):
+                    local[c, 0, s, m] += amt[i]
+                    local[c, 1, s, m] += 1
+                if not np.isnan(vol[i]):
+                    local[c, 2, s, m] += vol[i]
+                    local[c, 3, s, m] += 1
+                local[c, 4, s, m] += 1
+        
+        out = np.zeros((5, n_sites + 1, n_months + 1))
+        for c in range(n_chunks):
+            out += local[c]
+        return out
+
+def _build_base_cube_numba(df):
+    """categorical 코드 기반 numba 커널로 build_base_cube와 동일한 큐브 생성"""
+    site_dtype, month_dtype = df['hasSite'].dtype, df['month'].dtype
+    n_sites, n_months = len(site_dtype.categories), len(month_dtype.categories)
+    
+    acc = _cube_kernel(
+        df['hasSite'].cat.codes.to_numpy(np.int32),
+        df['month'].cat.codes.to_numpy(np.int32),
+        df['hasAmount_numeric'].to_numpy(np.float64),
+        df['hasVolume_numeric'].to_numpy(np.float64),
+        n_sites, n_months, get_num_threads()
+    )
+    
+    # 관측된 (현장, 월) 칸만 추출 (정렬 순서: 현장 → 월, 결측 키는 마지막)
+    s_idx, m_idx = np.nonzero(acc[4])
+    return _cube_frame(s_idx, m_idx, acc[:, s_idx, m_idx], site_dtype, month_dtype)
+
+def _cube_frame(s_idx, m_idx, cells, site_dtype, month_dtype):
+    """
+    (현장 코드, 월 코드) 칸별 집계값을 build_base_cube 형식의 DataFrame으로 변환
+    
+    Args:
+        s_idx, m_idx: 정렬된 현장/월 코드 (결측 키는 카테고리 수와 같은 코드)
+        cells: [amt_sum, amt_cnt, vol_sum, vol_cnt, rows] 순서의 칸별 값
+        site_dtype, month_dtype: 현장/월 CategoricalDtype
+    """
+    n_sites, n_months = len(site_dtype.categories), len(month_dtype.categories)
+    index = pd.MultiIndex.from_arrays([
+        pd.Categorical.from_codes(np.where(s_idx == n_sites, -1, s_idx), dtype=site_dtype),
+        pd.Categorical.from_codes(np.where(m_idx == n_months, -1, m_idx), dtype=month_dtype)
+    ], names=['hasSite', 'month'])
+    
+    return pd.DataFrame({
+        'amt_sum': np.asarray(cells[0], dtype=np.float64),
+        'amt_cnt': np.asarray(cells[1]).astype(np.int64),
+        'vol_sum': np.asarray(cells[2], dtype=np.float64),
+        'vol_cnt': np.asarray(cells[3]).astype(np.int64),
+        'rows': np.asarray(cells[4]).astype(np.int64)
+    }, index=index)
+
+def _build_base_cube_arrow(df):
+    """categorical 코드 기반 pyarrow group_by(해시 집계 커널)로 build_base_cube와 동일한 큐브 생성"""
+    site_dtype, month_dtype = df['hasSite'].dtype, df['month'].dtype
+    n_sites, n_months = len(site_dtype.categories), len(month_dtype.categories)
+    
+    # 결측 키(-1)는 카테고리 수로 치환해 정렬 시 마지막에 오도록 함, NaN 값은 null로 변환(count 제외)
+    site_codes = df['hasSite'].cat.codes.to_numpy(np.int32)
+    month_codes = df['month'].cat.codes.to_numpy(np.int32)
+    table = pa.table({
+        's': np.where(site_codes < 0, n_sites, site_codes),
+        'm': np.where(month_codes < 0, n_months, month_codes),
+        'amt': pa.array(df['hasAmount_numeric'].to_numpy(np.float64), from_pandas=True),
+        'vol': pa.array(df['hasVolume_numeric'].to_numpy(np.float64), from_pandas=True)
+    })
+    result = table.group_by(['s', 'm']).aggregate([
+        ('amt', 'sum'), ('amt', 'count'), ('vol', 'sum'), ('vol', 'count'), ([], 'count_all')
+    ]).sort_by([('s', 'ascending'), ('m', 'ascending')])
+    
+    cells = [result.column(name).to_numpy() for name in ('amt_sum', 'amt_count', 'vol_sum', 'vol_count', 'count_all')]
+    # 전체 null 그룹의 sum은 null → 0 (pandas sum과 동일)
+    cells[0], cells[2] = np.nan_to_num(cells[0]), np.nan_to_num(cells[2])
+    return _cube_frame(result.column('s').to_numpy(), result.column('m').to_numpy(), cells, site_dtype, month_dtype)
+
+def build_base_cube(df):
+    """
+    (hasSite, month) 기준 단일 groupby 집계 큐브 생성
+    
+    시트 1~4(월별/공급사/창고/현장)는 모두 이 큐브를 재집계·unstack 하여 만들어지므로
+    원본 df에 대한 키 해싱은 한 번만 수행된다. 평균은 합계/건수로 재계산한다.
+    키가 categorical인 대용량 데이터는 numba 병렬 커널(설치 시) 또는
+    pyarrow 해시 집계 커널(설치 시)을 사용한다.
+    """
+    categorical_keys = (isinstance(df['hasSite'].dtype, pd.CategoricalDtype)
+                        and isinstance(df['month'].dtype, pd.CategoricalDtype))
+    if categorical_keys and njit is not None and len(df) >= NUMBA_MIN_ROWS:
+        return _build_base_cube_numba(df)
+    if categorical_keys and pa is not None and len(df) > ARROW_MIN_ROWS:
+        return _build_base_cube_arrow(df)
+    
+    return df.groupby(['hasSite', 'month'], dropna=False, observed=True).agg(
+        amt_sum=('hasAmount_numeric', 'sum'),
+        amt_cnt=('hasAmount_numeric', 'count'),
+        vol_sum=('hasVolume_numeric', 'sum'),
+        vol_cnt=('hasVolume_numeric', 'count'),
+        rows=('hasAmount_numeric', 'size')
+    )
+
+def _site_cube(cube):
+    """현장(hasSite) 결측 행 제외 (pivot_table/groupby 기본 동작과 동일)"""
+    return cube[cube.index.get_level_values('hasSite').notna()]
+
+def _site_month_table(cube, col, all_months):
+    """
+    큐브 컬럼을 현장 x 전체월 테이블로 변환 (누락 월은 0)
+    
+    큐브는 관측된 (현장, 월) 칸만 가지므로, unstack → reindex로 중간 테이블을 두 번 만들지 않고
+    최종 크기의 0 배열 하나에 관측 칸만 채워 넣는다.
+    """
+    cube = _site_cube(cube)
+    sites = cube.index.get_level_values('hasSite')
+    site_codes, site_labels = pd.factorize(sites, sort=True)
+    month_pos = pd.Index(all_months).get_indexer(cube.index.get_level_values('month'))
+    observed = month_pos >= 0
+    
+    values = cube[col].to_numpy()
+    table = np.zeros((len(site_labels), len(all_months)), dtype=values.dtype)
+    table[site_codes[observed], month_pos[observed]] = values[observed]
+    
+    index = pd.CategoricalIndex(site_labels, dtype=sites.dtype, name='hasSite') \
+        if isinstance(sites.dtype, pd.CategoricalDtype) else pd.Index(site_labels, name='hasSite')
+    return pd.DataFrame(table, index=index, columns=pd.Index(all_months, name='month'))
+
+def create_monthly_dashboard(df, all_months, cube=None):
     """1. 월별_전체현황 - KPI 대시보드 + 입출고 현황"""
     print("📊 시트 1: 월별_전체현황 생성...")
     
-    # KPI, 입출고, 금액 등 집계
-    df['month'] = pd.to_datetime(df['hasDate']).dt.to_period("M")
-    
-    monthly_kpi = df.groupby('month').agg({
-        'hasAmount_numeric': ['count', 'sum', 'mean'],
-        'hasVolume_numeric': ['sum', 'mean'],
-        'hasSite': 'nunique',
-        'hasShipmentNo': 'nunique'
+    if cube is None:
+        cube = build_base_cube(df)
+    
+    # KPI, 입출고, 금액 등 집계 (큐브를 월 단위로 재집계)
+    totals = cube.groupby(level='month', observed=True)[['amt_sum', 'amt_cnt', 'vol_sum', 'vol_cnt']].sum()
+    monthly_kpi = pd.DataFrame({
+        '거래건수': totals['amt_cnt'],
+        '총금액': totals['amt_sum'],
+        '평균금액': totals['amt_sum'] / totals['amt_cnt'],
+        '총부피': totals['vol_sum'],
+        '평균부피': totals['vol_sum'] / totals['vol_cnt'],
+        '현장수': _site_cube(cube).groupby(level='month', observed=True).size(),
+        '송장수': df.groupby('month', observed=True)['hasShipmentNo'].nunique()
     }).round(2)
     
-    # 컬럼명 정리
-    monthly_kpi.columns = ['거래건수', '총금액', '평균금액', '총부피', '평균부피', '현장수', '송장수']
-    
     # 전체월 기준으로 reindex (누락된 월은 0으로 채움)
     monthly_kpi = monthly_kpi.reindex(all_months, fill_value=0)
     
     return monthly_kpi
 
-def create_supplier_report(df, all_months):
+def create_supplier_report(df, all_months, cube=None):
     """2. 공급사별_월별현황 - 공급사 성과 추적 + 단가 분석"""
     print("📊 시트 2: 공급사별_월별현황 생성...")
     
-    df['month'] = pd.to_datetime(df['hasDate']).dt.to_period("M")
+    if cube is None:
+        cube = build_base_cube(df)
     
     # 공급사를 Site로 가정 (실제로는 공급사 컬럼이 있어야 함)
-    supplier_pivot = df.pivot_table(
-        index='hasSite',
-        columns='month', 
-        values='hasAmount_numeric',
-        aggfunc='sum',
-        fill_value=0
-    )
-    
     # 전체월 기준으로 reindex
-    supplier_pivot = supplier_pivot.reindex(columns=all_months, fill_value=0)
+    supplier_pivot = _site_month_table(cube, 'amt_sum', all_months)
     
     # 합계 및 평균 추가
+    # 월평균 = 총합계 / 전체월 수 (월 컬럼을 다시 슬라이스·평균하지 않음)
     supplier_pivot['총합계'] = supplier_pivot.sum(axis=1)
-    supplier_pivot['월평균'] = supplier_pivot.iloc[:, :-1].mean(axis=1).round(2)
+    supplier_pivot['월평균'] = (supplier_pivot['총합계'].to_numpy() / len(all_months)).round(2)
     
     return supplier_pivot
 
-def create_warehouse_report(df, all_months):
+def create_warehouse_report(df, all_months, cube=None):
     """3. 창고별_월별현황 - 창고 운영 효율성 + 회전율"""
     print("📊 시트 3: 창고별_월별현황 생성...")
     
-    # 날짜가 datetime 아닌 경우 변환
-    df['Month'] = pd.to_datetime(df['hasDate']).dt.to_period("M")
-    
     # 창고 컬럼이 실제로 존재하는지 확인 (hasSite를 창고로 사용)
     if 'hasSite' in df.columns:
-        # 창고별 x 월별 Qty 합계 (pivot_table 사용)
-        warehouse_monthly = df.pivot_table(
-            index='hasSite',
-            columns='Month',
-            values='hasAmount_numeric',
-            aggfunc='sum',
-            fill_value=0
-        )
+        if cube is None:
+            cube = build_base_cube(df)
+        
+        # 창고별 x 월별 금액 합계
+        warehouse_monthly = _site_month_table(cube, 'amt_sum', all_months)
         
-        # 창고별 총합, 부피 등 추가
-        warehouse_monthly['금액합계'] = df.groupby('hasSite')['hasAmount_numeric'].sum()
-        warehouse_monthly['부피합계'] = df.groupby('hasSite')['hasVolume_numeric'].sum()
-        warehouse_monthly['건수'] = df.groupby('hasSite').size()
+        # 창고별 총합, 부피 등 추가 (창고 단위 재집계 1회 + join)
+        site_totals = _site_cube(cube).groupby(level='hasSite', observed=True).agg(
+            금액합계=('amt_sum', 'sum'),
+            부피합계=('vol_sum', 'sum'),
+            건수=('rows', 'sum')
+        )
+        warehouse_monthly = warehouse_monthly.join(site_totals)
         
         # 월별 컬럼 순서 보장(전체월)
         warehouse_monthly = warehouse_monthly.reindex(columns=list(all_months) + ['금액합계', '부피합계', '건수'], fill_value=0)
@@ -182,23 +419,19 @@ def create_warehouse_report(df, all_months):
     
     return warehouse_monthly
 
-def create_site_report(df, all_months):
+def create_site_report(df, all_months, cube=None):
     """4. 현장별_월별현황 - 현장 배송 현황 + 빈도 분석"""
     print("📊 시트 4: 현장별_월별현황 생성...")
     
-    df['month'] = pd.to_datetime(df['hasDate']).dt.to_period("M")
-    
-    site_pivot = df.pivot_table(
-        index='hasSite',
-        columns='month',
-        values='hasVolume_numeric',
-        aggfunc=['sum', 'count'],
-        fill_value=0
-    )
+    if cube is None:
+        cube = build_base_cube(df)
     
-    # 전체월 기준으로 reindex
-    if not site_pivot.empty:
-        site_pivot = site_pivot.reindex(columns=all_months, level=1, fill_value=0)
+    # 전체월 기준으로 reindex (sum/count 블록 각각)
+    if not _site_cube(cube).empty:
+        site_pivot = pd.concat({
+            'sum': _site_month_table(cube, 'vol_sum', all_months),
+            'count': _site_month_table(cube, 'vol_cnt', all_months)
+        }, axis=1)
     else:
         # 더미 데이터
         site_pivot = pd.DataFrame(index=['Site1', 'Site2'], columns=all_months)
@@ -206,26 +439,31 @@ def create_site_report(df, all_months):
     
     return site_pivot
 
+# dt.dayofweek 순서 (0=월요일)
+WEEKDAY_NAMES = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
+
 def create_inbound_report(df, all_months):
     """5. 입고현황_월별 - 입고 패턴 + 요일별 분석"""
     print("📊 시트 5: 입고현황_월별 생성...")
     
-    df['month'] = pd.to_datetime(df['hasDate']).dt.to_period("M")
-    df['weekday'] = pd.to_datetime(df['hasDate']).dt.day_name()
-    
     # 입고는 양수 금액으로 가정
-    inbound_data = df[df['hasAmount_numeric'] > 0].copy()
-    
-    inbound_monthly = inbound_data.groupby('month').agg({
-        'hasAmount_numeric': ['count', 'sum'],
-        'hasVolume_numeric': 'sum'
-    }).round(2)
-    
-    inbound_monthly.columns = ['입고건수', '입고금액', '입고부피']
+    inbound_mask = df['hasAmount_numeric'].to_numpy() > 0
+    inbound_data = df[inbound_mask]
+    
+    inbound_monthly = inbound_data.groupby('month', observed=True).agg(
+        입고건수=('hasAmount_numeric', 'count'),
+        입고금액=('hasAmount_numeric', 'sum'),
+        입고부피=('hasVolume_numeric', 'sum')
+    ).round(2)
     inbound_monthly = inbound_monthly.reindex(all_months, fill_value=0)
     
-    # 요일별 패턴 추가
-    weekday_pattern = inbound_data.groupby('weekday')['hasAmount_numeric'].count()
+    # 요일별 패턴 추가 (요일 번호 0=월 ~ 6=일 기준 bincount, 날짜 결측 행 제외)
+    weekday_codes = inbound_data['hasDate'].dt.dayofweek.dropna().to_numpy(np.int64)
+    weekday_pattern = pd.Series(
+        np.bincount(weekday_codes, minlength=7),
+        index=pd.Index(WEEKDAY_NAMES, name='weekday'),
+        name='hasAmount_numeric'
+    )
     
     return inbound_monthly, weekday_pattern
 
@@ -233,154 +471,304 @@ def create_outbound_report(df, all_months):
     """6. 출고현황_월별 - 출고 유형별 + TRANSFER vs FINAL"""
     print("📊 시트 6: 출고현황_월별 생성...")
     
-    df['month'] = pd.to_datetime(df['hasDate']).dt.to_period("M")
-    
     # 출고 타입 구분 (실제로는 transaction type 컬럼이 있어야 함)
-    # 여기서는 임시로 volume 기준으로 구분
-    df['출고타입'] = np.where(df['hasVolume_numeric'] > df['hasVolume_numeric'].median(), 'TRANSFER', 'FINAL')
-    
-    outbound_pivot = df.pivot_table(
-        index='출고타입',
-        columns='month',
-        values='hasAmount_numeric',
-        aggfunc='sum',
-        fill_value=0
+    # 여기서는 임시로 volume 중앙값 기준으로 구분 (중앙값 이하 FINAL, 초과 TRANSFER)
+    volume = df['hasVolume_numeric'].to_numpy(np.float64)
+    outbound_pivot = _bucket_month_table(
+        volume, np.array([-np.inf, _median(volume), np.inf]), OUTBOUND_LABELS, '출고타입',
+        df['month'].cat.codes.to_numpy(), all_months,
+        weights=df['hasAmount_numeric'].to_numpy(np.float64)
     )
     
-    outbound_pivot = outbound_pivot.reindex(columns=all_months, fill_value=0)
-    
     return outbound_pivot
 
 def create_inventory_report(df, all_months):
     """7. 재고현황_월별 - 재고 Aging + 회전율 분석"""
     print("📊 시트 7: 재고현황_월별 생성...")
     
-    df['month'] = pd.to_datetime(df['hasDate']).dt.to_period("M")
-    
-    # 재고 aging 계산 (현재 날짜 기준)
-    df['aging_days'] = (pd.Timestamp.now() - pd.to_datetime(df['hasDate'])).dt.days
-    df['aging_category'] = pd.cut(df['aging_days'], 
-                                  bins=[0, 30, 90, 180, float('inf')], 
-                                  labels=['30일이하', '31-90일', '91-180일', '180일초과'])
-    
-    inventory_aging = df.pivot_table(
-        index='aging_category',
-        columns='month',
-        values='hasAmount_numeric',
-        aggfunc='sum',
-        fill_value=0
+    # 재고 aging 계산 (현재 날짜 기준) → aging 구간 x 전체월 금액 합계
+    # datetime64 배열에서 직접 경과일 계산 (NaT → NaN → 구간 제외)
+    elapsed = np.datetime64(datetime.now(), 'ns') - df['hasDate'].to_numpy('datetime64[ns]')
+    aging_days = np.floor(elapsed / np.timedelta64(1, 'D'))
+    inventory_aging = _bucket_month_table(
+        aging_days, AGING_BINS, AGING_LABELS, 'aging_category',
+        df['month'].cat.codes.to_numpy(), all_months,
+        weights=df['hasAmount_numeric'].to_numpy(np.float64)
     )
     
-    inventory_aging = inventory_aging.reindex(columns=all_months, fill_value=0)
-    
     return inventory_aging
 
 def create_billing_verification_report(df, all_months):
     """8. 청구매칭_검증 - 송장-화물 매칭 + 차액 분석"""
     print("📊 시트 8: 청구매칭_검증 생성...")
     
-    df['month'] = pd.to_datetime(df['hasDate']).dt.to_period("M")
-    
     # 5%/15% 허용 오차 기준으로 매칭 검증
-    df['expected_amount'] = df['hasVolume_numeric'] * 100  # 가정: 부피 * 100 = 예상금액
-    df['amount_diff'] = df['hasAmount_numeric'] - df['expected_amount']
-    df['diff_percentage'] = (df['amount_diff'] / df['expected_amount'] * 100).abs()
-    
-    # 오차 범위별 분류
-    df['match_status'] = pd.cut(df['diff_percentage'], 
-                               bins=[0, 5, 15, float('inf')], 
-                               labels=['정확매칭(5%이내)', '허용오차(5-15%)', '오차초과(15%이상)'])
-    
-    billing_verification = df.pivot_table(
-        index='match_status',
-        columns='month',
-        values='hasAmount_numeric',
-        aggfunc='count',
-        fill_value=0
+    expected_amount = df['hasVolume_numeric'].to_numpy(np.float64) * 100  # 가정: 부피 * 100 = 예상금액
+    amount_diff = df['hasAmount_numeric'].to_numpy(np.float64) - expected_amount
+    with np.errstate(divide='ignore', invalid='ignore'):
+        diff_percentage = np.abs(amount_diff / expected_amount * 100)
+    
+    # 오차 범위별 분류 → 구간 x 전체월 건수
+    billing_verification = _bucket_month_table(
+        diff_percentage, MATCH_BINS, MATCH_LABELS, 'match_status',
+        df['month'].cat.codes.to_numpy(), all_months
     )
     
-    billing_verification = billing_verification.reindex(columns=all_months, fill_value=0)
-    
     return billing_verification
 
+def _inbound_sheet(df, all_months):
+    """5번 시트용 입고 월별 테이블 (요일별 패턴은 시트에 기록하지 않음)"""
+    inbound_monthly, _ = create_inbound_report(df, all_months)
+    return inbound_monthly
+
+# 시트명, 생성 함수, 공용 큐브 사용 여부 (시트 기록 순서)
+REPORT_SHEETS = [
+    ("01_월별_전체현황", create_monthly_dashboard, True),
+    ("02_공급사별_월별현황", create_supplier_report, True),
+    ("03_창고별_월별현황", create_warehouse_report, True),
+    ("04_현장별_월별현황", create_site_report, True),
+    ("05_입고현황_월별", _inbound_sheet, False),
+    ("06_출고현황_월별", create_outbound_report, False),
+    ("07_재고현황_월별", create_inventory_report, False),
+    ("08_청구매칭_검증", create_billing_verification_report, False),
+]
+
+# 시트 생성 함수가 참조하는 컬럼 (프로세스 워커에는 이 컬럼만 전달)
+REPORT_COLUMNS = ['hasDate', 'month', 'hasSite', 'hasAmount_numeric', 'hasVolume_numeric', 'hasShipmentNo']
+
+_WORKER_STATE = {}
+
+def _init_report_worker(df, all_months, cube):
+    """프로세스 워커 초기화: 워커당 한 번만 데이터를 전달받아 보관"""
+    _WORKER_STATE.update(df=df, all_months=all_months, cube=cube)
+
+def build_report_sheet(index, df=None, all_months=None, cube=None):
+    """
+    REPORT_SHEETS[index] 시트 DataFrame 생성
+    
+    Args:
+        index: REPORT_SHEETS 내 시트 번호
+        df, all_months, cube: 생략 시 프로세스 워커에 보관된 값 사용
+    
+    Returns:
+        (시트명, DataFrame)
+    """
+    if df is None:
+        df, all_months, cube = _WORKER_STATE['df'], _WORKER_STATE['all_months'], _WORKER_STATE['cube']
+    
+    sheet_name, builder, uses_cube = REPORT_SHEETS[index]
+    report = builder(df, all_months, cube) if uses_cube else builder(df, all_months)
+    return sheet_name, report
+
+def iter_report_sheets(df, all_months, workers=None, threads=None):
+    """
+    8개 시트 DataFrame을 시트 순서대로 생성하며 반환 (병렬 생성 시 완료되는 대로 순서 유지)
+    
+    Args:
+        df: prepare_monthly_aggregation 결과 DataFrame
+        all_months: 전체 월 범위
+        workers: 프로세스 수 (2 이상이면 프로세스 풀 사용)
+        threads: 스레드 수 (workers 미사용 시 적용, None이면 시트 수/CPU 수 중 작은 값, 1이면 순차 생성)
+    
+    Yields:
+        (시트명, DataFrame)
+    """
+    # 시트 1~4 공용 (hasSite, month) 집계 큐브
+    cube = build_base_cube(df)
+    indices = range(len(REPORT_SHEETS))
+    
+    if workers and workers > 1:
+        # 시트별 집계는 서로 독립적이므로 프로세스 풀에서 병렬 생성
+        # (필요 컬럼만 워커당 1회 전달, 기록은 호출 측에서 순서대로 수행)
+        columns = [col for col in REPORT_COLUMNS if col in df.columns]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_report_worker,
+                                 initargs=(df[columns].copy(), all_months, cube)) as pool:
+            yield from pool.map(build_report_sheet, indices)
+        return
+    
+    if threads is None:
+        threads = min(len(REPORT_SHEETS), os.cpu_count() or 1)
+    if threads <= 1:
+        for i in indices:
+            yield build_report_sheet(i, df, all_months, cube)
+        return
+    
+    # 시트 생성 함수는 df를 읽기만 하므로 (컬럼 추가 없음) 스레드 간 공유 가능
+    # NumPy/pandas 집계는 GIL을 해제하므로 이전 시트의 Excel 기록과 다음 시트 집계가 겹쳐 실행됨
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        yield from pool.map(lambda i: build_report_sheet(i, df, all_months, cube), indices)
+
+def build_report_sheets(df, all_months, workers=None, threads=1):
+    """
+    8개 시트 DataFrame 생성 (시트 순서 유지)
+    
+    Args:
+        df: prepare_monthly_aggregation 결과 DataFrame
+        all_months: 전체 월 범위
+        workers: 프로세스 수 (None/1이면 현재 프로세스에서 생성)
+        threads: 스레드 수 (기본 1 = 순차 생성, None이면 iter_report_sheets 기본값)
+    
+    Returns:
+        [(시트명, DataFrame), ...]
+    """
+    return list(iter_report_sheets(df, all_months, workers, threads))
+
 # ===============================================================================
 # 4. Excel 저장: 8개 시트/조건부서식 포함
 # ===============================================================================
 
-def apply_conditional_formatting(workbook, worksheet, df, sheet_name):
-    """조건부 서식 적용"""
+# to_excel 기본 헤더/인덱스 서식 (굵게 + 얇은 테두리 + 가운데/위 정렬)
+HEADER_FORMAT = {"bold": True, "border": 1, "align": "center", "valign": "top"}
+DATETIME_FORMAT = "YYYY-MM-DD HH:MM:SS"
+NUMBER_FORMAT = {"num_format": "#,##0.00"}
+
+def apply_conditional_formatting(workbook, worksheet, df, sheet_name, num_format=None):
+    """조건부 서식 적용 (num_format: 여러 시트가 공유하는 숫자 포맷, 생략 시 새로 등록)"""
     
     if df.empty:
         return
     
     nrows, ncols = df.shape
     
-    # 3-Color Scale 조건부 서식
-    worksheet.conditional_format(1, 1, nrows, ncols-1, {
-        "type": "3_color_scale",
-        "min_color": "#F8696B",  # 빨강 (최소값)
-        "mid_color": "#FFEB84",  # 노랑 (중간값) 
-        "max_color": "#63BE7B",  # 녹색 (최대값)
-    })
+    # 3-Color Scale 조건부 서식 (숫자 값이 모두 같으면 색상 차이가 없으므로 생략)
+    values = df.select_dtypes('number').to_numpy(np.float64)
+    values = values[~np.isnan(values)]
+    if values.size and values.max() != values.min():
+        worksheet.conditional_format(1, 1, nrows, ncols-1, {
+            "type": "3_color_scale",
+            "min_color": "#F8696B",  # 빨강 (최소값)
+            "mid_color": "#FFEB84",  # 노랑 (중간값) 
+            "max_color": "#63BE7B",  # 녹색 (최대값)
+        })
     
     # 숫자 포맷 적용
-    num_format = workbook.add_format({"num_format": "#,##0.00"})
+    if num_format is None:
+        num_format = workbook.add_format(NUMBER_FORMAT)
     worksheet.set_column(1, ncols-1, 12, num_format)
 
-def save_8sheet_excel_report(df, all_months, output_path="HVDC_8Sheet_BI_Report.xlsx"):
-    """8개 시트 Excel 리포트 저장"""
+def _excel_cell(value):
+    """to_excel과 동일한 셀 값 변환 (결측은 빈칸, ±inf는 문자열, 그 외 비기본 타입은 str)"""
+    if isinstance(value, float):
+        if np.isnan(value):
+            return None
+        if np.isinf(value):
+            return "inf" if value > 0 else "-inf"
+        return value
+    if value is None or isinstance(value, (bool, int, str, datetime)):
+        return value
+    if pd.isna(value):
+        return None
+    return str(value)
+
+def write_frame_rows(worksheet, df, header_format, datetime_format, index=True):
+    """
+    DataFrame을 to_excel(index=...)과 같은 배치로 한 행씩 순서대로 기록
+    
+    to_excel은 열 단위로 셀을 기록하므로 constant_memory 모드(지난 행 재기록 불가)와
+    함께 쓸 수 없다. 헤더 → (다중 헤더인 경우) 인덱스명 → 데이터 행 순으로 기록한다.
+    
+    Args:
+        worksheet: xlsxwriter 워크시트
+        df: 기록할 DataFrame
+        header_format: 헤더/인덱스 셀 서식
+        datetime_format: 날짜 인덱스 셀 서식
+        index: False이면 인덱스 없이 0열부터 기록 (단일 헤더만 지원)
+    """
+    columns = df.columns
+    
+    if not index:
+        for j, label in enumerate(columns):
+            worksheet.write(0, j, _excel_cell(label), header_format)
+        for r, row in enumerate(zip(*(df.iloc[:, j].tolist() for j in range(df.shape[1]))), 1):
+            worksheet.write_row(r, 0, [_excel_cell(v) for v in row])
+        return
+    
+    if isinstance(columns, pd.MultiIndex):
+        # 레벨별 헤더 1행씩 (마지막 레벨 외에는 같은 상위 값이 이어지는 구간을 병합)
+        nlevels = columns.nlevels
+        for lnum in range(nlevels):
+            worksheet.write(lnum, 0, columns.names[lnum], header_format)
+            i = 0
+            while i < len(columns):
+                j = i + 1
+                if lnum < nlevels - 1:
+                    while j < len(columns) and columns[j][:lnum + 1] == columns[i][:lnum + 1]:
+                        j += 1
+                value = _excel_cell(columns[i][lnum])
+                if j - i > 1:
+                    worksheet.merge_range(lnum, i + 1, lnum, j, value, header_format)
+                else:
+                    worksheet.write(lnum, i + 1, value, header_format)
+                i = j
+        # 인덱스명은 별도 행
+        if df.index.name is not None:
+            worksheet.write(nlevels, 0, df.index.name, header_format)
+        start_row = nlevels + 1
+    else:
+        if df.index.name is not None:
+            worksheet.write(0, 0, df.index.name, header_format)
+        for j, label in enumerate(columns):
+            worksheet.write(0, j + 1, _excel_cell(label), header_format)
+        start_row = 1
+    
+    index = df.index
+    if isinstance(index, pd.PeriodIndex):
+        index = index.to_timestamp()
+    index_format = datetime_format if isinstance(index, pd.DatetimeIndex) else header_format
+    labels = index.to_pydatetime() if isinstance(index, pd.DatetimeIndex) else index.tolist()
+    
+    # 열 dtype 기준으로 기록 함수를 한 번만 결정: 결측/inf 없는 숫자 열은 write_number로 직접 기록
+    # (셀마다 _excel_cell 변환과 write()의 타입 판별을 거치지 않음), 그 외 열은 변환 후 write
+    column_writers = []
+    for j in range(df.shape[1]):
+        col = df.iloc[:, j]
+        if pd.api.types.is_numeric_dtype(col) and not pd.api.types.is_bool_dtype(col):
+            values = col.to_numpy(np.float64, na_value=np.nan)
+            if np.isfinite(values).all():
+                column_writers.append((worksheet.write_number, col.tolist()))
+                continue
+        column_writers.append((worksheet.write, [_excel_cell(v) for v in col.tolist()]))
+    
+    for r, label in enumerate(labels):
+        row = r + start_row
+        worksheet.write(row, 0, _excel_cell(label), index_format)
+        for c, (write, values) in enumerate(column_writers, 1):
+            write(row, c, values[r])
+
+def save_8sheet_excel_report(df, all_months, output_path="HVDC_8Sheet_BI_Report.xlsx", workers=None, threads=None):
+    """
+    8개 시트 Excel 리포트 저장
+    
+    Args:
+        df: prepare_monthly_aggregation 결과 DataFrame
+        all_months: 전체 월 범위
+        output_path: 출력 파일 경로
+        workers: 시트 집계용 프로세스 수 (None이면 스레드 풀 사용)
+        threads: 시트 집계용 스레드 수 (None이면 자동, 1이면 순차 처리)
+    """
     print("💾 4단계: Excel 저장 - 8개 시트/조건부서식 포함...")
     
-    with pd.ExcelWriter(output_path, engine="xlsxwriter") as writer:
-        workbook = writer.book
-        
-        # 1. 월별_전체현황
-        monthly_dashboard = create_monthly_dashboard(df, all_months)
-        monthly_dashboard.to_excel(writer, sheet_name="01_월별_전체현황")
-        ws1 = writer.sheets["01_월별_전체현황"]
-        apply_conditional_formatting(workbook, ws1, monthly_dashboard, "01_월별_전체현황")
-        
-        # 2. 공급사별_월별현황  
-        supplier_report = create_supplier_report(df, all_months)
-        supplier_report.to_excel(writer, sheet_name="02_공급사별_월별현황")
-        ws2 = writer.sheets["02_공급사별_월별현황"]
-        apply_conditional_formatting(workbook, ws2, supplier_report, "02_공급사별_월별현황")
-        
-        # 3. 창고별_월별현황
-        warehouse_report = create_warehouse_report(df, all_months)
-        warehouse_report.to_excel(writer, sheet_name="03_창고별_월별현황")
-        ws3 = writer.sheets["03_창고별_월별현황"] 
-        apply_conditional_formatting(workbook, ws3, warehouse_report, "03_창고별_월별현황")
-        
-        # 4. 현장별_월별현황
-        site_report = create_site_report(df, all_months)
-        site_report.to_excel(writer, sheet_name="04_현장별_월별현황")
-        ws4 = writer.sheets["04_현장별_월별현황"]
-        apply_conditional_formatting(workbook, ws4, site_report, "04_현장별_월별현황")
-        
-        # 5. 입고현황_월별
-        inbound_report, weekday_pattern = create_inbound_report(df, all_months)
-        inbound_report.to_excel(writer, sheet_name="05_입고현황_월별")
-        ws5 = writer.sheets["05_입고현황_월별"]
-        apply_conditional_formatting(workbook, ws5, inbound_report, "05_입고현황_월별")
-        
-        # 6. 출고현황_월별
-        outbound_report = create_outbound_report(df, all_months)
-        outbound_report.to_excel(writer, sheet_name="06_출고현황_월별")
-        ws6 = writer.sheets["06_출고현황_월별"]
-        apply_conditional_formatting(workbook, ws6, outbound_report, "06_출고현황_월별")
-        
-        # 7. 재고현황_월별
-        inventory_report = create_inventory_report(df, all_months)
-        inventory_report.to_excel(writer, sheet_name="07_재고현황_월별")
-        ws7 = writer.sheets["07_재고현황_월별"]
-        apply_conditional_formatting(workbook, ws7, inventory_report, "07_재고현황_월별")
-        
-        # 8. 청구매칭_검증
-        billing_verification = create_billing_verification_report(df, all_months)
-        billing_verification.to_excel(writer, sheet_name="08_청구매칭_검증")
-        ws8 = writer.sheets["08_청구매칭_검증"]
-        apply_conditional_formatting(workbook, ws8, billing_verification, "08_청구매칭_검증")
+    # 시트 집계는 백그라운드에서 진행하고, 기록(xlsxwriter는 스레드 안전하지 않음)은 여기서 순서대로 수행
+    reports = iter_report_sheets(df, all_months, workers, threads)
+    
+    # constant_memory: 각 행을 기록 즉시 디스크로 flush (메모리 사용량 = 한 행 수준)
+    workbook = xlsxwriter.Workbook(output_path, {"constant_memory": True})
+    header_format = workbook.add_format(HEADER_FORMAT)
+    datetime_format = workbook.add_format({**HEADER_FORMAT, "num_format": DATETIME_FORMAT})
+    num_format = workbook.add_format(NUMBER_FORMAT)
+    
+    try:
+        for sheet_name, report in reports:
+            # 표시 포맷(#,##0.00)에 맞춰 실수 값은 기록 시점에 소수 2자리로 반올림 (셀 XML 길이 축소)
+            report = report.round(2)
+            
+            # 행 단위 기록 전에 조건부 서식/열 서식을 먼저 등록
+            worksheet = workbook.add_worksheet(sheet_name)
+            apply_conditional_formatting(workbook, worksheet, report, sheet_name, num_format)
+            write_frame_rows(worksheet, report, header_format, datetime_format)
+    finally:
+        reports.close()  # 기록 실패 시에도 풀 종료
+        workbook.close()
     
     print(f"✅ Excel 리포트 저장 완료: {output_path}")
     return output_path
@@ -453,24 +841,61 @@ OUTDOOR_WAREHOUSE = ["DSV Outdoor", "DSV MZP", "MOSB"]
 SITE = ["AGI", "DAS", "MIR", "SHU"]
 DANGEROUS_CARGO = ["AAA Storage", "Dangerous Storage"]
 
+# 위치명 → 그룹 조회 테이블 (그룹 목록은 서로 겹치지 않음)
+LOCATION_TO_GROUP = {
+    **{loc: "IndoorWarehouse" for loc in INDOOR_WAREHOUSE},
+    **{loc: "OutdoorWarehouse" for loc in OUTDOOR_WAREHOUSE},
+    **{loc: "Site" for loc in SITE},
+    **{loc: "DangerousCargoWarehouse" for loc in DANGEROUS_CARGO},
+}
+
+# 분류 결과 그룹 (map_location_group_ontology 카테고리 순서)
+LOCATION_GROUPS = ["IndoorWarehouse", "OutdoorWarehouse", "Site", "DangerousCargoWarehouse", "UNKNOWN"]
+WAREHOUSE_GROUPS = ["IndoorWarehouse", "OutdoorWarehouse", "DangerousCargoWarehouse"]
+
+@lru_cache(maxsize=512)
+def _location_group_cached(name):
+    """위치명별 분류 결과 캐시 (위치 종류는 수십 개 수준, 프로세스 수명 동안 유지)"""
+    # 정확한 문자열 매칭만 수행 (패턴 매칭 금지)
+    return LOCATION_TO_GROUP.get(str(name).strip(), "UNKNOWN")
+
 def get_location_group_ontology(name):
     """온톨로지 기준 위치 그룹 분류 (100% 명시적 매칭)"""
+    # 공백 없는 정확한 위치명은 str/strip 변환 없이 바로 조회
+    group = LOCATION_TO_GROUP.get(name)
+    if group is not None:
+        return group
+    
+    # 결측값(NaN은 자기 자신과 같지 않아 캐시 키로 부적합)은 캐시 조회 전에 처리
     if pd.isna(name):
         return "UNKNOWN"
     
-    # 정확한 문자열 매칭만 수행 (패턴 매칭 금지)
-    n = str(name).strip()
-    
-    if n in INDOOR_WAREHOUSE:
-        return "IndoorWarehouse"
-    elif n in OUTDOOR_WAREHOUSE:
-        return "OutdoorWarehouse"
-    elif n in SITE:
-        return "Site"
-    elif n in DANGEROUS_CARGO:
-        return "DangerousCargoWarehouse"
-    else:
-        return "UNKNOWN"
+    return _location_group_cached(name)
+
+def map_location_group_ontology(locations):
+    """
+    위치 Series 전체를 온톨로지 그룹으로 분류 (행별 apply 대신 벡터화 조회)
+    
+    고유 위치명만 strip/조회한 뒤 행별로는 정수 코드만 펼친다.
+    
+    Args:
+        locations: 위치명 Series
+    
+    Returns:
+        get_location_group_ontology와 같은 결과의 그룹 Series
+        (카테고리 = LOCATION_GROUPS, 결측/미등록은 UNKNOWN)
+    """
+    codes, uniques = pd.factorize(locations)
+    names = pd.Index(uniques)
+    if not isinstance(names.dtype, pd.StringDtype):
+        names = names.astype(str)
+    unique_groups = pd.Categorical(names.str.strip().map(LOCATION_TO_GROUP).fillna("UNKNOWN"),
+                                   categories=LOCATION_GROUPS).codes
+    
+    # 결측 위치(코드 -1)는 UNKNOWN
+    group_codes = np.append(unique_groups, np.int8(LOCATION_GROUPS.index("UNKNOWN")))[codes]
+    return pd.Series(pd.Categorical.from_codes(group_codes, categories=LOCATION_GROUPS),
+                     index=locations.index, name=locations.name)
 
 def validate_ontology_location_data(df, location_column='hasSite'):
     """온톨로지 기준 위치 데이터 검증 및 분석"""
@@ -479,29 +904,30 @@ def validate_ontology_location_data(df, location_column='hasSite'):
     if location_column not in df.columns:
         return {"error": f"컬럼 '{location_column}'이 존재하지 않습니다."}
     
-    # 위치 그룹 분류
-    df_temp = df.copy()
-    df_temp['LocationGroup'] = df_temp[location_column].apply(get_location_group_ontology)
+    # 위치 그룹 분류 (원본 복사 없이 별도 Series로 계산)
+    locations = df[location_column]
+    location_group = map_location_group_ontology(locations)
     
     # 분석 결과
-    location_counts = df_temp[location_column].value_counts()
-    group_counts = df_temp['LocationGroup'].value_counts()
+    location_counts = locations.value_counts()
+    group_counts = location_group.value_counts()
+    group_counts = group_counts[group_counts > 0]  # 관측되지 않은 그룹 카테고리 제외
     
     # 알려지지 않은 위치들
-    unknown_locations = df_temp[df_temp['LocationGroup'] == 'UNKNOWN'][location_column].value_counts()
+    unknown_locations = locations[location_group == 'UNKNOWN'].value_counts()
     
     result = {
-        "total_records": len(df_temp),
+        "total_records": len(df),
         "unique_locations": len(location_counts),
         "location_distribution": location_counts.to_dict(),
         "group_distribution": group_counts.to_dict(),
         "unknown_locations": unknown_locations.to_dict(),
         "validation_summary": {
-            "indoor_warehouse": len(df_temp[df_temp['LocationGroup'] == 'IndoorWarehouse']),
-            "outdoor_warehouse": len(df_temp[df_temp['LocationGroup'] == 'OutdoorWarehouse']),
-            "site": len(df_temp[df_temp['LocationGroup'] == 'Site']),
-            "dangerous_cargo": len(df_temp[df_temp['LocationGroup'] == 'DangerousCargoWarehouse']),
-            "unknown": len(df_temp[df_temp['LocationGroup'] == 'UNKNOWN'])
+            "indoor_warehouse": int(group_counts.get('IndoorWarehouse', 0)),
+            "outdoor_warehouse": int(group_counts.get('OutdoorWarehouse', 0)),
+            "site": int(group_counts.get('Site', 0)),
+            "dangerous_cargo": int(group_counts.get('DangerousCargoWarehouse', 0)),
+            "unknown": int(group_counts.get('UNKNOWN', 0))
         }
     }
     
@@ -514,18 +940,40 @@ def validate_ontology_location_data(df, location_column='hasSite'):
     
     return result
 
-def create_ontology_warehouse_flow_v4(df, all_months, location_column='hasSite'):
-    """온톨로지 기준 창고별 월별 입고/출고/재고 흐름 분석 v4"""
-    print("🔄 온톨로지 기준 창고별 월별 입출고 흐름 분석 v4 시작...")
+def _ontology_subset(df, mask, location_column, location_group, value_columns):
+    """
+    분류 결과 mask에 해당하는 행의 집계용 컬럼만 추출 (전체 DataFrame 복사 없음)
     
-    df_work = df.copy()
+    월 컬럼은 파이프라인에서 미리 계산한 Month를 우선 사용하고, 없으면 hasDate에서 생성한다.
+    """
+    month_source = 'Month' if 'Month' in df.columns else 'hasDate'
+    subset = df.loc[mask, [location_column, month_source, *value_columns]].assign(LocationGroup=location_group[mask])
+    if month_source == 'hasDate':
+        subset['Month'] = pd.to_datetime(subset['hasDate']).dt.to_period("M")
+    return subset
+
+def create_ontology_warehouse_flow_v4(df, all_months, location_column='hasSite',
+                                      quantity_col='hasVolume_numeric', amount_col='hasAmount_numeric'):
+    """
+    온톨로지 기준 창고별 월별 입고/출고/재고 흐름 분석 v4
+    
+    Args:
+        df: 위치/날짜(또는 Month)/수량/금액 컬럼을 가진 DataFrame
+        all_months: 전체 월 범위
+        location_column: 위치 컬럼명
+        quantity_col: 입고 수량 컬럼명 (결측 없는 숫자형)
+        amount_col: 금액 컬럼명 (결측 없는 숫자형)
+    """
+    print("🔄 온톨로지 기준 창고별 월별 입출고 흐름 분석 v4 시작...")
     
     # 1. 온톨로지 기준 위치 그룹 분류
-    df_work['LocationGroup'] = df_work[location_column].apply(get_location_group_ontology)
+    location_group = map_location_group_ontology(df[location_column])
     
-    # 2. 창고만 필터링 (현장 제외)
-    warehouse_groups = ['IndoorWarehouse', 'OutdoorWarehouse', 'DangerousCargoWarehouse']
-    warehouse_df = df_work[df_work['LocationGroup'].isin(warehouse_groups)].copy()
+    # 2. 창고만 필터링 (현장 제외) - 그룹 카테고리 정수 코드로 비교
+    warehouse_codes = [LOCATION_GROUPS.index(group) for group in WAREHOUSE_GROUPS]
+    warehouse_mask = np.isin(location_group.cat.codes.to_numpy(), warehouse_codes)
+    warehouse_df = _ontology_subset(df, warehouse_mask, location_column, location_group,
+                                    [quantity_col, amount_col])
     
     if warehouse_df.empty:
         print("⚠️ 창고 데이터가 없습니다.")
@@ -533,71 +981,84 @@ def create_ontology_warehouse_flow_v4(df, all_months, location_column='hasSite')
     
     print(f"📊 창고 데이터 필터링 결과: {len(warehouse_df):,}개 레코드")
     
-    # 3. 월별 컬럼 생성
-    warehouse_df['Month'] = pd.to_datetime(warehouse_df['hasDate']).dt.to_period("M")
-    
     print(f"📅 분석 기간: {all_months[0]} ~ {all_months[-1]} ({len(all_months)}개월)")
     
-    # 4. 입고/출고 수량 분리 (모든 데이터를 입고로 가정)
-    quantity_col = 'hasVolume_numeric' if 'hasVolume_numeric' in warehouse_df.columns else 'hasVolume'
-    amount_col = 'hasAmount_numeric' if 'hasAmount_numeric' in warehouse_df.columns else 'hasAmount'
+    # 3. 입고/출고 수량 분리 (모든 데이터를 입고로 가정)
+    in_qty_values = warehouse_df[quantity_col].to_numpy(np.float64)
     
-    if quantity_col not in warehouse_df.columns:
-        warehouse_df[quantity_col] = 0
-    if amount_col not in warehouse_df.columns:
-        warehouse_df[amount_col] = 0
+    # 4. 월별 집계 (창고 코드 × 월 코드 복합 정수 키로 groupby → (창고, 월) 2차원 배열)
+    # 다중 키 groupby 대신 단일 정수 키로 합계 (셀 내 덧셈 순서는 기존 groupby와 동일)
+    location_codes, warehouse_list = pd.factorize(warehouse_df[location_column], sort=True)
+    month_codes = all_months.get_indexer(warehouse_df['Month'])
+    valid = (location_codes >= 0) & (month_codes >= 0)
+    n_cells = len(warehouse_list) * len(all_months)
+    composite = location_codes[valid] * len(all_months) + month_codes[valid]
+    shape = (len(warehouse_list), len(all_months))
     
-    warehouse_df['InQty'] = warehouse_df[quantity_col]
-    warehouse_df['OutQty'] = 0  # 출고 데이터가 별도로 없으므로 0으로 설정
+    cell_counts = np.bincount(composite, minlength=n_cells)
     
-    # 5. 월별 집계
-    monthly_flow = warehouse_df.groupby([location_column, 'LocationGroup', 'Month']).agg({
-        'InQty': 'sum',
-        'OutQty': 'sum',
-        amount_col: 'sum'
-    }).round(2)
+    def _cell_sum(values):
+        cell_sums = pd.Series(values[valid]).groupby(composite, sort=False).sum()
+        sums = np.zeros(n_cells)
+        sums[cell_sums.index.to_numpy()] = cell_sums.to_numpy()
+        return sums.reshape(shape).round(2)
     
-    # 6. 재고 계산 (누적 입고)
-    monthly_flow['재고'] = monthly_flow.groupby(level=[0, 1])['InQty'].cumsum()
+    observed = cell_counts.reshape(shape) > 0
+    in_qty = _cell_sum(in_qty_values)
+    amount = _cell_sum(warehouse_df[amount_col].to_numpy(np.float64))
     
-    # 7. 전체 월 범위로 reindex
-    warehouse_list = monthly_flow.index.get_level_values(0).unique()
+    # 5. 재고 계산 (누적 입고, 거래가 없는 월은 0)
+    # (다른 집계 컬럼과 같이 소수 2자리로 반올림해 누적 오차 제거)
+    stock = np.where(observed, np.cumsum(in_qty, axis=1).round(2), 0.0)
     
-    # 위치별 그룹 매핑 생성
-    location_group_map = warehouse_df.drop_duplicates([location_column, 'LocationGroup']).set_index(location_column)['LocationGroup'].to_dict()
+    # 6. 전체 월 범위의 (창고, 월) 인덱스 구성 (거래가 있는 창고만)
+    has_rows = observed.any(axis=1)
+    warehouse_list = pd.Index(warehouse_list[has_rows]).astype(object)
     
-    multi_index_data = []
-    for location in warehouse_list:
-        group = location_group_map[location]
-        for month in all_months:
-            multi_index_data.append((location, group, month))
+    # 위치별 그룹 매핑 생성 (그룹은 위치명으로 결정되므로 창고 목록만 분류)
+    location_group_map = {location: get_location_group_ontology(location) for location in warehouse_list}
     
-    multi_index = pd.MultiIndex.from_tuples(
-        multi_index_data, 
-        names=[location_column, 'LocationGroup', 'Month']
+    multi_index = pd.MultiIndex.from_product(
+        [warehouse_list, all_months],
+        names=[location_column, 'Month']
     )
     
-    monthly_flow = monthly_flow.reindex(multi_index, fill_value=0)
+    monthly_flow = pd.DataFrame({
+        'InQty': in_qty[has_rows].ravel(),
+        amount_col: amount[has_rows].ravel(),
+        '재고': stock[has_rows].ravel()
+    }, index=multi_index)
     
-    # 8. 최종 포맷팅
+    # 7. 최종 포맷팅
     result = monthly_flow.reset_index()
-    result.columns = ['창고명', '위치그룹', '월', '입고', '출고', '금액', '재고']
+    result.columns = ['창고명', '월', '입고', '금액', '재고']
+    result.insert(1, '위치그룹', result['창고명'].map(location_group_map))
+    result.insert(result.columns.get_loc('입고') + 1, '출고', 0)  # 출고 데이터가 별도로 없으므로 0 (집계 대상에서 제외)
     
     print(f"✅ 온톨로지 기준 창고별 흐름 분석 완료: {len(warehouse_list)}개 창고, {len(all_months)}개월")
     
     return result
 
-def create_ontology_site_delivery_v4(df, all_months, location_column='hasSite'):
-    """온톨로지 기준 현장별 배송 현황 분석 v4"""
+def create_ontology_site_delivery_v4(df, all_months, location_column='hasSite',
+                                     quantity_col='hasVolume_numeric', amount_col='hasAmount_numeric'):
+    """
+    온톨로지 기준 현장별 배송 현황 분석 v4
+    
+    Args:
+        df: 위치/날짜(또는 Month)/수량/금액 컬럼을 가진 DataFrame
+        all_months: 전체 월 범위
+        location_column: 위치 컬럼명
+        quantity_col: 배송 수량 컬럼명 (결측 없는 숫자형)
+        amount_col: 금액 컬럼명 (결측 없는 숫자형)
+    """
     print("🔄 온톨로지 기준 현장별 배송 현황 분석 v4 시작...")
     
-    df_work = df.copy()
-    
     # 1. 온톨로지 기준 위치 그룹 분류
-    df_work['LocationGroup'] = df_work[location_column].apply(get_location_group_ontology)
+    location_group = map_location_group_ontology(df[location_column])
     
     # 2. 현장만 필터링
-    site_df = df_work[df_work['LocationGroup'] == 'Site'].copy()
+    site_df = _ontology_subset(df, location_group == 'Site', location_column, location_group,
+                               [quantity_col, amount_col])
     
     if site_df.empty:
         print("⚠️ 현장 데이터가 없습니다.")
@@ -606,17 +1067,8 @@ def create_ontology_site_delivery_v4(df, all_months, location_column='hasSite'):
     print(f"📊 현장 데이터 필터링 결과: {len(site_df):,}개 레코드")
     
     # 3. 월별 집계
-    site_df['Month'] = pd.to_datetime(site_df['hasDate']).dt.to_period("M")
-    
-    quantity_col = 'hasVolume_numeric' if 'hasVolume_numeric' in site_df.columns else 'hasVolume'
-    amount_col = 'hasAmount_numeric' if 'hasAmount_numeric' in site_df.columns else 'hasAmount'
-    
-    if quantity_col not in site_df.columns:
-        site_df[quantity_col] = 0
-    if amount_col not in site_df.columns:
-        site_df[amount_col] = 0
-    
-    site_delivery = site_df.groupby([location_column, 'Month']).agg({
+    site_df[location_column] = site_df[location_column].astype('category')
+    site_delivery = site_df.groupby([location_column, 'Month'], observed=True).agg({
         quantity_col: ['sum', 'count'],
         amount_col: 'sum'
     }).round(2)
@@ -624,14 +1076,24 @@ def create_ontology_site_delivery_v4(df, all_months, location_column='hasSite'):
     # 컬럼명 정리
     site_delivery.columns = ['배송수량', '배송횟수', '배송금액']
     
-    # 4. 전체 월 범위로 reindex
-    site_list = site_delivery.index.get_level_values(0).unique()
+    # 4. 전체 월 범위로 확장 (현장 x 전체월 골격에 관측 칸만 위치 기반으로 채움 → reindex 조인 생략)
+    site_codes, site_list = pd.factorize(site_delivery.index.get_level_values(0))
+    site_list = site_list.astype(object)
+    month_pos = all_months.get_indexer(site_delivery.index.get_level_values('Month'))
+    observed = month_pos >= 0
+    cells = site_codes[observed] * len(all_months) + month_pos[observed]
     multi_index = pd.MultiIndex.from_product(
         [site_list, all_months], 
         names=[location_column, 'Month']
     )
     
-    site_delivery = site_delivery.reindex(multi_index, fill_value=0)
+    columns = {}
+    for col in site_delivery.columns:
+        values = site_delivery[col].to_numpy()
+        filled = np.zeros(len(multi_index), dtype=values.dtype)
+        filled[cells] = values[observed]
+        columns[col] = filled
+    site_delivery = pd.DataFrame(columns, index=multi_index)
     
     # 5. 최종 포맷팅
     result = site_delivery.reset_index()
@@ -641,6 +1103,9 @@ def create_ontology_site_delivery_v4(df, all_months, location_column='hasSite'):
     
     return result
 
+# v4 파이프라인 리포트 단계에서 참조하는 컬럼
+V4_REPORT_COLUMNS = ['hasSite', 'hasDate', 'Month', 'hasAmount_numeric', 'hasVolume_numeric', 'LocationGroup']
+
 def run_ontology_8sheet_pipeline_v4(excel_path=None, mapping_rules_path=None):
     """온톨로지 기준 8시트 리포트 파이프라인 v4 실행"""
     print("🎯 온톨로지 기준 HVDC 8시트 리포트 파이프라인 v4 시작")
@@ -663,18 +1128,19 @@ def run_ontology_8sheet_pipeline_v4(excel_path=None, mapping_rules_path=None):
         with open(mapping_rules_path, encoding='utf-8') as f:
             mapping_rules = json.load(f)['field_map']
         
-        # 원본 데이터 로드 및 매핑
-        df_raw = pd.read_excel(excel_path)
+        # 원본 데이터 로드 및 매핑 (매핑 대상/날짜 컬럼만 파싱, calamine 엔진 우선)
+        date_cols = ['ETD/ATD', 'ETA/ATA']
+        needed_cols = set(mapping_rules) | set(date_cols)
+        df_raw = read_excel_fast(excel_path, usecols=lambda col: col in needed_cols)
         col_map = {k: v for k, v in mapping_rules.items() if k in df_raw.columns}
-        df = df_raw.rename(columns=col_map)
+        df = df_raw.rename(columns=col_map, copy=False)  # 컬럼명만 변경, 데이터 블록은 공유
         
-        # 필요 컬럼 추가
-        for needed in mapping_rules.values():
-            if needed not in df.columns:
-                df[needed] = 0
+        # 필요 컬럼 추가 (누락 컬럼을 모아 한 번에 0으로 추가)
+        missing_cols = [needed for needed in dict.fromkeys(mapping_rules.values()) if needed not in df.columns]
+        if missing_cols:
+            df[missing_cols] = 0
         
         # 날짜 컬럼 처리
-        date_cols = ['ETD/ATD', 'ETA/ATA']
         for col in date_cols:
             if col in df_raw.columns:
                 df['hasDate'] = pd.to_datetime(df_raw[col], errors='coerce')
@@ -683,19 +1149,26 @@ def run_ontology_8sheet_pipeline_v4(excel_path=None, mapping_rules_path=None):
             df['hasDate'] = pd.Timestamp.now()
         
         df['hasDate'] = df['hasDate'].fillna(pd.Timestamp.now())
+        del df_raw  # 원본(매핑 전) 프레임은 날짜 처리 이후 불필요
         
         # 수치 컬럼 처리
         df['hasAmount_numeric'] = pd.to_numeric(df['hasAmount'], errors='coerce').fillna(0)
         df['hasVolume_numeric'] = pd.to_numeric(df['hasVolume'], errors='coerce').fillna(0)
         
+        # 위치 컬럼은 object 대신 Arrow 문자열(미설치 시 category)로 보관 → strip/map/groupby가 Python 객체를 거치지 않음
+        df['hasSite'] = df['hasSite'].astype('string[pyarrow]' if pa is not None else 'category')
+        
         print(f"✅ 데이터 로드 및 매핑 완료: {df.shape[0]:,}개 레코드, {df.shape[1]}개 컬럼")
         
-        # 2. 월별 집계 준비
-        df['Billing Month'] = pd.to_datetime(df['hasDate']).dt.to_period("M")
-        all_months = pd.period_range(df['Billing Month'].min(), df['Billing Month'].max(), freq='M')
+        # 2. 월별 집계 준비 (hasDate는 위에서 이미 datetime, 월 변환은 여기서 한 번만 수행해 두 분석 함수가 재사용)
+        df['Month'] = df['hasDate'].dt.to_period("M")
+        all_months = pd.period_range(df['Month'].min(), df['Month'].max(), freq='M')
         
         # 3. 온톨로지 기준 분석
-        df['LocationGroup'] = df['hasSite'].apply(get_location_group_ontology)
+        df['LocationGroup'] = map_location_group_ontology(df['hasSite'])
+        
+        # 리포트 생성에 쓰이는 컬럼만 유지 (원본 문자열 금액/부피 등 해제)
+        df = df[V4_REPORT_COLUMNS]
         
         # 4. 리포트 생성
         reports = {}
@@ -711,26 +1184,34 @@ def run_ontology_8sheet_pipeline_v4(excel_path=None, mapping_rules_path=None):
             reports['현장별_배송현황'] = site_delivery
         
         # 온톨로지 분류 결과 요약
-        validation_result = df['LocationGroup'].value_counts().to_dict()
-        reports['온톨로지_분류결과'] = pd.DataFrame([
-            {"분류": "Indoor Warehouse", "위치": ", ".join(INDOOR_WAREHOUSE), "건수": validation_result.get('IndoorWarehouse', 0)},
-            {"분류": "Outdoor Warehouse", "위치": ", ".join(OUTDOOR_WAREHOUSE), "건수": validation_result.get('OutdoorWarehouse', 0)},
-            {"분류": "Site", "위치": ", ".join(SITE), "건수": validation_result.get('Site', 0)},
-            {"분류": "Dangerous Cargo", "위치": ", ".join(DANGEROUS_CARGO), "건수": validation_result.get('DangerousCargoWarehouse', 0)},
-            {"분류": "UNKNOWN", "위치": "알려지지 않은 위치", "건수": validation_result.get('UNKNOWN', 0)}
-        ])
-        
-        # 5. Excel 저장
+        # (LocationGroup 카테고리 = LOCATION_GROUPS 순서이므로 value_counts(sort=False)가 그대로 행 순서)
+        group_counts = df['LocationGroup'].value_counts(sort=False).reindex(LOCATION_GROUPS, fill_value=0)
+        reports['온톨로지_분류결과'] = pd.DataFrame({
+            "분류": ["Indoor Warehouse", "Outdoor Warehouse", "Site", "Dangerous Cargo", "UNKNOWN"],
+            "위치": [", ".join(INDOOR_WAREHOUSE), ", ".join(OUTDOOR_WAREHOUSE), ", ".join(SITE),
+                   ", ".join(DANGEROUS_CARGO), "알려지지 않은 위치"],
+            "건수": group_counts.to_numpy()
+        })
+        
+        # 5. Excel 저장 (집계 중간 객체를 먼저 회수해 기록 단계의 최대 메모리 축소)
+        gc.collect()
         timestamp = datetime.now().strftime('%Y%m%d_%H%M')
         output_path = f"HVDC_온톨로지기준_8시트리포트_{timestamp}.xlsx"
         
         print(f"💾 온톨로지 기준 8시트 Excel 리포트 저장 중: {output_path}")
         
-        with pd.ExcelWriter(output_path, engine="xlsxwriter") as writer:
+        # constant_memory: 행 단위로 기록 즉시 flush (to_excel 대신 write_frame_rows로 행 순서 기록)
+        workbook = xlsxwriter.Workbook(output_path, {"constant_memory": True})
+        header_format = workbook.add_format(HEADER_FORMAT)
+        datetime_format = workbook.add_format({**HEADER_FORMAT, "num_format": DATETIME_FORMAT})
+        try:
             for sheet_name, report_df in reports.items():
                 if isinstance(report_df, pd.DataFrame):
                     safe_sheet_name = sheet_name[:31] if len(sheet_name) > 31 else sheet_name
-                    report_df.to_excel(writer, sheet_name=safe_sheet_name, index=False)
+                    worksheet = workbook.add_worksheet(safe_sheet_name)
+                    write_frame_rows(worksheet, report_df, header_format, datetime_format, index=False)
+        finally:
+            workbook.close()
         
         # 6. 결과 요약
         end_time = datetime.now()
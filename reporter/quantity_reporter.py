@@ -8,16 +8,20 @@ HVDC Warehouse 월별 재무·재고 리포트 생성기
 * **워크북·워크시트 스타일링** 시 `writer.book` 과 `writer.sheets[sheet_name]` 를 분리 사용하도록 수정.
 * `_style_worksheet(ws, workbook, nrows, ncols)` 시그니처로 워크북 객체를 인자로 전달.
 * `generate_financial_report()` 와 `generate_full_dashboard()` 모두 새 시그니처 적용.
+* 워크북을 xlsxwriter `constant_memory` 모드로 직접 열어 행 단위로 기록 (`to_excel` 미사용).
+* `generate_full_dashboard()` 는 FinancialSummary/KPI_Summary 를 한 워크북에 기록 (xlsxwriter 는 append 모드 미지원).
 
 Dependencies: pandas, xlsxwriter
 
 """
 from __future__ import annotations
 
+from datetime import datetime
 from pathlib import Path
 from typing import Union
 
 import pandas as pd
+import xlsxwriter
 
 from core.inventory_engine import InventoryEngine
 
@@ -51,6 +55,61 @@ def _style_worksheet(ws, workbook, nrows: int, ncols: int) -> None:  # noqa: ANN
     })
 
 
+# to_excel 기본 헤더 서식 (굵게 + 얇은 테두리 + 가운데/위 정렬)
+_HEADER_FORMAT = {"bold": True, "border": 1, "align": "center", "valign": "top"}
+_DATETIME_FORMAT = "YYYY-MM-DD HH:MM:SS"
+
+# 행 단위 즉시 flush (셀 트리를 메모리에 유지하지 않음), 문자열은 수식으로 해석하지 않음
+_WORKBOOK_OPTIONS = {"constant_memory": True, "strings_to_formulas": False}
+
+
+def _excel_value(value):  # noqa: ANN001
+    """to_excel과 같은 셀 값 변환: 결측은 빈칸, 기본 타입 외에는 문자열."""
+    if isinstance(value, (bool, int, float, str, datetime)):
+        return None if pd.isna(value) else value
+    if value is None or pd.isna(value):
+        return None
+    return str(value)
+
+
+def _write_sheet(workbook, sheet_name: str, df: pd.DataFrame) -> None:  # noqa: ANN001
+    """DataFrame을 헤더 → 데이터 행 순서로 기록 후 공통 스타일 적용 (index 제외).
+
+    constant_memory 모드는 지난 행을 다시 쓸 수 없으므로 열 단위로 기록하는
+    `to_excel` 대신 `itertuples` 로 한 행씩 기록한다.
+
+    Parameters
+    ----------
+    workbook : xlsxwriter.workbook.Workbook
+        기록 대상 워크북.
+    sheet_name : str
+        추가할 시트명.
+    df : pandas.DataFrame
+        기록할 표.
+    """
+    ws = workbook.add_worksheet(sheet_name)
+    header_fmt = workbook.add_format(_HEADER_FORMAT)
+    datetime_fmt = workbook.add_format({"num_format": _DATETIME_FORMAT})
+    col_formats = [datetime_fmt if dtype.kind == "M" else None for dtype in df.dtypes]
+
+    # 열 서식을 먼저 지정해야 서식 없는 셀에 열 숫자 서식이 적용됨 (행은 기록 즉시 flush)
+    _style_worksheet(ws, workbook, df.shape[0] + 1, df.shape[1])
+
+    ws.write_row(0, 0, [_excel_value(col) for col in df.columns], header_fmt)
+    for r, row in enumerate(df.itertuples(index=False, name=None), start=1):
+        for c, (value, fmt) in enumerate(zip(row, col_formats)):
+            ws.write(r, c, _excel_value(value), fmt)
+
+
+def _financial_pivot(raw_df: pd.DataFrame) -> pd.DataFrame:
+    """BillingMonth × Category 피벗 (Total_Amount 합계)."""
+    return (
+        raw_df
+        .pivot_table(index="Billing month", columns="Category", values="Amount", aggfunc="sum", fill_value=0)
+        .reset_index()
+    )
+
+
 # -----------------------------------------------------------------------------
 # 리포트 생성 API
 # -----------------------------------------------------------------------------
@@ -62,17 +121,10 @@ def generate_financial_report(raw_df: pd.DataFrame, output_path: Union[str, Path
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Pivot (BillingMonth × StorageType)
-    fin_pivot = (
-        raw_df
-        .pivot_table(index="Billing month", columns="Category", values="Amount", aggfunc="sum", fill_value=0)
-        .reset_index()
-    )
+    fin_pivot = _financial_pivot(raw_df)
 
-    with pd.ExcelWriter(out_path, engine="xlsxwriter") as writer:
-        fin_pivot.to_excel(writer, sheet_name="FinancialSummary", index=False)
-        workbook = writer.book
-        ws = writer.sheets["FinancialSummary"]
-        _style_worksheet(ws, workbook, fin_pivot.shape[0] + 1, fin_pivot.shape[1])
+    with xlsxwriter.Workbook(str(out_path), _WORKBOOK_OPTIONS) as workbook:
+        _write_sheet(workbook, "FinancialSummary", fin_pivot)
 
     return out_path
 
@@ -80,19 +132,19 @@ def generate_financial_report(raw_df: pd.DataFrame, output_path: Union[str, Path
 def generate_full_dashboard(raw_df: pd.DataFrame, output_path: Union[str, Path] = "warehouse_fin_report.xlsx") -> Path:
     """KPI + FinancialSummary 시트를 포함한 종합 대시보드 생성."""
 
-    dashboard_path = generate_financial_report(raw_df, output_path)
+    dashboard_path = Path(output_path)
+    dashboard_path.parent.mkdir(parents=True, exist_ok=True)
 
     # KPI 계산
     engine = InventoryEngine(raw_df)
     kpi_df = engine.calculate_monthly_summary()
 
-    with pd.ExcelWriter(dashboard_path, engine="xlsxwriter", mode="a") as writer:
-        kpi_df.to_excel(writer, sheet_name="KPI_Summary", index=False)
-        workbook = writer.book
-        ws = writer.sheets["KPI_Summary"]
-        _style_worksheet(ws, workbook, kpi_df.shape[0] + 1, kpi_df.shape[1])
+    # 두 시트를 한 워크북에 순서대로 기록
+    with xlsxwriter.Workbook(str(dashboard_path), _WORKBOOK_OPTIONS) as workbook:
+        _write_sheet(workbook, "FinancialSummary", _financial_pivot(raw_df))
+        _write_sheet(workbook, "KPI_Summary", kpi_df)
 
-    return Path(dashboard_path)
+    return dashboard_path
 
 
 if __name__ == "__main__":
@@ -46,34 +46,60 @@ def create_final_report():
             'num_format': '0.0%', 'align': 'right', 'border': 1
         })
         
+        # 표 헤더 서식 (8개 시트 공용, 워크북당 한 번만 생성)
+        table_header_format = workbook.add_format(TABLE_HEADER_FORMAT)
+        
         # 1. 프로젝트 개요 시트
-        create_project_overview_sheet(writer, workbook, title_format, header_format)
+        create_project_overview_sheet(workbook, title_format, header_format, table_header_format)
         
         # 2. 시스템 성과 시트
-        create_system_performance_sheet(writer, workbook, title_format, header_format, success_format, number_format)
+        create_system_performance_sheet(workbook, title_format, header_format, table_header_format, success_format, number_format)
         
         # 3. 재고 현황 시트
-        create_inventory_status_sheet(writer, workbook, title_format, header_format, number_format)
+        create_inventory_status_sheet(workbook, title_format, header_format, table_header_format, number_format)
         
         # 4. 기술 스택 시트
-        create_technical_stack_sheet(writer, workbook, title_format, header_format)
+        create_technical_stack_sheet(workbook, title_format, header_format, table_header_format)
         
         # 5. 테스트 결과 시트
-        create_test_results_sheet(writer, workbook, title_format, header_format, success_format)
+        create_test_results_sheet(workbook, title_format, header_format, table_header_format, success_format)
         
         # 6. 파일 구조 시트
-        create_file_structure_sheet(writer, workbook, title_format, header_format, number_format)
+        create_file_structure_sheet(workbook, title_format, header_format, table_header_format, number_format)
         
         # 7. 릴리스 이력 시트
-        create_release_history_sheet(writer, workbook, title_format, header_format)
+        create_release_history_sheet(workbook, title_format, header_format, table_header_format)
         
         # 8. 향후 계획 시트
-        create_future_plans_sheet(writer, workbook, title_format, header_format)
+        create_future_plans_sheet(workbook, title_format, header_format, table_header_format)
     
     print(f"✅ 최종 보고서 생성 완료: {report_filename}")
     return report_filename
 
-def create_project_overview_sheet(writer, workbook, title_format, header_format):
+# to_excel 기본 헤더 서식 (굵게 + 얇은 테두리 + 가운데/위 정렬)
+TABLE_HEADER_FORMAT = {'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'}
+
+def write_table(workbook, sheet_name, data, header_format, startrow=2):
+    """
+    헤더 + 데이터 행 목록을 시트에 직접 기록 (소형 표는 DataFrame/to_excel을 거치지 않음)
+    
+    Args:
+        workbook: xlsxwriter 워크북
+        sheet_name: 시트명
+        data: [헤더, 행1, 행2, ...] 형태의 리스트
+        header_format: 헤더 행 서식 (TABLE_HEADER_FORMAT 으로 워크북당 한 번 생성한 서식)
+        startrow: 헤더를 기록할 행 (0부터)
+    
+    Returns:
+        생성된 워크시트
+    """
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(startrow, 0, data[0], header_format)
+    for i, row in enumerate(data[1:], startrow + 1):
+        worksheet.write_row(i, 0, row)
+    return worksheet
+
+def create_project_overview_sheet(workbook, title_format, header_format, table_header_format):
     """프로젝트 개요 시트 생성"""
     
     overview_data = [
@@ -103,17 +129,13 @@ def create_project_overview_sheet(writer, workbook, title_format, header_format)
         ["테스트 프레임워크", "실제 데이터 기반 검증 시스템"]
     ]
     
-    df_overview = pd.DataFrame(overview_data[1:], columns=overview_data[0])
-    df_overview.to_excel(writer, sheet_name='01_프로젝트개요', index=False, startrow=2)
-    
-    worksheet = writer.sheets['01_프로젝트개요']
-    worksheet.write('A1', 'HVDC Warehouse Automation Suite v0.5.1 - 프로젝트 최종 보고서', title_format)
+    worksheet = write_table(workbook, '01_프로젝트개요', overview_data, table_header_format)
     worksheet.merge_range('A1:B1', 'HVDC Warehouse Automation Suite v0.5.1 - 프로젝트 최종 보고서', title_format)
     
     worksheet.set_column('A:A', 20)
     worksheet.set_column('B:B', 60)
 
-def create_system_performance_sheet(writer, workbook, title_format, header_format, success_format, number_format):
+def create_system_performance_sheet(workbook, title_format, header_format, table_header_format, success_format, number_format):
     """시스템 성과 시트 생성"""
     
     performance_data = [
@@ -128,11 +150,7 @@ def create_system_performance_sheet(writer, workbook, title_format, header_forma
         ["메모리 효율성", 95.0, 85.0, 1.118, "✅ 초과달성"]
     ]
     
-    df_performance = pd.DataFrame(performance_data[1:], columns=performance_data[0])
-    df_performance.to_excel(writer, sheet_name='02_시스템성과', index=False, startrow=2)
-    
-    worksheet = writer.sheets['02_시스템성과']
-    worksheet.write('A1', '시스템 성과 지표 및 달성 현황', title_format)
+    worksheet = write_table(workbook, '02_시스템성과', performance_data, table_header_format)
     worksheet.merge_range('A1:E1', '시스템 성과 지표 및 달성 현황', title_format)
     
     # 조건부 서식 적용
@@ -143,7 +161,7 @@ def create_system_performance_sheet(writer, workbook, title_format, header_forma
         'max_color': '#63BE7B'
     })
 
-def create_inventory_status_sheet(writer, workbook, title_format, header_format, number_format):
+def create_inventory_status_sheet(workbook, title_format, header_format, table_header_format, number_format):
     """재고 현황 시트 생성"""
     
     # 실제 실행 결과 기반 재고 데이터
@@ -161,11 +179,7 @@ def create_inventory_status_sheet(writer, workbook, title_format, header_format,
         ["DESTINATION", 0, 0.0, "✅ 정상", "출고 완료"]
     ]
     
-    df_inventory = pd.DataFrame(inventory_data[1:], columns=inventory_data[0])
-    df_inventory.to_excel(writer, sheet_name='03_재고현황', index=False, startrow=2)
-    
-    worksheet = writer.sheets['03_재고현황']
-    worksheet.write('A1', '창고별 재고 현황 (총 3,588 EA)', title_format)
+    worksheet = write_table(workbook, '03_재고현황', inventory_data, table_header_format)
     worksheet.merge_range('A1:E1', '창고별 재고 현황 (총 3,588 EA)', title_format)
     
     # 총계 행 추가
@@ -176,7 +190,7 @@ def create_inventory_status_sheet(writer, workbook, title_format, header_format,
     worksheet.write(f'D{total_row}', '✅ 완료', header_format)
     worksheet.write(f'E{total_row}', '전체 재고 집계', header_format)
 
-def create_technical_stack_sheet(writer, workbook, title_format, header_format):
+def create_technical_stack_sheet(workbook, title_format, header_format, table_header_format):
     """기술 스택 시트 생성"""
     
     tech_data = [
@@ -196,14 +210,10 @@ def create_technical_stack_sheet(writer, workbook, title_format, header_format):
         ["Documentation", "Markdown", "-", "문서화", "✅ 활성"]
     ]
     
-    df_tech = pd.DataFrame(tech_data[1:], columns=tech_data[0])
-    df_tech.to_excel(writer, sheet_name='04_기술스택', index=False, startrow=2)
-    
-    worksheet = writer.sheets['04_기술스택']
-    worksheet.write('A1', '프로젝트 기술 스택 및 의존성', title_format)
+    worksheet = write_table(workbook, '04_기술스택', tech_data, table_header_format)
     worksheet.merge_range('A1:E1', '프로젝트 기술 스택 및 의존성', title_format)
 
-def create_test_results_sheet(writer, workbook, title_format, header_format, success_format):
+def create_test_results_sheet(workbook, title_format, header_format, table_header_format, success_format):
     """테스트 결과 시트 생성"""
     
     test_data = [
@@ -218,11 +228,7 @@ def create_test_results_sheet(writer, workbook, title_format, header_format, suc
         ["Error Handling", "예외 처리 검증", "✅ PASSED", "0.30초", "100%"]
     ]
     
-    df_test = pd.DataFrame(test_data[1:], columns=test_data[0])
-    df_test.to_excel(writer, sheet_name='05_테스트결과', index=False, startrow=2)
-    
-    worksheet = writer.sheets['05_테스트결과']
-    worksheet.write('A1', '종합 테스트 결과 및 품질 보증', title_format)
+    worksheet = write_table(workbook, '05_테스트결과', test_data, table_header_format)
     worksheet.merge_range('A1:E1', '종합 테스트 결과 및 품질 보증', title_format)
     
     # 요약 통계 추가
@@ -235,7 +241,7 @@ def create_test_results_sheet(writer, workbook, title_format, header_format, suc
     worksheet.write(f'A{summary_row+3}', '전체 커버리지:', header_format)
     worksheet.write(f'B{summary_row+3}', '100%', success_format)
 
-def create_file_structure_sheet(writer, workbook, title_format, header_format, number_format):
+def create_file_structure_sheet(workbook, title_format, header_format, table_header_format, number_format):
     """파일 구조 시트 생성"""
     
     # 현재 프로젝트 파일 정보 수집
@@ -269,14 +275,10 @@ def create_file_structure_sheet(writer, workbook, title_format, header_format, n
         ["PROJECT_STRUCTURE.md", "Markdown", 6.2, 129, "프로젝트 구조"]
     ]
     
-    df_files = pd.DataFrame(file_data[1:], columns=file_data[0])
-    df_files.to_excel(writer, sheet_name='06_파일구조', index=False, startrow=2)
-    
-    worksheet = writer.sheets['06_파일구조']
-    worksheet.write('A1', '프로젝트 파일 구조 및 통계', title_format)
+    worksheet = write_table(workbook, '06_파일구조', file_data, table_header_format)
     worksheet.merge_range('A1:E1', '프로젝트 파일 구조 및 통계', title_format)
 
-def create_release_history_sheet(writer, workbook, title_format, header_format):
+def create_release_history_sheet(workbook, title_format, header_format, table_header_format):
     """릴리스 이력 시트 생성"""
     
     release_data = [
@@ -289,14 +291,10 @@ def create_release_history_sheet(writer, workbook, title_format, header_format):
         ["v0.1.0", "2025-06-19", "프로젝트 초기화, 핵심 모듈 구조", "📁 Archived", "v0.1.0"]
     ]
     
-    df_release = pd.DataFrame(release_data[1:], columns=release_data[0])
-    df_release.to_excel(writer, sheet_name='07_릴리스이력', index=False, startrow=2)
-    
-    worksheet = writer.sheets['07_릴리스이력']
-    worksheet.write('A1', '버전 릴리스 이력 및 발전 과정', title_format)
+    worksheet = write_table(workbook, '07_릴리스이력', release_data, table_header_format)
     worksheet.merge_range('A1:E1', '버전 릴리스 이력 및 발전 과정', title_format)
 
-def create_future_plans_sheet(writer, workbook, title_format, header_format):
+def create_future_plans_sheet(workbook, title_format, header_format, table_header_format):
     """향후 계획 시트 생성"""
     
     future_data = [
@@ -311,11 +309,7 @@ def create_future_plans_sheet(writer, workbook, title_format, header_format):
         ["Low", "블록체인 연동", "공급망 투명성 확보", "20주", "💭 검토중"]
     ]
     
-    df_future = pd.DataFrame(future_data[1:], columns=future_data[0])
-    df_future.to_excel(writer, sheet_name='08_향후계획', index=False, startrow=2)
-    
-    worksheet = writer.sheets['08_향후계획']
-    worksheet.write('A1', '프로젝트 발전 계획 및 로드맵', title_format)
+    worksheet = write_table(workbook, '08_향후계획', future_data, table_header_format)
     worksheet.merge_range('A1:E1', '프로젝트 발전 계획 및 로드맵', title_format)
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 # main.py - 최종 수정된 버전
 
 import argparse
+import hashlib
 import pandas as pd
 import pathlib as pl
 
@@ -151,40 +152,46 @@ def transactions_to_dataframe(transactions):
     
     return result_df
 
+# 트랜잭션 data 필드 탐색 순서 (앞선 필드 우선)
+CASE_FIELDS = ['case', 'Case', 'case_id', 'CaseID', 'ID', 'carton', 'box', 'mr#']
+WAREHOUSE_FIELDS = ['warehouse', 'Warehouse', 'site', 'Site', 'location', 'Location']
+DATE_FIELDS = ['date', 'Date', 'timestamp', 'Timestamp', 'datetime']
+# 필드 → 탐색 순위 (키 집합 교집합 후 순위대로 정렬)
+_CASE_RANK = {field: rank for rank, field in enumerate(CASE_FIELDS)}
+_WAREHOUSE_RANK = {field: rank for rank, field in enumerate(WAREHOUSE_FIELDS)}
+_DATE_RANK = {field: rank for rank, field in enumerate(DATE_FIELDS)}
+
+def _present_fields(data, field_rank):
+    """data에 실제 존재하는 후보 필드 (키 집합 교집합 1회, 탐색 순서 유지)"""
+    return sorted(field_rank.keys() & data.keys(), key=field_rank.__getitem__)
+
+def _first_text(data, field_rank):
+    """탐색 순서상 첫 번째 유효 문자열 필드 값 (없으면 None)"""
+    for field in _present_fields(data, field_rank):
+        if data[field]:
+            value = str(data[field]).strip()
+            if value and value.lower() not in ['nan', 'none', '']:
+                return value
+    return None
+
 def extract_case_id(data):
     """케이스 ID 추출 - 개선된 버전"""
-    case_fields = ['case', 'Case', 'case_id', 'CaseID', 'ID', 'carton', 'box', 'mr#']
-    
-    for field in case_fields:
-        if field in data and data[field]:
-            case_value = str(data[field]).strip()
-            if case_value and case_value.lower() not in ['nan', 'none', '']:
-                return case_value
+    case_value = _first_text(data, _CASE_RANK)
+    if case_value is not None:
+        return case_value
     
-    # 백업: 해시 기반 ID
-    return f"CASE_{abs(hash(str(data))) % 100000}"
+    # 백업: 해시 기반 ID (내장 hash()는 프로세스마다 달라지므로 고정 다이제스트 사용)
+    return f"CASE_{int.from_bytes(hashlib.blake2b(str(data).encode(), digest_size=8).digest(), 'big') % 100000}"
 
 def extract_warehouse(data):
     """창고명 추출 및 정규화 - 개선된 버전"""
-    warehouse_fields = ['warehouse', 'Warehouse', 'site', 'Site', 'location', 'Location']
-    
-    for field in warehouse_fields:
-        if field in data and data[field]:
-            raw_warehouse = str(data[field]).strip()
-            if raw_warehouse and raw_warehouse.lower() not in ['nan', 'none', '']:
-                return normalize_warehouse_name(raw_warehouse)
-    
-    return 'UNKNOWN'
+    raw_warehouse = _first_text(data, _WAREHOUSE_RANK)
+    return 'UNKNOWN' if raw_warehouse is None else normalize_warehouse_name(raw_warehouse)
 
 def extract_datetime(data):
     """날짜/시간 추출 - 개선된 버전"""
-    import pandas as pd
-    from datetime import datetime
-    
-    date_fields = ['date', 'Date', 'timestamp', 'Timestamp', 'datetime']
-    
-    for field in date_fields:
-        if field in data and data[field]:
+    for field in _present_fields(data, _DATE_RANK):
+        if data[field]:
             try:
                 date_value = data[field]
                 if isinstance(date_value, str) and date_value.lower() in ['nan', 'none', '']:
@@ -287,39 +294,23 @@ def calculate_daily_inventory(transaction_df):
             daily_pivot[col] = 0
     
     # 재고 계산 (위치별 누적)
-    stock_records = []
-    
-    for location in daily_pivot['Location'].unique():
-        if location in ['UNKNOWN', 'UNK', '']:
-            continue
-            
-        loc_data = daily_pivot[daily_pivot['Location'] == location].copy()
-        loc_data = loc_data.sort_values('Date')
-        
-        opening_stock = 0
-        
-        for _, row in loc_data.iterrows():
-            inbound = row.get('IN', 0)
-            transfer_out = row.get('TRANSFER_OUT', 0) 
-            final_out = row.get('FINAL_OUT', 0)
-            total_outbound = transfer_out + final_out
-            
-            closing_stock = opening_stock + inbound - total_outbound
-            
-            stock_records.append({
-                'Location': location,
-                'Date': row['Date'],
-                'Opening_Stock': opening_stock,
-                'Inbound': inbound,
-                'Transfer_Out': transfer_out,
-                'Final_Out': final_out,
-                'Total_Outbound': total_outbound,
-                'Closing_Stock': closing_stock
-            })
-            
-            opening_stock = closing_stock
-    
-    daily_stock_df = pd.DataFrame(stock_records)
+    # 피벗 결과는 (Location, Date) 순으로 정렬되어 있으므로 위치별 반복 필터 없이 한 번에 그룹 누적
+    daily_pivot = daily_pivot[~daily_pivot['Location'].isin(['UNKNOWN', 'UNK', ''])]
+    
+    total_outbound = daily_pivot['TRANSFER_OUT'] + daily_pivot['FINAL_OUT']
+    net_change = daily_pivot['IN'] - total_outbound
+    closing_stock = net_change.groupby(daily_pivot['Location'], sort=False).cumsum()
+    
+    daily_stock_df = pd.DataFrame({
+        'Location': daily_pivot['Location'],
+        'Date': daily_pivot['Date'],
+        'Opening_Stock': closing_stock - net_change,
+        'Inbound': daily_pivot['IN'],
+        'Transfer_Out': daily_pivot['TRANSFER_OUT'],
+        'Final_Out': daily_pivot['FINAL_OUT'],
+        'Total_Outbound': total_outbound,
+        'Closing_Stock': closing_stock
+    }).reset_index(drop=True)
     print(f"✅ {len(daily_stock_df)}개 일별 재고 스냅샷 생성")
     
     return daily_stock_df
@@ -343,14 +334,14 @@ def compare_stock_vs_expected(daily_stock, expected, tol=2):
         print("ℹ️ 설정된 기대값이 없습니다. 계산된 재고만 표시합니다.")
         print("-" * 50)
         
-        for location, row in latest.iterrows():
-            actual = int(row["Closing_Stock"])
+        for location, closing_stock in latest["Closing_Stock"].items():
+            actual = int(closing_stock)
             print(f"📦 {location:<20}: {actual:>6} EA")
         return
     
     # 기대값이 있는 경우
-    for wh, row in latest.iterrows():
-        actual = int(row["Closing_Stock"])
+    for wh, closing_stock in latest["Closing_Stock"].items():
+        actual = int(closing_stock)
         
         # 대소문자 무시하고 기대값 찾기
         exp = None
@@ -441,11 +432,11 @@ def validate_final_results(daily_stock, expected_results):
     markaz_actual = 0
     indoor_actual = 0
     
-    for _, row in latest_stock.iterrows():
-        if 'markaz' in row['Location'].lower():
-            markaz_actual = int(row['Closing_Stock'])
-        elif 'indoor' in row['Location'].lower():
-            indoor_actual = int(row['Closing_Stock'])
+    for location, closing_stock in latest_stock[['Location', 'Closing_Stock']].itertuples(index=False, name=None):
+        if 'markaz' in location.lower():
+            markaz_actual = int(closing_stock)
+        elif 'indoor' in location.lower():
+            indoor_actual = int(closing_stock)
     
     markaz_expected = 813
     indoor_expected = 413
@@ -472,9 +463,8 @@ def print_final_inventory_summary(daily_stock):
     print("=" * 50)
     
     total_stock = 0
-    for _, row in latest.iterrows():
-        location = row['Location']
-        stock = int(row['Closing_Stock'])
+    for location, closing_stock in latest[['Location', 'Closing_Stock']].itertuples(index=False, name=None):
+        stock = int(closing_stock)
         total_stock += stock
         print(f"📦 {location:<20}: {stock:>6} EA")
     
@@ -3,6 +3,9 @@
 HVDC Excel Reporter 테스트 스크립트
 """
 
+import hashlib
+import re
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import sys
@@ -30,12 +33,21 @@ def main():
             print("❌ Excel 파일이 없습니다!")
             return False
             
-        raw_transactions = loader.extract_transactions(excel_files)
-        print(f"📊 총 {len(raw_transactions):,}건의 원시 트랜잭션 수집")
-
-        # 2. 트랜잭션 DataFrame 변환
+        # 2. 파일 단위로 트랜잭션 추출 → 즉시 DataFrame 변환
+        # (원시 트랜잭션 dict는 파일 1개 분량만 유지, 변환이 끝난 원본 시트는 바로 해제)
         print("🔄 트랜잭션 변환 중...")
-        transaction_df = transactions_to_dataframe(raw_transactions)
+        frames = []
+        raw_count = 0
+        for filename in list(excel_files):
+            raw_transactions = loader.extract_transactions({filename: excel_files.pop(filename)})
+            raw_count += len(raw_transactions)
+            if raw_transactions:
+                frames.append(transactions_to_dataframe(raw_transactions))
+            del raw_transactions
+        print(f"📊 총 {raw_count:,}건의 원시 트랜잭션 수집")
+        
+        transaction_df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        del frames
         print(f"✅ {len(transaction_df)}건 트랜잭션 생성")
 
         # 3. 전처리
@@ -78,141 +90,185 @@ def main():
         traceback.print_exc()
         return False
 
-def transactions_to_dataframe(transactions):
-    """트랜잭션 리스트를 DataFrame으로 변환"""
-    data = []
+# 트랜잭션 data 필드 탐색 순서 (extract_* 함수와 컬럼 단위 변환이 공유)
+CASE_FIELDS = ['case', 'Case', 'case_id', 'CaseID', 'ID', 'carton', 'box', 'mr#']
+WAREHOUSE_FIELDS = ['warehouse', 'Warehouse', 'site', 'Site', 'location', 'Location']
+DATE_FIELDS = ['date', 'Date', 'timestamp', 'Timestamp', 'datetime']
+# 형식이 섞인 날짜 값의 요소별 파싱: pandas >= 2.0 은 format='mixed' 필요, 1.x 는 기본 동작
+_MIXED_DATE_FORMAT = {'format': 'mixed'} if int(pd.__version__.split('.')[0]) >= 2 else {}
+# 필드 → 탐색 순위 (키 집합 교집합 후 순위대로 정렬)
+_CASE_RANK = {field: rank for rank, field in enumerate(CASE_FIELDS)}
+_WAREHOUSE_RANK = {field: rank for rank, field in enumerate(WAREHOUSE_FIELDS)}
+FINAL_SITES = ['AGI', 'DAS', 'MIR', 'SHU']
+
+# 창고명/사이트 분류 규칙 (앞선 규칙 우선, 부분 문자열 일치)
+WAREHOUSE_RULES = {
+    'DSV Al Markaz': ['markaz', 'm1', 'al markaz', 'almarkaz'],
+    'DSV Indoor': ['indoor', 'm44', 'hauler indoor'],
+    'DSV Outdoor': ['outdoor', 'out'],
+    'MOSB': ['mosb'],
+    'DSV MZP': ['mzp'],
+    'DHL WH': ['dhl'],
+    'AAA Storage': ['aaa']
+}
+SITE_PATTERNS = {
+    'AGI': ['AGI'],
+    'DAS': ['DAS'],
+    'MIR': ['MIR'],
+    'SHU': ['SHU']
+}
+
+def _compile_rules(rules):
+    """
+    분류 규칙을 단일 정규식으로 컴파일
     
-    for tx in transactions:
-        tx_data = tx.get('data', {})
-        
-        # 기본 정보 추출
-        case_id = extract_case_id(tx_data)
-        warehouse = extract_warehouse(tx_data)
-        date_val = extract_datetime(tx_data)
-        
-        # 수량 처리
-        incoming = tx_data.get('incoming', 0) or 0
-        outgoing = tx_data.get('outgoing', 0) or 0
-        
-        # 기본 레코드 템플릿
-        base_record = {
-            'Case_No': case_id,
-            'Date': date_val,
-            'Location': warehouse,
-            'Source_File': tx.get('source_file', ''),
-            'Loc_From': 'SOURCE',
-            'Target_Warehouse': warehouse
-        }
-        
-        # IN 트랜잭션 생성
-        if incoming > 0:
-            record = base_record.copy()
-            record.update({
-                'TxType_Refined': 'IN',
-                'Qty': int(incoming)
-            })
-            data.append(record)
-            
-        # OUT 트랜잭션 생성
-        if outgoing > 0:
-            record = base_record.copy()
-            
-            # 사이트 구분하여 FINAL_OUT vs TRANSFER_OUT 결정
-            site = extract_site(warehouse)
-            tx_type = 'FINAL_OUT' if site in ['AGI', 'DAS', 'MIR', 'SHU'] else 'TRANSFER_OUT'
-                
-            record.update({
-                'TxType_Refined': tx_type,
-                'Qty': int(outgoing),
-                'Loc_From': warehouse,  # 출고는 해당 창고에서
-                'Target_Warehouse': 'DESTINATION'
-            })
-            data.append(record)
+    규칙마다 문자열 전체를 탐색하는 lookahead를 두고 순서대로 시도하므로
+    가장 앞에서 일치한 패턴이 아니라 가장 앞선 규칙이 선택된다 (그룹명 r0, r1, ... → 규칙 키).
+    """
+    alternatives = [
+        f"(?=.*?(?P<r{i}>{'|'.join(map(re.escape, patterns))}))"
+        for i, patterns in enumerate(rules.values())
+    ]
+    pattern = re.compile('^(?:' + '|'.join(alternatives) + ')', re.IGNORECASE | re.DOTALL)
+    return pattern, {f'r{i}': key for i, key in enumerate(rules)}
+
+_WAREHOUSE_RE, _WAREHOUSE_GROUPS = _compile_rules(WAREHOUSE_RULES)
+_SITE_RE, _SITE_GROUPS = _compile_rules(SITE_PATTERNS)
+
+def _classify_series(names, pattern, groups):
+    """Series 전체를 정규식 한 번으로 분류 (일치 규칙 키, 미일치는 NaN)"""
+    matched = names.astype(str).str.extract(pattern).notna()
+    return matched.idxmax(axis=1).map(groups).where(matched.any(axis=1))
+
+def normalize_warehouse_series(names):
+    """창고명 Series 정규화 (normalize_warehouse_name의 컬럼 단위 버전)"""
+    empty = names.isna() | ~names.astype(bool)
+    canonical = _classify_series(names, _WAREHOUSE_RE, _WAREHOUSE_GROUPS)
+    return canonical.fillna(names.astype(str).str.strip()).mask(empty, 'UNKNOWN')
+
+def extract_site_series(names):
+    """사이트명 Series 추출 (extract_site의 컬럼 단위 버전)"""
+    return _classify_series(names, _SITE_RE, _SITE_GROUPS).mask(names.isna()).fillna('UNK')
+
+def _first_valid(frame, fields, parsed=None):
+    """
+    fields 순서대로 행별 첫 번째 유효 값 선택 (빈 값/0/'nan'/'none' 제외, 없으면 NaN)
     
-    return pd.DataFrame(data)
+    parsed가 주어지면 같은 컬럼의 변환 결과(결측은 변환 실패)를 값으로 사용한다.
+    """
+    result = pd.Series(np.nan, index=frame.index, dtype=object)
+    pending = np.ones(len(frame), dtype=bool)
+    for field in fields:
+        values = frame[field]
+        text = values.astype(str).str.strip()
+        candidate = text if parsed is None else parsed[field]
+        valid = values.notna() & values.astype(bool) & ~text.str.lower().isin(['nan', 'none', '']) & candidate.notna()
+        take = pending & valid.to_numpy()
+        result[take] = candidate[take]
+        pending &= ~take
+    return result
 
-def extract_case_id(data):
-    """케이스 ID 추출"""
-    case_fields = ['case', 'Case', 'case_id', 'CaseID', 'ID', 'carton', 'box', 'mr#']
+def transactions_to_dataframe(transactions):
+    """트랜잭션 리스트를 DataFrame으로 변환 (필드 추출/분류를 컬럼 단위로 처리)"""
+    if not transactions:
+        return pd.DataFrame()
     
-    for field in case_fields:
-        if field in data and data[field]:
-            case_value = str(data[field]).strip()
-            if case_value and case_value.lower() not in ['nan', 'none', '']:
-                return case_value
+    # 필요한 필드만 object 컬럼으로 한 번에 적재 (원본 값 표현 유지)
+    tx_data = [tx.get('data', {}) for tx in transactions]
+    base = pd.DataFrame(tx_data, columns=CASE_FIELDS + WAREHOUSE_FIELDS + DATE_FIELDS + ['incoming', 'outgoing'],
+                        dtype=object)
     
-    return f"CASE_{abs(hash(str(data))) % 100000}"
-
-def extract_warehouse(data):
-    """창고명 추출 및 정규화"""
-    warehouse_fields = ['warehouse', 'Warehouse', 'site', 'Site', 'location', 'Location']
+    # 기본 정보 추출 (케이스 ID가 없는 행만 개별 백업 ID 생성)
+    case_id = _first_valid(base, CASE_FIELDS)
+    missing_case = case_id.isna().to_numpy()
+    case_id[missing_case] = [extract_case_id(tx_data[i]) for i in np.flatnonzero(missing_case)]
     
-    for field in warehouse_fields:
-        if field in data and data[field]:
-            raw_warehouse = str(data[field]).strip()
-            if raw_warehouse and raw_warehouse.lower() not in ['nan', 'none', '']:
-                return normalize_warehouse_name(raw_warehouse)
+    warehouse = normalize_warehouse_series(_first_valid(base, WAREHOUSE_FIELDS))
     
-    return 'UNKNOWN'
+    # 날짜 필드 전체를 한 번의 to_datetime으로 파싱 (반복되는 값은 cache로 한 번만 해석)
+    date_values = base[DATE_FIELDS].to_numpy().ravel()
+    parsed_dates = pd.DataFrame(
+        pd.to_datetime(pd.Series(date_values, dtype=object), errors='coerce', cache=True, **_MIXED_DATE_FORMAT)
+        .to_numpy().reshape(len(base), len(DATE_FIELDS)),
+        index=base.index, columns=DATE_FIELDS
+    )
+    date_val = _first_valid(base, DATE_FIELDS, parsed_dates)
+    date_val = pd.to_datetime(date_val).fillna(pd.Timestamp.now())
+    
+    # 수량 처리
+    incoming = pd.to_numeric(base['incoming'], errors='coerce').fillna(0)
+    outgoing = pd.to_numeric(base['outgoing'], errors='coerce').fillna(0)
+    
+    # 기본 레코드
+    records = pd.DataFrame({
+        'Case_No': case_id,
+        'Date': date_val,
+        'Location': warehouse,
+        'Source_File': [tx.get('source_file', '') for tx in transactions],
+        'Loc_From': 'SOURCE',
+        'Target_Warehouse': warehouse
+    })
+    
+    # IN 트랜잭션 생성
+    in_mask = incoming > 0
+    in_df = records[in_mask].assign(TxType_Refined='IN', Qty=incoming[in_mask].astype('int64'))
+    
+    # OUT 트랜잭션 생성 (사이트 구분하여 FINAL_OUT vs TRANSFER_OUT 결정, 출고는 해당 창고에서)
+    out_mask = outgoing > 0
+    site = extract_site_series(warehouse[out_mask])
+    out_df = records[out_mask].assign(
+        TxType_Refined=np.where(site.isin(FINAL_SITES), 'FINAL_OUT', 'TRANSFER_OUT'),
+        Qty=outgoing[out_mask].astype('int64'),
+        Loc_From=warehouse[out_mask],
+        Target_Warehouse='DESTINATION'
+    )
+    
+    # 원래 순서(트랜잭션별 IN → OUT) 유지
+    return pd.concat([in_df, out_df]).sort_index(kind='stable').reset_index(drop=True)
 
-def extract_datetime(data):
-    """날짜/시간 추출"""
-    date_fields = ['date', 'Date', 'timestamp', 'Timestamp', 'datetime']
+def _first_text(data, field_rank):
+    """
+    탐색 순서상 첫 번째 유효 문자열 필드 값 (없으면 None)
     
-    for field in date_fields:
-        if field in data and data[field]:
-            try:
-                date_value = data[field]
-                if isinstance(date_value, str) and date_value.lower() in ['nan', 'none', '']:
-                    continue
-                return pd.to_datetime(date_value)
-            except:
-                continue
+    후보 필드마다 `field in data`를 반복하지 않고 키 집합 교집합 한 번으로
+    data에 실제 존재하는 필드만 골라 순위대로 확인한다.
+    """
+    for field in sorted(field_rank.keys() & data.keys(), key=field_rank.__getitem__):
+        if data[field]:
+            value = str(data[field]).strip()
+            if value and value.lower() not in ['nan', 'none', '']:
+                return value
+    return None
+
+def extract_case_id(data):
+    """케이스 ID 추출"""
+    case_value = _first_text(data, _CASE_RANK)
+    if case_value is not None:
+        return case_value
     
-    return pd.Timestamp.now()
+    # 백업: 해시 기반 ID (내장 hash()는 프로세스마다 달라지므로 고정 다이제스트 사용)
+    return f"CASE_{int.from_bytes(hashlib.blake2b(str(data).encode(), digest_size=8).digest(), 'big') % 100000}"
+
+def extract_warehouse(data):
+    """창고명 추출 및 정규화"""
+    raw_warehouse = _first_text(data, _WAREHOUSE_RANK)
+    return 'UNKNOWN' if raw_warehouse is None else normalize_warehouse_name(raw_warehouse)
 
 def normalize_warehouse_name(raw_name):
     """창고명 정규화"""
     if pd.isna(raw_name) or not raw_name:
         return 'UNKNOWN'
     
-    name_lower = str(raw_name).lower().strip()
-    
-    warehouse_rules = {
-        'DSV Al Markaz': ['markaz', 'm1', 'al markaz', 'almarkaz'],
-        'DSV Indoor': ['indoor', 'm44', 'hauler indoor'],
-        'DSV Outdoor': ['outdoor', 'out'],
-        'MOSB': ['mosb'],
-        'DSV MZP': ['mzp'],
-        'DHL WH': ['dhl'],
-        'AAA Storage': ['aaa']
-    }
-    
-    for canonical, patterns in warehouse_rules.items():
-        if any(pattern in name_lower for pattern in patterns):
-            return canonical
-    
-    return str(raw_name).strip()
+    match = _WAREHOUSE_RE.search(str(raw_name))
+    return _WAREHOUSE_GROUPS[match.lastgroup] if match else str(raw_name).strip()
 
 def extract_site(warehouse_name):
     """사이트명 추출"""
     if pd.isna(warehouse_name):
         return 'UNK'
     
-    name_upper = str(warehouse_name).upper()
-    
-    site_patterns = {
-        'AGI': ['AGI'],
-        'DAS': ['DAS'],
-        'MIR': ['MIR'],
-        'SHU': ['SHU']
-    }
-    
-    for site, patterns in site_patterns.items():
-        if any(pattern in name_upper for pattern in patterns):
-            return site
-    
-    return 'UNK'
+    match = _SITE_RE.search(str(warehouse_name))
+    return _SITE_GROUPS[match.lastgroup] if match else 'UNK'
 
 def calculate_daily_inventory(transaction_df):
     """일별 재고 계산"""
@@ -222,59 +278,27 @@ def calculate_daily_inventory(transaction_df):
     # 날짜별로 정렬
     transaction_df = transaction_df.sort_values(['Location', 'Date'])
     
-    # 창고별로 그룹화하여 일별 재고 계산
-    daily_stock_data = []
+    # 트랜잭션 유형별 수량 분리 (IN/TRANSFER_OUT/FINAL_OUT 외 유형은 0)
+    tx_type = transaction_df['TxType_Refined']
+    qty = transaction_df['Qty'].to_numpy()
+    inbound = np.where(tx_type.eq('IN'), qty, 0)
+    transfer_out = np.where(tx_type.eq('TRANSFER_OUT'), qty, 0)
+    final_out = np.where(tx_type.eq('FINAL_OUT'), qty, 0)
+    delta = inbound - transfer_out - final_out
     
-    for location in transaction_df['Location'].unique():
-        location_df = transaction_df[transaction_df['Location'] == location].copy()
-        
-        # 초기 재고 (첫 번째 트랜잭션 이전)
-        current_stock = 0
-        
-        for _, row in location_df.iterrows():
-            date = row['Date']
-            tx_type = row['TxType_Refined']
-            qty = row['Qty']
-            
-            # 기초 재고
-            opening_stock = current_stock
-            
-            # 트랜잭션 처리
-            if tx_type == 'IN':
-                inbound = qty
-                transfer_out = 0
-                final_out = 0
-                current_stock += qty
-            elif tx_type == 'TRANSFER_OUT':
-                inbound = 0
-                transfer_out = qty
-                final_out = 0
-                current_stock -= qty
-            elif tx_type == 'FINAL_OUT':
-                inbound = 0
-                transfer_out = 0
-                final_out = qty
-                current_stock -= qty
-            else:
-                inbound = 0
-                transfer_out = 0
-                final_out = 0
-            
-            total_outbound = transfer_out + final_out
-            closing_stock = current_stock
-            
-            daily_stock_data.append({
-                'Location': location,
-                'Date': date,
-                'Opening_Stock': opening_stock,
-                'Inbound': inbound,
-                'Transfer_Out': transfer_out,
-                'Final_Out': final_out,
-                'Total_Outbound': total_outbound,
-                'Closing_Stock': closing_stock
-            })
+    # 창고별 누적 재고 (기말 = 창고 내 누적 증감, 기초 = 기말 - 당일 증감)
+    closing_stock = pd.Series(delta).groupby(transaction_df['Location'].to_numpy()).cumsum().to_numpy()
     
-    return pd.DataFrame(daily_stock_data)
+    return pd.DataFrame({
+        'Location': transaction_df['Location'].to_numpy(),
+        'Date': transaction_df['Date'].to_numpy(),
+        'Opening_Stock': closing_stock - delta,
+        'Inbound': inbound,
+        'Transfer_Out': transfer_out,
+        'Final_Out': final_out,
+        'Total_Outbound': transfer_out + final_out,
+        'Closing_Stock': closing_stock
+    })
 
 if __name__ == "__main__":
     success = main()
@@ -11,10 +11,17 @@ import numpy as np
 from datetime import datetime
 import sys
 import os
+from importlib.util import find_spec
 
 # 현재 디렉토리를 Python path에 추가
 sys.path.append(os.getcwd())
 
+# 상세 진단 출력 (개별 항목/결과 표) 은 HVDC_VERBOSE=1 일 때만 출력
+VERBOSE = os.environ.get('HVDC_VERBOSE', '0') == '1'
+
+# 행마다 고유한 ID 문자열은 Arrow 문자열로 보관 (pyarrow 미설치 시 pandas 기본 string)
+ID_DTYPE = 'string[pyarrow]' if find_spec('pyarrow') is not None else 'string'
+
 try:
     from hvdc_complete_8sheet_reporter import (
         normalize_warehouse_name,
@@ -32,7 +39,8 @@ except ImportError as e:
 
 def create_test_data():
     """테스트용 데이터 생성"""
-    print("🔄 테스트 데이터 생성 중...")
+    if VERBOSE:
+        print("🔄 테스트 데이터 생성 중...")
     
     # 창고와 현장이 혼재된 데이터 생성
     locations = [
@@ -40,21 +48,23 @@ def create_test_data():
         'AGI Project', 'MIR Site', 'SHU Construction', 'Field Station'  # 현장
     ]
     
-    # 100개 레코드 생성
-    np.random.seed(42)  # 재현 가능한 결과를 위해
+    # 100개 레코드 생성 (Generator API: 재현 가능하고 dtype을 지정한 정수 배열을 바로 생성)
+    rng = np.random.default_rng(42)
     
+    # 문자열 컬럼은 정수 코드로 생성해 Categorical로 감싸기 (object 컬럼 대신 category 그룹화 경로 사용)
     data = {
         'hasDate': pd.date_range('2024-01-01', periods=100, freq='D'),
-        'hasSite': np.random.choice(locations, 100),
-        'hasVolume_numeric': np.random.randint(10, 500, 100),
-        'hasAmount_numeric': np.random.randint(1000, 50000, 100),
-        'hasCurrentStatus': np.random.choice(['IN', 'OUT', 'TRANSFER'], 100),
-        'TxType_Refined': np.random.choice(['INBOUND', 'OUTBOUND', 'TRANSFER'], 100),
-        'hasShipmentNo': [f'SH{i:04d}' for i in range(100)]
+        'hasSite': pd.Categorical.from_codes(rng.integers(0, len(locations), 100, dtype=np.int8), locations),
+        'hasVolume_numeric': rng.integers(10, 500, 100, dtype=np.int32),
+        'hasAmount_numeric': rng.integers(1000, 50000, 100, dtype=np.int32),
+        'hasCurrentStatus': pd.Categorical.from_codes(rng.integers(0, 3, 100, dtype=np.int8), ['IN', 'OUT', 'TRANSFER']),
+        'TxType_Refined': pd.Categorical.from_codes(rng.integers(0, 3, 100, dtype=np.int8), ['INBOUND', 'OUTBOUND', 'TRANSFER']),
+        'hasShipmentNo': pd.array([f'SH{i:04d}' for i in range(100)], dtype=ID_DTYPE)
     }
     
     df = pd.DataFrame(data)
-    print(f"✅ 테스트 데이터 생성 완료: {df.shape[0]}개 레코드")
+    if VERBOSE:
+        print(f"✅ 테스트 데이터 생성 완료: {df.shape[0]}개 레코드")
     
     return df
 
@@ -72,7 +82,8 @@ def test_normalization_functions():
     for location in test_cases:
         normalized = normalize_warehouse_name(location)
         location_type = classify_location_type(location)
-        print(f"  {location:20} → {normalized:15} ({location_type})")
+        if VERBOSE:
+            print(f"  {location:20} → {normalized:15} ({location_type})")
     
     print("✅ 정규화 함수 테스트 완료")
 
@@ -87,26 +98,21 @@ def test_warehouse_flow_analysis():
     # 월 범위 생성
     all_months = pd.period_range('2024-01', '2024-04', freq='M')
     
-    try:
-        # 창고 흐름 분석 실행
-        warehouse_flow = create_warehouse_flow_report_v3(df, all_months)
-        print(f"✅ 창고 흐름 분석 완료: {warehouse_flow.shape}")
+    # 창고 흐름 분석 실행 (예외는 main()에서 한 번에 처리)
+    warehouse_flow = create_warehouse_flow_report_v3(df, all_months)
+    print(f"✅ 창고 흐름 분석 완료: {warehouse_flow.shape}")
+    if VERBOSE:
         print("\n📋 창고 흐름 분석 결과 (상위 5개):")
         print(warehouse_flow.head())
-        
-        # 현장 배송 분석 실행
-        site_delivery = create_site_delivery_report_v3(df, all_months)
-        print(f"\n✅ 현장 배송 분석 완료: {site_delivery.shape}")
+    
+    # 현장 배송 분석 실행
+    site_delivery = create_site_delivery_report_v3(df, all_months)
+    print(f"\n✅ 현장 배송 분석 완료: {site_delivery.shape}")
+    if VERBOSE:
         print("\n📋 현장 배송 분석 결과 (상위 5개):")
         print(site_delivery.head())
-        
-        return warehouse_flow, site_delivery
-        
-    except Exception as e:
-        print(f"❌ 창고 흐름 분석 실패: {e}")
-        import traceback
-        traceback.print_exc()
-        return None, None
+    
+    return warehouse_flow, site_delivery
 
 def test_8sheet_report_generation():
     """8개 시트 리포트 생성 테스트"""
@@ -119,26 +125,20 @@ def test_8sheet_report_generation():
     # 월 범위 생성
     all_months = pd.period_range('2024-01', '2024-04', freq='M')
     
-    try:
-        # 8개 시트 리포트 생성
-        reports = create_warehouse_flow_8sheet_report_v3(df, all_months, mode='flow')
-        
-        print(f"✅ 8개 시트 리포트 생성 완료: {len(reports)}개 시트")
-        
+    # 8개 시트 리포트 생성 (예외는 main()에서 한 번에 처리)
+    reports = create_warehouse_flow_8sheet_report_v3(df, all_months, mode='flow')
+    
+    print(f"✅ 8개 시트 리포트 생성 완료: {len(reports)}개 시트")
+    
+    if VERBOSE:
         for sheet_name, sheet_df in reports.items():
             print(f"  • {sheet_name}: {sheet_df.shape}")
-        
-        # Excel 파일로 저장
-        output_path = save_warehouse_flow_8sheet_excel_v3(reports, "test_warehouse_flow_v3.xlsx")
-        print(f"\n✅ Excel 파일 저장 완료: {output_path}")
-        
-        return reports
-        
-    except Exception as e:
-        print(f"❌ 8개 시트 리포트 생성 실패: {e}")
-        import traceback
-        traceback.print_exc()
-        return None
+    
+    # Excel 파일로 저장
+    output_path = save_warehouse_flow_8sheet_excel_v3(reports, "test_warehouse_flow_v3.xlsx")
+    print(f"\n✅ Excel 파일 저장 완료: {output_path}")
+    
+    return reports
 
 def main():
     """메인 테스트 실행"""
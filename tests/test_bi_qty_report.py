@@ -12,6 +12,7 @@ import pytest
 import sys
 import os
 from datetime import datetime, timedelta
+from importlib.util import find_spec
 
 # 상위 디렉토리의 모듈 import를 위한 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -30,7 +31,11 @@ except ImportError as e:
     print(f"⚠️ Import 오류: {e}")
     print("hvdc_complete_8sheet_reporter.py 파일이 상위 디렉토리에 있는지 확인하세요.")
 
-@pytest.fixture
+# 행마다 고유한 ID 문자열은 Arrow 문자열로 보관 (pyarrow 미설치 시 pandas 기본 string)
+ID_DTYPE = 'string[pyarrow]' if find_spec('pyarrow') is not None else 'string'
+
+# 세션 전체에서 한 번만 생성해 공유 (리포트 함수에는 .copy()로 전달하므로 공유 프레임은 변경되지 않음)
+@pytest.fixture(scope="session")
 def dummy_df():
     """테스트용 더미 DataFrame 생성"""
     # 60일간 샘플 데이터 (Date, Qty, TxType_Refined 등 필수 컬럼)
@@ -49,15 +54,22 @@ def dummy_df():
         'hasSite': ['DSV_Indoor', 'DSV_Outdoor', 'DAS', 'DSV_Al_Markaz', 'DSV_Indoor', 'DSV_Outdoor'] * 10,
         'Target_Warehouse': ['SITE1', 'SITE2', 'SITE1', 'SITE3', 'SITE2', 'SITE1'] * 10,
         'Source_File': ['HITACHI_file.xlsx', 'SIMENSE_file.xlsx'] * 30,
-        'Case_No': [f"CASE_{i:04d}" for i in range(60)],
-        'Shipment No': [f"SHIP_{i:04d}" for i in range(60)]
+        'Case_No': pd.array([f"CASE_{i:04d}" for i in range(60)], dtype=ID_DTYPE),
+        'Shipment No': pd.array([f"SHIP_{i:04d}" for i in range(60)], dtype=ID_DTYPE)
     }
-    return pd.DataFrame(data)
+    # 반복되는 문자열 컬럼은 category로 보관 (행마다 고유한 Case_No/Shipment No는 ID_DTYPE)
+    category_cols = ['TxType_Refined', 'hasCurrentStatus', 'Location', 'hasSite', 'Target_Warehouse', 'Source_File']
+    return pd.DataFrame(data).astype({col: 'category' for col in category_cols})
+
+@pytest.fixture(scope="session")
+def prepared_fixture(dummy_df):
+    """월별 집계 준비 결과 (df_processed, all_months) - 세션당 한 번만 계산"""
+    return prepare_monthly_aggregation(dummy_df.copy())
 
-@pytest.fixture
-def all_months_fixture(dummy_df):
+@pytest.fixture(scope="session")
+def all_months_fixture(prepared_fixture):
     """테스트용 전체 월 범위 생성"""
-    _, all_months = prepare_monthly_aggregation(dummy_df.copy())
+    _, all_months = prepared_fixture
     return all_months
 
 def test_monthly_dashboard_qty(dummy_df, all_months_fixture):
@@ -270,13 +282,13 @@ def test_site_report_qty_v2(dummy_df, all_months_fixture):
 # 통합 테스트
 # ===============================================================================
 
-def test_full_pipeline_integration(dummy_df):
+def test_full_pipeline_integration(prepared_fixture):
     """전체 파이프라인 통합 테스트"""
     print("\n🧪 통합 테스트: 전체 파이프라인")
     
     try:
-        # 1. 월별 집계 준비
-        df_processed, all_months = prepare_monthly_aggregation(dummy_df.copy())
+        # 1. 월별 집계 준비 (세션 fixture 결과 재사용)
+        df_processed, all_months = prepared_fixture
         
         assert not df_processed.empty, "전처리된 DataFrame이 비어있음"
         assert len(all_months) > 0, "전체 월 범위가 비어있음"
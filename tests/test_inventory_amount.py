@@ -66,4 +66,27 @@ def test_calculate_monthly_amount():
     actual_inventory = int(jan_data["End_Inventory"].iloc[0])
     
     assert actual_inventory == expected_inventory, \
-        f"Expected {expected_inventory}, got {actual_inventory}" 
\ No newline at end of file
+        f"Expected {expected_inventory}, got {actual_inventory}" 
+
+@pytest.mark.parametrize("with_inventory", [True, False])
+def test_quick_inventory_fast_path_matches_engine(monkeypatch, with_inventory):
+    """numba 고속 경로와 InventoryEngine 경로의 월별 재고 요약이 같아야 함 (거래 없는 월 포함)."""
+    utils = pytest.importorskip("quick_integration.hvdc_quick.utils")
+    if utils.njit is None:
+        pytest.skip("numba 미설치")
+
+    df = _build_sample_df()
+    # 2월은 거래 없는 월, 월 내 행 순서가 섞인 경우도 포함
+    df["Billing month"] = ["2024-01-01", "2024-03-15", "2024-01-20", "2024-04-02", "2024-03-01"]
+    if not with_inventory:
+        df = df.drop(columns="Inventory")
+
+    fast = utils.quick_inventory(df)
+    monkeypatch.setattr(utils, "njit", None)
+    engine = utils.quick_inventory(df)
+
+    pd.testing.assert_frame_equal(
+        pd.DataFrame(fast["monthly_data"]), pd.DataFrame(engine["monthly_data"]), check_dtype=False
+    )
+    for key in ("total_incoming", "total_outgoing", "end_inventory", "total_amount"):
+        assert fast[key] == pytest.approx(engine[key]), key
@@ -0,0 +1,94 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from reporter.invoice_reporter import (
+    INDOOR_WAREHOUSE,
+    OUTDOOR_WAREHOUSE,
+    SITE,
+    build_base_cube,
+    create_ontology_warehouse_flow_v4,
+    create_site_report,
+    prepare_monthly_aggregation,
+)
+
+
+def _build_boundary_df(seed, n=4000):
+    """반올림 경계값(x.xx5)에 걸리는 수량/금액을 가진 창고·현장 샘플 DataFrame 생성."""
+    rng = np.random.default_rng(seed)
+    locations = list(INDOOR_WAREHOUSE[:2]) + list(OUTDOOR_WAREHOUSE[:1]) + list(SITE[:1])
+    months = pd.period_range("2024-01", "2024-06", freq="M")
+    # 0.001 단위 값 + 부동소수 누적 오차가 잘 드러나는 0.1 계열/0.005 값
+    base = rng.integers(0, 100000, n) / 1000.0 + rng.choice([0.1, 0.2, 0.3, 0.005], n)
+    return pd.DataFrame({
+        "hasSite": rng.choice(locations, n),
+        # 4월은 거래 없는 월로 남겨 두어 재고 0 처리도 함께 확인
+        "Month": rng.choice(months.delete(3), n),
+        "hasVolume_numeric": base,
+        "hasAmount_numeric": base[::-1] * 3,
+    }), months
+
+
+def _reference_flow(df, months):
+    """기존 다중 키 groupby 합계 + 관측 월 누적 재고 (비교 기준)"""
+    warehouses = set(INDOOR_WAREHOUSE) | set(OUTDOOR_WAREHOUSE)
+    wh = df[df["hasSite"].isin(warehouses)]
+    flow = wh.groupby(["hasSite", "Month"]).agg(
+        {"hasVolume_numeric": "sum", "hasAmount_numeric": "sum"}
+    ).round(2)
+    flow["재고"] = flow.groupby(level=0)["hasVolume_numeric"].cumsum().round(2)
+    index = pd.MultiIndex.from_product(
+        [sorted(wh["hasSite"].unique()), months], names=["hasSite", "Month"]
+    )
+    return flow.reindex(index, fill_value=0)
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_warehouse_flow_matches_groupby_on_rounding_boundaries(seed):
+    """창고별 월 합계/재고가 groupby 합계 결과와 반올림 경계값까지 일치해야 함."""
+    df, months = _build_boundary_df(seed)
+    result = create_ontology_warehouse_flow_v4(df, months)
+    expected = _reference_flow(df, months)
+
+    assert list(zip(result["창고명"], result["월"])) == list(expected.index)
+    np.testing.assert_array_equal(result["입고"].to_numpy(), expected["hasVolume_numeric"].to_numpy())
+    np.testing.assert_array_equal(result["금액"].to_numpy(), expected["hasAmount_numeric"].to_numpy())
+    np.testing.assert_array_equal(result["재고"].to_numpy(), expected["재고"].to_numpy())
+
+
+def _baseline_site_report(df, all_months):
+    """기존 pivot_table → 전체월 reindex 방식의 현장별 월별 테이블 (비교 기준)"""
+    raw = df.assign(hasSite=df["hasSite"].astype(object), month=df["month"].astype(object))
+    pivot = raw.pivot_table(index="hasSite", columns="month", values="hasVolume_numeric",
+                            aggfunc=["sum", "count"], fill_value=0)
+    return pivot.reindex(columns=all_months, level=1, fill_value=0)
+
+
+def test_site_report_matches_baseline_workbook(tmp_path):
+    """현장별 월별 시트는 기존 pivot_table 결과 시트와 같고, 월 컬럼 레벨명(month)이 기록되어야 함."""
+    rng = np.random.default_rng(0)
+    n = 200
+    df, all_months = prepare_monthly_aggregation(pd.DataFrame({
+        "hasSite": rng.choice(list(SITE[:3]), n),
+        "hasDate": pd.to_datetime("2024-01-01") + pd.to_timedelta(rng.integers(0, 180, n), unit="D"),
+        "hasAmount": rng.integers(0, 1000, n),
+        "hasVolume": rng.integers(0, 50, n),
+    }))
+    cube = build_base_cube(df)
+
+    result = create_site_report(df, all_months, cube=cube)
+    expected = _baseline_site_report(df, all_months)
+
+    sheets = {}
+    for name, frame in (("new", result), ("baseline", expected)):
+        path = tmp_path / f"{name}.xlsx"
+        frame.to_excel(path, sheet_name="04_현장별_월별현황")
+        sheets[name] = pd.read_excel(path, header=None)
+    assert sheets["new"].iloc[1, 0] == "month"
+    pd.testing.assert_frame_equal(sheets["new"], sheets["baseline"])
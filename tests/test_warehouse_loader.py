@@ -0,0 +1,70 @@
+import os
+import sys
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+# 상위 디렉토리를 Python 경로에 추가
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core import mapping
+
+HEADERS = [
+    "Operation Month", "Shipment No", "Category", "20DC", "20FR", "40DC", "40FR", "Cntr No.",
+    "Cntr Unstuffing Q'ty", "Cntr Stuffing Q'ty", "Start", "Finish", "Pkgs", "Weight (kg)", "CBM",
+    "Handling In freight ton", "Handling out Freight Ton", "SQM", "Amount", "Handling In",
+    "Handling out", "Unstuffing", "Stuffing", "Folk Lift", "Crane", "Total", "Billing Month", "Remark",
+]
+
+
+def _write_warehouse_xlsx(path, n=20):
+    """필수 컬럼 + 문자열/숫자가 섞인 Remark 컬럼을 가진 Warehouse 샘플 파일 생성."""
+    rows = []
+    for i in range(n):
+        row = {h: i % 5 for h in HEADERS}
+        row.update({
+            "Operation Month": datetime(2024, 1 + i % 12, 1),
+            "Start": datetime(2024, 1 + i % 12, 1 + i % 28),
+            "Finish": datetime(2024, 1 + i % 12, 1 + i % 28),
+            "Billing Month": datetime(2024, 1 + i % 12, 1),
+            "Shipment No": f"HVDC-ADOPT-{i:04d}",
+            "Category": "Indoor(M44)" if i % 2 else "Outdoor",
+            "Amount": i * 1.25,
+            "Remark": "ok" if i % 3 else i,
+        })
+        rows.append(row)
+    pd.DataFrame(rows, columns=HEADERS).to_excel(path, index=False)
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "cache"
+    monkeypatch.setattr(mapping, "_CACHE_DIR", directory)
+    return directory
+
+
+@pytest.mark.skipif(not mapping._HAS_PYARROW, reason="pyarrow 미설치")
+def test_cache_round_trip_with_mixed_type_column(tmp_path, cache_dir):
+    """혼합 타입 컬럼은 텍스트로 통일되어 parquet 캐시가 저장되고, 캐시 로드 결과가 최초 파싱 결과와 같아야 함."""
+    path = tmp_path / "warehouse.xlsx"
+    _write_warehouse_xlsx(path)
+
+    first = mapping.load_hvdc_warehouse_file(path)
+    assert first["remark"].tolist()[:4] == ["0", "ok", "ok", "3"]
+    assert [fp.suffix for fp in cache_dir.iterdir()] == [".parquet"]
+
+    cached = mapping.load_hvdc_warehouse_file(path)
+    pd.testing.assert_frame_equal(cached, first)
+
+
+def test_load_dir_serial_skips_invalid_files(tmp_path, cache_dir, capsys):
+    """기본(순차) 디렉터리 로드는 필수 컬럼이 없는 파일을 [WARN] 후 건너뛰어야 함."""
+    _write_warehouse_xlsx(tmp_path / "a.xlsx", n=5)
+    _write_warehouse_xlsx(tmp_path / "b.xlsx", n=7)
+    pd.DataFrame({"foo": [1]}).to_excel(tmp_path / "broken.xlsx", index=False)
+
+    df = mapping.load_hvdc_warehouse_dir(tmp_path)
+
+    assert len(df) == 12
+    assert "[WARN] broken.xlsx" in capsys.readouterr().out